@@ -0,0 +1,230 @@
+"""
+Synora - Bunny.net Storage'a eşzamanlı yükleyici (CDN yayınlama)
+
+Üretilen görseller elle sürükle-bırak yerine doğrudan storage zone'a yüklenir:
+- Uzak klasör tek istekte listelenir; Bunny'nin kayıtlı SHA-256 checksum'ı
+  yerel dosyayla aynıysa dosya tekrar yüklenmez
+- Yüklemeler paylaşılan bağlantı havuzu üzerinden thread havuzunda paralel
+  yapılır, hız "bunny" sınırlayıcısına uyar (istek fonksiyonu dışarıdan verilir)
+- Geçici hatalarda (bağlantı, 5xx, 429) jitter'lı üstel beklemeyle tekrar
+  denenir; yüklenen dosyanın checksum'ı başlıkta gönderilir, Bunny bozuk
+  gelen dosyayı reddeder
+- Her dosyanın CDN adresi döner, manifest girişlerine yazılır
+
+Adlar içerik sürümlüdür ("chair.3f9a1c2b7d4e.jpg"): dosya değişince adı da
+değişir, bu yüzden CDN ve cihazlar dosyaları süresiz önbellekleyebilir.
+Kimsenin göstermediği eski sürümler bekleme süresinden sonra silinir.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import quote
+
+# ============== AYARLAR ==============
+
+PUBLISH_WORKERS = 16            # Aynı anda yüklenen dosya
+PUBLISH_MAX_RETRIES = 4         # Dosya başına deneme
+PUBLISH_RETRY_BASE_DELAY = 1.0  # İlk bekleme (sn), her denemede iki katına kadar
+PUBLISH_RETRY_MAX_DELAY = 30.0  # En uzun bekleme (sn)
+RETRYABLE_STATUSES = (408, 429, 500, 502, 503, 504)
+HASH_CHUNK_SIZE = 64 * 1024
+VERSION_LENGTH = 12             # Dosya adındaki sürüm etiketi (SHA-256 önekinin hex karakteri)
+
+# Sürümlü ad: <ad>.<sürüm>.<uzantı> veya <ad>.<sürüm>.<boyut>.<format>
+VERSIONED_NAME = re.compile(r"^[^.]+\.[0-9a-f]{%d}(\.[a-z0-9]+){1,2}$" % VERSION_LENGTH)
+
+
+def _file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_version(hashes: list) -> str:
+    """Bir görselin tüm dosyalarının özetlerinden sürüm etiketi (herhangi bir bayt değişirse değişir)"""
+    return hashlib.sha256("|".join(hashes).encode("ascii")).hexdigest()[:VERSION_LENGTH]
+
+
+def versioned_name(slug: str, version: str, variant: str = None) -> str:
+    """Sürümlü ad: "chair.jpg" -> "chair.<sürüm>.jpg", boyut için "chair.<sürüm>.card.webp" """
+    stem, dot, suffix = slug.rpartition(".")
+    if not dot:
+        stem, suffix = slug, ""
+    if variant:
+        return f"{stem}.{version}.{variant}"
+    return f"{stem}.{version}.{suffix}" if suffix else f"{stem}.{version}"
+
+
+def write_url_export(path, base_url: str, entries: dict) -> int:
+    """Uygulamanın paketlediği JSON: {"base": CDN adresi, "images": {kelime id: sürümlü ad}}
+
+    Boyutların adı görselin adından türer: "chair.<sürüm>.jpg" ->
+    "chair.<sürüm>.card.webp".
+    """
+    prefix = base_url.rstrip("/") + "/"
+    images = {word_id: entry["url"][len(prefix):] for word_id, entry in sorted(entries.items())
+              if entry.get("url", "").startswith(prefix)}
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"base": base_url, "images": images}, f, ensure_ascii=False,
+                  separators=(",", ":"))
+        f.write("\n")
+    os.replace(tmp_path, path)
+    return len(images)
+
+
+class BunnyStorage:
+    """Storage API'de tek klasör: listeleme ve dosya yükleme.
+
+    `request(method, url, **kwargs)` yanıt döndüren bloklayan fonksiyondur
+    (generate-images.py'de havuzlu istemci + "bunny" hız sınırlayıcısı).
+    `endpoint` testte yerel bir sunucu olabilir.
+    """
+
+    def __init__(self, request, endpoint: str, zone: str, folder: str, access_key: str):
+        self.request = request
+        self.base_url = f"{endpoint.rstrip('/')}/{zone}/{folder.strip('/')}"
+        self.access_key = access_key
+
+    def url_for(self, name: str) -> str:
+        return f"{self.base_url}/{quote(name)}"
+
+    def list(self) -> dict:
+        """Klasördeki dosyalar: {ad: sha256 (küçük harf) veya None}"""
+        response = self.request("GET", self.base_url + "/",
+                                headers={"AccessKey": self.access_key, "Accept": "application/json"})
+        if response.status_code == 404:     # Klasör henüz yok
+            return {}
+        response.raise_for_status()
+        return {item["ObjectName"]: (item.get("Checksum") or "").lower() or None
+                for item in response.json() if not item.get("IsDirectory")}
+
+    def delete(self, name: str):
+        return self.request("DELETE", self.url_for(name), headers={"AccessKey": self.access_key})
+
+    def upload(self, path, name: str, sha256: str):
+        """Dosyayı akış halinde yükle; yanıtı döndürür"""
+        with open(path, 'rb') as f:
+            return self.request("PUT", self.url_for(name), data=f, headers={
+                "AccessKey": self.access_key,
+                "Checksum": sha256.upper(),
+                "Content-Type": "application/octet-stream",
+            })
+
+
+class BunnyPublisher:
+    """Dosya listesini storage'a yükler, zaten aynı olanları atlar."""
+
+    def __init__(self, storage: BunnyStorage, cdn_url: str, workers: int = PUBLISH_WORKERS,
+                 max_retries: int = PUBLISH_MAX_RETRIES):
+        self.storage = storage
+        self.cdn_url = cdn_url.rstrip("/")
+        self.workers = workers
+        self.max_retries = max_retries
+        self.remote = None      # Uzak klasör listesi (ilk publish'te alınır)
+        self.uploaded = 0
+        self.skipped = 0        # Uzak checksum aynıydı
+        self.failed = 0
+        self.retries = 0
+        self.pruned = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def cdn_url_for(self, name: str) -> str:
+        return f"{self.cdn_url}/{quote(name)}"
+
+    def publish(self, files: list, check_remote: bool = True) -> dict:
+        """`files`: [{"name", "path", "sha256" (yoksa hesaplanır)}]
+
+        Dönen sözlük: {ad: CDN adresi, yüklenemediyse None}. `check_remote`
+        kapalıysa klasör listelenmez, dosyalar doğrudan yüklenir.
+        """
+        if self.remote is None:
+            self.remote = self.storage.list() if check_remote else {}
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._publish_one, item): item["name"] for item in files}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                    results[name] = self.cdn_url_for(name)
+                except Exception as e:
+                    print(f"  Yukleme hatasi ({name}): {e}")
+                    with self._lock:
+                        self.failed += 1
+                    results[name] = None
+        return results
+
+    def orphans(self, referenced: set) -> list:
+        """Uzakta olup hiçbir girişin kullanmadığı sürümlü dosyalar (eski sabit adlara dokunulmaz)"""
+        if self.remote is None:
+            self.remote = self.storage.list()
+        return sorted(name for name in self.remote
+                      if name not in referenced and VERSIONED_NAME.match(name))
+
+    def prune(self, names: list) -> list:
+        """Dosyaları sil; silinenlerin adlarını döndür"""
+        deleted = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._retry, self.storage.delete, name, ok=(404,)): name
+                       for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"  Silme hatasi ({name}): {e}")
+                    continue
+                with self._lock:
+                    self.pruned += 1
+                    self.remote.pop(name, None)
+                deleted.append(name)
+        return deleted
+
+    def _retry(self, call, *args, ok=()):
+        """`call(*args)` yanıtı 2xx (veya `ok` içinde) olana kadar geçici hatalarda tekrar dene"""
+        for attempt in range(self.max_retries):
+            try:
+                response = call(*args)
+                if response.status_code < 300 or response.status_code in ok:
+                    return response
+                error = f"HTTP {response.status_code}"
+                if response.status_code not in RETRYABLE_STATUSES:
+                    raise RuntimeError(error)
+            except OSError as e:    # Bağlantı hataları (requests.RequestException dahil)
+                error = str(e)
+            if attempt < self.max_retries - 1:
+                with self._lock:
+                    self.retries += 1
+                delay = min(PUBLISH_RETRY_MAX_DELAY, PUBLISH_RETRY_BASE_DELAY * 2 ** attempt)
+                time.sleep(random.uniform(delay / 2, delay))
+        raise RuntimeError(f"{self.max_retries} denemede olmadi: {error}")
+
+    def _publish_one(self, item: dict):
+        sha256 = item.get("sha256") or _file_sha256(item["path"])
+        if self.remote.get(item["name"]) == sha256:
+            with self._lock:
+                self.skipped += 1
+            return
+
+        self._retry(self.storage.upload, item["path"], item["name"], sha256)
+        with self._lock:
+            self.uploaded += 1
+            self.bytes += os.stat(item["path"]).st_size
+            self.remote[item["name"]] = sha256
+
+    def status(self) -> str:
+        return (f"Bunny: {self.uploaded} yuklendi ({self.bytes / 1024 / 1024:.1f}MB), "
+                f"{self.skipped} ayni oldugu icin atlandi, {self.failed} hata, "
+                f"{self.retries} tekrar deneme, {self.pruned} eski surum silindi")
@@ -0,0 +1,104 @@
+"""
+Synora - CDN bütünlük denetimi (eşzamanlı HEAD istekleri)
+
+Yayınlanan her görselin CDN'de gerçekten açıldığı ve yerel dosyayla aynı
+olduğu kontrol edilir:
+- Her adrese HEAD isteği atılır; binlerce istek event loop'tan sınırlı bir
+  thread havuzuna dağıtılır (bağlantılar paylaşılan havuzdan, hız sınırlayıcı
+  dışarıdan verilen `head` fonksiyonunda)
+- Content-Length manifestteki boyutla karşılaştırılır
+- ETag ilk başarılı denetimde manifeste yazılır (içerik sürümlü adların
+  içeriği hiç değişmemeli); sonraki denetimlerde farklıysa dosya bayat sayılır
+- Sonuç: eksik (404), bayat (boyut/ETag farkı), hata ve sahipsiz dosyalar
+"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# ============== AYARLAR ==============
+
+AUDIT_MAX_PARALLEL = 64     # Aynı anda bekleyen HEAD isteği
+AUDIT_PROGRESS_EVERY = 1000  # Kaç adreste bir ilerleme yazılsın
+
+
+def classify(item: dict, status_code: int, size, etag: str) -> tuple:
+    """HEAD sonucunu (durum, sebep) olarak sınıfla: "ok", "missing", "stale" veya "error" """
+    if status_code == 404:
+        return "missing", "404"
+    if status_code >= 400:
+        return "error", f"HTTP {status_code}"
+    if size is not None and item.get("size") is not None and int(size) != item["size"]:
+        return "stale", f"boyut {size} != {item['size']}"
+    if etag and item.get("etag") and etag != item["etag"]:
+        return "stale", f"etag {etag} != {item['etag']}"
+    return "ok", None
+
+
+class CdnAuditor:
+    """Adres listesini eşzamanlı HEAD ile denetler.
+
+    `head(url)` bloklayan fonksiyondur ve (status_code, content_length, etag)
+    döndürür; `items`: [{"id", "name", "url", "size", "etag" (önceki, yoksa None)}].
+    """
+
+    def __init__(self, head, max_parallel: int = AUDIT_MAX_PARALLEL):
+        self.head = head
+        self.max_parallel = max_parallel
+        self.checked = 0
+        self.total = 0
+        self.elapsed = 0.0
+
+    def run(self, items: list) -> list:
+        """Her öğeye "state", "reason", "remote_size", "remote_etag" ekleyip döndür"""
+        start = time.monotonic()
+        self.total = len(items)
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+            results = asyncio.run(self._run(items, executor))
+        self.elapsed = time.monotonic() - start
+        return results
+
+    async def _run(self, items: list, executor: ThreadPoolExecutor) -> list:
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(self._check(loop, executor, item) for item in items))
+
+    async def _check(self, loop, executor, item: dict) -> dict:
+        result = dict(item, remote_size=None, remote_etag=None)
+        try:
+            status_code, size, etag = await loop.run_in_executor(executor, self.head, item["url"])
+            result["remote_size"] = int(size) if size is not None else None
+            result["remote_etag"] = etag
+            result["state"], result["reason"] = classify(item, status_code, size, etag)
+        except Exception as e:
+            result["state"], result["reason"] = "error", str(e) or type(e).__name__
+        self.checked += 1
+        if self.checked % AUDIT_PROGRESS_EVERY == 0:
+            print(f"    [{self.checked}/{self.total}] denetlendi")
+        return result
+
+
+def write_audit_report(path, results: list, unpublished: list, orphaned: list) -> dict:
+    """Fark raporunu JSON olarak yaz; durum başına sayıları döndür"""
+    report = {
+        "checked_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "counts": {},
+        "missing": [], "stale": [], "error": [],
+        "unpublished": sorted(unpublished),
+        "orphaned": orphaned,
+    }
+    for result in results:
+        report["counts"][result["state"]] = report["counts"].get(result["state"], 0) + 1
+        if result["state"] != "ok":
+            report[result["state"]].append({field: result.get(field) for field in (
+                "id", "name", "url", "reason", "size", "remote_size", "etag", "remote_etag")})
+    report["counts"]["unpublished"] = len(unpublished)
+    report["counts"]["orphaned"] = len(orphaned) if orphaned is not None else None
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return report["counts"]
@@ -0,0 +1,107 @@
+"""
+Synora - fal.ai için uyarlanabilir eşzamanlılık (AIMD)
+
+fal.ai kuyruğu boşken çok iş göndermek, işler IN_QUEUE'da uzun süre
+beklerken ise azaltmak istiyoruz:
+- Gecikme hedefin altında ve hata oranı düşükse pencere +1 büyür (additive increase)
+- IN_QUEUE süresi hedefi aşarsa veya hata oranı yükselirse pencere yarıya iner
+  (multiplicative decrease)
+- Her karar loglanır
+"""
+
+import asyncio
+import time
+from collections import deque
+
+# ============== AYARLAR ==============
+
+AIMD_INCREASE = 1             # Her başarılı turda pencereye eklenen iş sayısı
+AIMD_DECREASE = 0.5           # Tıkanıklıkta pencere çarpanı
+AIMD_TARGET_QUEUE_TIME = 15   # IN_QUEUE'da bundan uzun bekleyen iş tıkanıklık sayılır (sn)
+AIMD_ERROR_THRESHOLD = 0.2    # Son işlerdeki hata oranı bunu aşarsa tıkanıklık
+AIMD_ERROR_WINDOW = 20        # Hata oranı için bakılan son iş sayısı
+
+
+class AimdController:
+    """Gözlenen kuyruk süresi ve hata oranına göre pencere boyutunu belirler."""
+
+    def __init__(self, initial: int, min_window: int, max_window: int,
+                 target_queue_time: float = AIMD_TARGET_QUEUE_TIME,
+                 error_threshold: float = AIMD_ERROR_THRESHOLD):
+        self.min_window = max(1, min_window)
+        self.max_window = max(self.min_window, max_window)
+        self.window = min(self.max_window, max(self.min_window, initial))
+        self.target_queue_time = target_queue_time
+        self.error_threshold = error_threshold
+        self.outcomes = deque(maxlen=AIMD_ERROR_WINDOW)
+        self.acked = 0              # Son karardan beri başarılı iş sayısı
+        self.last_decrease = 0.0
+        self.decisions = []
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def observe(self, ok: bool, queue_time: float = 0.0, progress_time: float = 0.0) -> int:
+        """Biten bir işi kaydet, gerekirse pencereyi değiştir ve yeni pencereyi döndür"""
+        self.outcomes.append(ok)
+        now = time.monotonic()
+
+        reason = None
+        if queue_time > self.target_queue_time:
+            reason = f"IN_QUEUE {queue_time:.1f}sn > {self.target_queue_time}sn"
+        elif len(self.outcomes) >= self.outcomes.maxlen // 2 and self.error_rate() > self.error_threshold:
+            reason = f"hata orani %{self.error_rate() * 100:.0f}"
+
+        if reason:
+            # Aynı tıkanıklık için arka arkaya küçültme yapma: pencere içindeki
+            # işler küçültmeden önce gönderildi, en az bir tur bekle
+            if now - self.last_decrease >= max(self.target_queue_time, 1.0):
+                new_window = max(self.min_window, int(self.window * AIMD_DECREASE))
+                self._decide(new_window, reason, queue_time, progress_time)
+                self.last_decrease = now
+            self.acked = 0
+            return self.window
+
+        if ok:
+            self.acked += 1
+            # Penceredeki her iş bir kez başarıyla bittiyse bir tur tamamlandı
+            if self.acked >= self.window and self.window < self.max_window:
+                new_window = min(self.max_window, self.window + AIMD_INCREASE)
+                self._decide(new_window, "tur basarili", queue_time, progress_time)
+                self.acked = 0
+
+        return self.window
+
+    def _decide(self, new_window: int, reason: str, queue_time: float, progress_time: float):
+        old_window = self.window
+        self.window = new_window
+        self.decisions.append((time.time(), old_window, new_window, reason))
+        print(f"  [aimd] pencere {old_window} -> {new_window} ({reason}; "
+              f"kuyruk {queue_time:.1f}sn, isleme {progress_time:.1f}sn, "
+              f"hata %{self.error_rate() * 100:.0f})")
+
+
+class AdaptiveWindow:
+    """Limiti çalışırken değiştirilebilen asyncio semaforu."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    async def set_limit(self, limit: int):
+        async with self._condition:
+            self.limit = limit
+            self._condition.notify_all()
@@ -0,0 +1,111 @@
+"""
+Synora - Gemini açıklama önbelleği (SQLite)
+
+Anahtar: kelime + kategori + prompt hash'i. Prompt metni değişince hash de
+değişir, eski açıklamalar kullanılmaz. Kayıtlar TTL sonunda silinir; kayıt
+sayısı sınırı aşılırsa en uzun süredir kullanılmayanlar atılır.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+
+EVICT_EVERY = 500   # Kaç yazmada bir temizlik yapılsın
+
+
+def prompt_hash(*texts: str) -> str:
+    """Prompt metinlerinin kısa SHA-256 özeti"""
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+class DescriptionCache:
+    """Thread-safe, SQLite tabanlı açıklama önbelleği."""
+
+    def __init__(self, path, ttl: float, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.refresh = False    # True ise okuma yapılmaz, sadece yazılır (--refresh-descriptions)
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS descriptions (
+                word TEXT NOT NULL,
+                category TEXT NOT NULL,
+                prompt_hash TEXT NOT NULL,
+                description TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (word, category, prompt_hash)
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON descriptions (last_used)")
+        self._db.commit()
+        self.evict()
+
+    def get(self, word: str, category: str, key_hash: str) -> str:
+        """Geçerli kayıt varsa açıklamayı döndür"""
+        if self.refresh:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT description, created_at FROM descriptions "
+                "WHERE word = ? AND category = ? AND prompt_hash = ?",
+                (word.lower(), category, key_hash),
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            self._db.execute(
+                "UPDATE descriptions SET last_used = ? "
+                "WHERE word = ? AND category = ? AND prompt_hash = ?",
+                (now, word.lower(), category, key_hash),
+            )
+            self._db.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, word: str, category: str, key_hash: str, description: str):
+        """Açıklamayı kaydet (varsa üzerine yaz)"""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?, ?, ?, ?)",
+                (word.lower(), category, key_hash, description, now, now),
+            )
+            self._db.commit()
+            self._writes += 1
+            evict = self._writes % EVICT_EVERY == 0
+        if evict:
+            self.evict()
+
+    def evict(self):
+        """Süresi dolanları ve sınırı aşan en eski kullanılanları sil"""
+        with self._lock:
+            self._db.execute("DELETE FROM descriptions WHERE created_at < ?",
+                             (time.time() - self.ttl,))
+            count = self._db.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+            if count > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM descriptions WHERE rowid IN ("
+                    "SELECT rowid FROM descriptions ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._db.commit()
+
+    def status(self) -> str:
+        return f"aciklama onbellegi: {self.hits} isabet, {self.misses} iskalama"
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,243 @@
+"""
+Synora - fal.ai sonuç toplayıcı (tek merkezi poller + isteğe bağlı webhook)
+
+Her iş için ayrı thread'de saniyede bir sorgu yerine tüm bekleyen işler tek
+bir döngüde takip edilir:
+- Zamanı gelen işlerin durumları aynı turda, sınırlı paralellikle sorulur
+- Sorgu aralığı işin bekleme süresiyle büyür (yeni iş sık, eski iş seyrek)
+- Webhook modunda fal.ai biten işi yerel HTTP sunucusuna kendisi bildirir;
+  poller sadece kaybolan bildirimler için seyrek yedek sorgu yapar
+
+Webhook gövdesine güvenilmez (imza doğrulanmıyor): bildirim sadece takip
+edilen işin durumunun hemen sorulmasını sağlar, sonuç yine fal.ai'den alınır.
+Takibe alınmadan gelen bildirimler yalnız bu çalıştırmada gönderilen işler
+için ve en fazla `max_wait` kadar saklanır.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ============== AYARLAR ==============
+
+POLL_BASE_INTERVAL = 0.5     # Yeni işin ilk sorgu aralığı (sn)
+POLL_GROWTH = 0.15           # Aralık = base + bekleme süresi * growth
+POLL_MAX_INTERVAL = 10.0     # En uzun sorgu aralığı (sn)
+POLL_MAX_PARALLEL = 16       # Bir turda aynı anda yapılan durum sorgusu
+WEBHOOK_FALLBACK_INTERVAL = 30.0  # Webhook modunda yedek sorgu aralığı (sn)
+WEBHOOK_MAX_BODY = 1024 * 1024    # Webhook gövdesinin en fazla boyutu (bayt)
+
+
+class FalPoller:
+    """Bekleyen tüm fal.ai işlerini tek döngüde takip eder.
+
+    `check_status(job)` bloklayan bir fonksiyondur ve (durum, görsel_url)
+    döndürür; durum "IN_QUEUE", "IN_PROGRESS", "COMPLETED", "FAILED" veya
+    geçici hatada None olabilir.
+    """
+
+    def __init__(self, check_status, max_wait: float, webhook: bool = False,
+                 max_parallel: int = POLL_MAX_PARALLEL):
+        self.check_status = check_status
+        self.max_wait = max_wait
+        self.webhook = webhook
+        self.max_parallel = max_parallel
+        self.tracked = {}           # request_id -> takip kaydı
+        self.expected = {}          # Gönderilip henüz takibe alınmayan request_id -> gönderim zamanı
+        self.early_notices = set()  # Bunlardan webhook bildirimi gelmiş olanlar
+        self.checks = 0
+        self.webhook_hits = 0
+        self._loop = None
+        self._wake = None
+        self._closed = False
+
+    def _interval(self, age: float) -> float:
+        if self.webhook:
+            return WEBHOOK_FALLBACK_INTERVAL
+        return min(POLL_MAX_INTERVAL, POLL_BASE_INTERVAL + age * POLL_GROWTH)
+
+    def expect(self, request_id: str):
+        """Bu çalıştırmada gönderilen işi kaydet (takibe alınmadan gelen webhook'u saklamak için)"""
+        now = time.monotonic()
+        # Gönderildikten sonra hiç takibe alınmayan (iptal edilen) işler birikmesin
+        for old in [rid for rid, since in self.expected.items() if now - since > self.max_wait]:
+            del self.expected[old]
+            self.early_notices.discard(old)
+        self.expected[request_id] = now
+
+    async def wait(self, job: dict) -> str:
+        """İşi takibe al, bitince görsel URL'ini döndür (başarısızsa None).
+
+        `job["timings"]` içine IN_QUEUE/IN_PROGRESS süreleri yazılır.
+        """
+        now = time.monotonic()
+        job["timings"] = {"in_queue": 0.0, "in_progress": 0.0}
+        entry = {
+            "job": job,
+            "future": self._loop.create_future(),
+            "started": now,
+            "status": "IN_QUEUE",
+            "last_change": now,
+            "next_check": now + self._interval(0.0),
+        }
+        self.tracked[job["request_id"]] = entry
+        self.expected.pop(job["request_id"], None)
+        if job["request_id"] in self.early_notices:
+            self.early_notices.discard(job["request_id"])
+            entry["next_check"] = now
+        self._wake.set()
+        try:
+            return await entry["future"]
+        finally:
+            self.tracked.pop(job["request_id"], None)
+
+    def _update(self, entry: dict, status: str, image_url: str = None):
+        """Durum değişikliğini uygula; iş bittiyse future'ı tamamla"""
+        now = time.monotonic()
+        timings = entry["job"]["timings"]
+        key = "in_progress" if entry["status"] == "IN_PROGRESS" else "in_queue"
+        timings[key] += now - entry["last_change"]
+        entry["last_change"] = now
+        if status:
+            entry["status"] = status
+
+        future = entry["future"]
+        if future.done():
+            return
+        if status == "COMPLETED":
+            future.set_result(image_url)
+        elif status == "FAILED":
+            future.set_result(None)
+        elif now - entry["started"] > self.max_wait:
+            print(f"  {entry['job']['word']}: fal.ai {self.max_wait:.0f}sn icinde bitmedi")
+            future.set_result(None)
+        else:
+            # Sorgu sürerken webhook geldiyse hemen tekrar sor
+            entry["next_check"] = now if entry.pop("recheck", False) else \
+                now + self._interval(now - entry["started"])
+            self._wake.set()
+
+    def notify(self, request_id: str):
+        """Webhook bildirimi: işin durumunu hemen sor (herhangi bir thread'den çağrılabilir)"""
+        def apply():
+            entry = self.tracked.get(request_id)
+            if entry is not None:
+                self.webhook_hits += 1
+                if entry["future"].done():
+                    return
+                if entry["next_check"] == float("inf"):
+                    entry["recheck"] = True     # Sorgu sürüyor, bitince tekrar sorulur
+                else:
+                    entry["next_check"] = time.monotonic()
+                    self._wake.set()
+            elif request_id in self.expected:
+                # İş henüz poll aşamasına gelmedi - gelince hemen sorulur
+                self.webhook_hits += 1
+                self.early_notices.add(request_id)
+            # Bu çalıştırmada gönderilmemiş id'ler yok sayılır
+        self._loop.call_soon_threadsafe(apply)
+
+    async def run(self):
+        """Poller döngüsü - close() çağrılana kadar çalışır (start() ile başlatılır)"""
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        running = set()
+
+        async def check(entry: dict):
+            async with semaphore:
+                self.checks += 1
+                try:
+                    status, image_url = await asyncio.to_thread(self.check_status, entry["job"])
+                except Exception:
+                    status, image_url = None, None
+            self._update(entry, status, image_url)
+
+        while not self._closed:
+            now = time.monotonic()
+            due = [entry for entry in self.tracked.values()
+                   if not entry["future"].done() and entry["next_check"] <= now]
+            for entry in due:
+                entry["next_check"] = float("inf")  # Sorgu bitene kadar tekrar seçilmesin
+                task = asyncio.create_task(check(entry))
+                running.add(task)
+                task.add_done_callback(running.discard)
+
+            pending = [entry["next_check"] for entry in self.tracked.values()
+                       if not entry["future"].done() and entry["next_check"] != float("inf")]
+            timeout = max(0.0, min(pending) - now) if pending else None
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> asyncio.Task:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        return asyncio.create_task(self.run())
+
+    def close(self):
+        self._closed = True
+        if self._wake is not None:
+            self._wake.set()
+
+    def status(self) -> str:
+        return (f"fal.ai poller: {len(self.tracked)} takipte, {self.checks} sorgu"
+                + (f", {self.webhook_hits} webhook" if self.webhook else ""))
+
+
+class WebhookReceiver:
+    """fal.ai webhook bildirimlerini alan küçük yerel HTTP sunucusu.
+
+    fal.ai gövdesi: {"request_id": ..., "status": "OK" | "ERROR", "payload": {"images": [...]}}
+    Gövdeden sadece request_id kullanılır; durum ve görsel adresi poller'ın
+    fal.ai'ye sorgusundan gelir.
+    """
+
+    def __init__(self, host: str, port: int, poller: FalPoller):
+        poller_ref = poller
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= WEBHOOK_MAX_BODY:
+                    self.send_response(413)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    self.close_connection = True
+                    return
+                try:
+                    data = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    data = {}
+
+                request_id = data.get("request_id") if isinstance(data, dict) else None
+                if not isinstance(request_id, str):
+                    request_id = None
+                if request_id:
+                    poller_ref.notify(request_id)
+
+                self.send_response(200 if request_id else 400)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
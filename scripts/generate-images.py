@@ -3,8 +3,9 @@ Synora - Kelime Görselleri Üretici
 Gemini (açıklama) + fal.ai (görsel) + Bunny.net (CDN)
 
 Kullanım:
-1. python generate-images.py --test   (tek kelime test)
-2. python generate-images.py          (tüm kelimeleri üret)
+1. python generate-images.py --test              (tek kelime test)
+2. python generate-images.py                     (tüm kelimeleri üret)
+3. python generate-images.py --concurrency 16    (aynı anda 16 iş)
 
 Maliyet: Gemini ücretsiz + fal.ai ~$0.003/resim
 """
@@ -13,9 +14,33 @@ import os
 import json
 import time
 import re
-import requests
+import asyncio
+import argparse
+import functools
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from urllib.parse import quote, unquote
 from distinctive_descriptions import DISTINCTIVE_DESCRIPTIONS
+from rate_limiter import RateLimiter, parse_retry_after
+from concurrency_controller import AimdController, AdaptiveWindow
+from description_cache import DescriptionCache, prompt_hash
+from manifest import GenerationManifest
+from fal_poller import FalPoller, WebhookReceiver, POLL_MAX_PARALLEL
+from http_client import HttpClient
+from job_queue import LeaseQueue
+from scheduler import PriorityScheduler, ScheduledQueue, load_id_list, load_usage
+from render_cache import RenderCache, render_key
+from renditions import RENDITION_SIZES, available_formats, render_renditions, renditions_current
+from placeholders import compute_placeholders, placeholders_available, write_placeholder_export
+from image_store import ImageStore, SlugIndex
+from bunny_publisher import (BunnyPublisher, BunnyStorage, content_version, versioned_name,
+                             write_url_export)
+from cdn_audit import AUDIT_MAX_PARALLEL, CdnAuditor, write_audit_report
+from perceptual_hash import (DHASH_THRESHOLD, PHASH_THRESHOLD, compute_hashes,
+                             find_near_duplicates, hashes_available)
 
 # ============== API KEYS ==============
 
@@ -28,28 +53,113 @@ BUNNY_API_KEY = "caafa46f-fbd1-43d0-972bbfa3c2a5-ca35-4251"
 BUNNY_STORAGE_ZONE = "synora-images"
 BUNNY_STORAGE_PATH = "/words"
 BUNNY_STORAGE_HOST = "storage.bunnycdn.com"
+BUNNY_STORAGE_ENDPOINT = f"https://{BUNNY_STORAGE_HOST}"  # Testte yerel sunucu verilebilir (--storage-endpoint)
 BUNNY_CDN_URL = "https://synora-images.b-cdn.net/words"
+BUNNY_CDN_HOST = "synora-images.b-cdn.net"
 
 # ============== DİĞER AYARLAR ==============
 
 WORDS_FILE = Path(__file__).parent / "words-for-images.json"
 GENERATED_FILE = Path(__file__).parent / "generated-images.json"
+MANIFEST_JOURNAL_FILE = Path(__file__).parent / "generated-images.journal.ndjson"  # Append-only kayıtlar (manifest.py)
 OUTPUT_FOLDER = Path(__file__).parent / "generated-images"  # Görseller bu klasöre kaydedilecek
+# İçerik adresli depo (image_store.py): objects/ab/cd/<sha256>.jpg, boyutları da yanında
+IMAGE_STORE_FOLDER = OUTPUT_FOLDER / "objects"
+# Uygulamanın paketlediği yer tutucu bilgisi (placeholders.py): {kelime id: blurhash, renk, boyut}
+PLACEHOLDERS_EXPORT_FILE = Path(__file__).parent.parent / "src" / "data" / "image-placeholders.json"
+# Uygulamanın paketlediği CDN haritası (bunny_publisher.py): {"base", "images": {kelime id: sürümlü ad}}
+IMAGE_URLS_EXPORT_FILE = Path(__file__).parent.parent / "src" / "data" / "image-urls.json"
+CDN_ORPHANS_FILE = Path(__file__).parent / "cdn-orphans.json"  # Sahipsiz CDN dosyaları ve ilk görülme zamanı
+CDN_AUDIT_REPORT_FILE = Path(__file__).parent / "cdn-audit.json"  # --audit fark raporu
+NEAR_DUPLICATES_REPORT_FILE = Path(__file__).parent / "near-duplicates.json"  # --duplicates raporu
+CDN_ORPHAN_GRACE_DAYS = 30  # Eski sürüm bu kadar gün kullanılmazsa CDN'den silinir (eski uygulama sürümleri)
+PLACEHOLDER_BATCH = 32      # --renditions modunda süreç havuzuna tek seferde verilen görsel
+DESCRIPTION_CACHE_FILE = Path(__file__).parent / "description-cache.sqlite3"  # Gemini açıklama önbelleği
+JOB_QUEUE_FILE = Path(__file__).parent / "job-queue.sqlite3"  # Süreçler arası iş kuyruğu (--queue)
+PART_SUFFIX = ".part"               # İnmekte olan görseller bu uzantıyla yazılır, bitince taşınır
+PART_FILE_MAX_AGE = 3600            # Bundan eski .part dosyaları çöken çalışmadan kalmıştır (sn)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024     # İndirme parça boyutu (byte)
 
 # API endpoints
 FAL_API_URL = "https://queue.fal.run/fal-ai/flux/schnell"  # schnell model - hızlı ve ucuz
+FAL_IMAGE_PARAMS = {"image_size": "square", "num_images": 1}  # Görsel önbelleği anahtarına da girer
 GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent"
 
-# Rate limiting
-DELAY_BETWEEN_REQUESTS = 3  # fal.ai requests
-GEMINI_RETRY_DELAY = 10     # Gemini rate limit retry (longer wait)
+# Rate limiting - sağlayıcı başına paylaşılan token bucket (rate_limiter.py)
+# rate: başlangıç hızı (istek/sn), 429'lara göre max_rate'e kadar kendini ayarlar
+RATE_LIMITS = {
+    "gemini": {"rate": 1.0, "burst": 2, "max_rate": 5.0},
+    "fal": {"rate": 5.0, "burst": 10, "max_rate": 20.0},
+    "bunny": {"rate": 10.0, "burst": 20, "max_rate": 50.0},
+    "cdn": {"rate": 200.0, "burst": 100, "max_rate": 1000.0},    # --audit HEAD istekleri
+}
+RATE_LIMITED_STATUSES = (429, 503)
+# HTTP bağlantı havuzu - host başına keep-alive bağlantı sayısı (http_client.py)
+# Havuz, o hosta aynı anda istek atan thread sayısından küçük olmamalı
+HTTP_POOL_SIZES = {
+    "generativelanguage.googleapis.com": 16,
+    "queue.fal.run": 32,        # submit + durum sorguları
+    BUNNY_STORAGE_HOST: 16,
+    BUNNY_CDN_HOST: AUDIT_MAX_PARALLEL,
+}
+HTTP2_HOSTS = ["queue.fal.run", BUNNY_CDN_HOST]  # httpx[http2] kuruluysa HTTP/2 ile çoklanır
 GEMINI_MAX_RETRIES = 5      # Max retries for Gemini
+FAL_MAX_RETRIES = 5         # Max retries for fal.ai 429
+
+# Eşzamanlılık - pipeline aşamaları: describe → submit → poll → download → save → optimize
+# fal.ai'de aynı anda bekleyen iş sayısı AIMD ile MIN..MAX arasında ayarlanır
+# (concurrency_controller.py)
+DEFAULT_CONCURRENCY = 8     # Başlangıç penceresi (--concurrency)
+MIN_CONCURRENCY = 2         # --min-concurrency
+MAX_CONCURRENCY = 32        # --max-concurrency
+PROGRESS_EVERY = 50         # Kaç görselde bir hız bilgisi yazılsın
+STATUS_INTERVAL = 15        # Kaç saniyede bir kuyruk durumları yazılsın
+STAGE_QUEUE_SIZE = 32       # Aşamalar arası kuyruk kapasitesi (backpressure)
+FAL_JOB_MAX_AGE = 6 * 3600  # Yarım kalan fal.ai işi bu kadar eskiyse sonucu toplanmaz, yeniden gönderilir (sn)
+FAL_MAX_WAIT = 180          # Bir fal.ai işi için en fazla bekleme (sn)
+HTTP_TIMEOUT = 30           # Tek bir HTTP isteği için en fazla bekleme (sn)
+JOB_DEADLINE = 300          # Bir kelimenin tüm aşamaları için toplam süre bütçesi (sn, --deadline)
+DEADLINE_GRACE = 5          # Thread'deki aşama kendi bütçesini aşarsa bu kadar sonra bırakılır (sn)
+
+# Yeniden deneme kuyruğu - başarısız kelimeler aşama ve hata türüyle manifest
+# journal'ında saklanır (manifest.py), üstel beklemeyle tekrar denenir
+RETRY_MAX_ATTEMPTS = 5          # Bu kadar denemeden sonra sadece --retry-failed ile denenir
+RETRY_BASE_DELAY = 30           # İlk yeniden deneme beklemesi (sn), her denemede iki katı
+RETRY_MAX_DELAY = 6 * 3600      # En uzun bekleme (sn)
+RETRY_IN_RUN_MAX_DELAY = 300    # Bundan kısa beklemeler aynı çalıştırma içinde beklenir (sn)
+DESCRIBE_BATCH_WAIT = 0.5   # Toplu açıklama için kuyrukta kelime bekleme süresi (sn)
+CLAIM_BATCH = 16            # --queue modunda paylaşılan kuyruktan bir seferde kiralanan kelime
+MAX_LEASED = 64             # --queue modunda bir sürecin elinde aynı anda olabilecek kelime
+QUEUE_POLL_INTERVAL = 2.0   # --queue modunda kuyruk boşken başka süreçlerin kiraları ne sıklıkla kontrol edilsin (sn)
+QUEUE_POLL_MIN = 0.2        # Kira dolmak üzereyken en kısa bekleme (sn)
+PRIORITY_ORDER = ["level"]  # Üretim sırası ölçütleri (--priority, scheduler.py): ids, usage, level, category
+
+# fal.ai webhook modu (--webhook-url): fal.ai biten işi bu porttaki yerel sunucuya bildirir.
+# Varsayılan sadece yerel (tünel/ters proxy arkasında); dışarıya açmak için --webhook-host 0.0.0.0
+WEBHOOK_HOST = "127.0.0.1"
+WEBHOOK_PORT = 8787
+
+# Aşama başına worker sayısı ("poll" en büyük pencere kadardır, asıl sınır AIMD penceresi)
+STAGE_WORKERS = {
+    "describe": 8,   # Gemini çağrıları ucuz, paralel
+    "submit": 4,     # fal.ai kotası
+    "poll": MAX_CONCURRENCY,
+    "download": 8,   # Bant genişliği
+    "save": 2,       # Disk
+    "optimize": os.cpu_count() or 2,  # CPU - boyutlandırma süreç havuzunda (RENDITION_PROCESSES)
+}
+STAGES = ["describe", "submit", "poll", "download", "save", "optimize"]
+RENDITION_PROCESSES = os.cpu_count() or 2  # WebP/AVIF boyutlarını üreten süreç sayısı
 
 # ============== GÖRSEL PROMPT ŞABLONU ==============
 
 # Karakter gerektiren kategoriler
 CATEGORIES_WITH_CHARACTERS = ["emotions", "verbs", "health", "sports", "family", "people_roles"]
 
+# Karakterli görseller daha uzun sürer - fal.ai'de kategori başına aynı anda en fazla bu kadar iş
+# (--category-limit)
+CATEGORY_LIMITS = {category: 4 for category in CATEGORIES_WITH_CHARACTERS}
+
 # Kategori bazlı prompt şablonları
 CATEGORY_PROMPTS = {
     "everyday_objects": """A single {description} shown clearly as the main subject.
@@ -126,6 +236,55 @@ Style requirements:
 
 # ============== FONKSİYONLAR ==============
 
+class DeadlineExceeded(Exception):
+    """İşin süre bütçesi doldu"""
+
+def time_left(deadline: float) -> float:
+    """Mutlak (time.monotonic) son tarihe kalan süre; son tarih yoksa sonsuz"""
+    return float("inf") if deadline is None else deadline - time.monotonic()
+
+def request_timeout(deadline: float, timeout: float = HTTP_TIMEOUT) -> float:
+    """Son tarihi aşmayacak istek timeout'u; süre dolduysa DeadlineExceeded"""
+    left = time_left(deadline)
+    if left <= 0:
+        raise DeadlineExceeded()
+    return min(timeout, left)
+
+LIMITERS = {name: RateLimiter(name, **config) for name, config in RATE_LIMITS.items()}
+
+# Tüm aşamaların paylaştığı bağlantı havuzu
+HTTP = HttpClient(HTTP_POOL_SIZES, http2_hosts=HTTP2_HOSTS)
+
+def limited_request(provider: str, method: str, url: str, max_retries: int = 1,
+                    deadline: float = None, **kwargs):
+    """Sağlayıcının hız sınırına uyarak istek at.
+
+    429/503 gelirse sınırlayıcı hızı düşürür; Retry-After (yoksa jitter'lı
+    üstel bekleme) kadar beklenip `max_retries` hakka kadar tekrar denenir.
+    Son yanıt her durumda döner. Her denemenin timeout'u `deadline`'ı
+    aşmaz; süre dolunca DeadlineExceeded fırlatılır.
+    """
+    limiter = LIMITERS[provider]
+    timeout = kwargs.pop("timeout", HTTP_TIMEOUT)
+
+    for attempt in range(max_retries):
+        limiter.acquire()
+        response = HTTP.request(method, url, timeout=request_timeout(deadline, timeout), **kwargs)
+
+        if response.status_code not in RATE_LIMITED_STATUSES:
+            if response.status_code < 400:
+                limiter.on_success()
+            return response
+
+        # Retry-After varsa sınırlayıcı o süre boyunca herkesi bekletir;
+        # yoksa bu istek jitter'lı üstel bekleme yapar
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        limiter.on_rate_limited(retry_after)
+        if attempt < max_retries - 1 and retry_after is None:
+            time.sleep(min(limiter.backoff(attempt), max(0.0, time_left(deadline))))
+
+    return response
+
 def load_words():
     """Kelimeleri JSON'dan yükle"""
     if not WORDS_FILE.exists():
@@ -139,643 +298,646 @@ def load_words():
     print(f"Toplam {len(words)} kelime yuklendi.")
     return words
 
+def open_manifest() -> GenerationManifest:
+    """Üretim manifestini aç (generated-images.json + journal)"""
+    manifest = GenerationManifest(GENERATED_FILE, MANIFEST_JOURNAL_FILE)
+    if manifest.journal_records:
+        print(f"Journal'dan {manifest.journal_records} kayit kurtarildi.")
+    return manifest
+
 def load_generated():
     """Daha önce üretilmiş görselleri yükle"""
-    if GENERATED_FILE.exists():
-        with open(GENERATED_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
-
-def save_generated(generated):
-    """Üretilmiş görselleri kaydet"""
-    with open(GENERATED_FILE, 'w', encoding='utf-8') as f:
-        json.dump(generated, f, indent=2, ensure_ascii=False)
+    return GenerationManifest(GENERATED_FILE, MANIFEST_JOURNAL_FILE).entries
+
+# ============== MANUEL AÇIKLAMALAR ==============
+
+# İNSAN/KARAKTERgerektiren kelimeler
+PERSON_WORDS = {
+    # Problematic words (bypass Gemini)
+    "belt": "brown leather waist strap with rectangular silver metal buckle, fashion accessory worn with trousers around hips",
+    # Travel
+    "tourist": "a tourist person with camera and backpack, casual traveler",
+    "guide": "a tour guide person holding a small flag, friendly guide",
+    "passenger": "a passenger person sitting with luggage",
+    "pilot": "an airplane pilot in uniform with cap",
+    "driver": "a taxi or bus driver person",
+    # Health
+    "doctor": "a friendly doctor person in white coat with stethoscope",
+    "nurse": "a nurse person in medical scrubs",
+    "patient": "a patient person sitting or lying down",
+    "dentist": "a dentist person with dental tools",
+    "surgeon": "a surgeon in surgical gown and mask",
+    # Family
+    "mother": "a mother woman smiling warmly",
+    "father": "a father man smiling warmly",
+    "baby": "a cute baby infant",
+    "child": "a happy child kid",
+    "grandmother": "an elderly grandmother woman",
+    "grandfather": "an elderly grandfather man",
+    "sister": "a young girl sister",
+    "brother": "a young boy brother",
+    "uncle": "an adult uncle man",
+    "aunt": "an adult aunt woman",
+    # Business
+    "boss": "a boss manager person in business suit",
+    "employee": "an office employee worker at desk",
+    "secretary": "a secretary person at desk",
+    "manager": "a manager person in professional attire",
+    # Education
+    "teacher": "a teacher person at blackboard",
+    "student": "a student person with books",
+    "professor": "a professor with glasses and books",
+    # Sports
+    "athlete": "an athlete person in sports gear",
+    "coach": "a sports coach with whistle",
+    "referee": "a referee in black and white stripes",
+    "player": "a sports player in uniform",
+    # Music/Entertainment
+    "singer": "a singer person with microphone",
+    "musician": "a musician playing instrument",
+    "actor": "an actor person on stage",
+    "dancer": "a dancer person dancing",
+    "chef": "a chef in white hat and apron",
+    "waiter": "a waiter person with serving tray",
+    # Verbs with person
+    "run": "a person running, side view, athletic pose",
+    "walk": "a person walking, side view",
+    "jump": "a person jumping in the air",
+    "sit": "a person sitting on a chair",
+    "stand": "a person standing upright",
+    "sleep": "a person sleeping in bed",
+    "eat": "a person eating food",
+    "drink": "a person drinking from a glass",
+    "read": "a person reading a book",
+    "write": "a person writing with pen",
+    "swim": "a person swimming in water",
+    "dance": "a person dancing",
+    "sing": "a person singing with microphone",
+    "cook": "a person cooking in kitchen",
+    "work": "a person working at desk",
+    "study": "a person studying with books",
+    "play": "a person playing",
+    "laugh": "a person laughing happily",
+    "cry": "a person crying with tears",
+    "smile": "a person smiling warmly",
+    "wave": "a person waving hand",
+    "hug": "two people hugging each other warmly",
+    "kiss": "two people kissing romantically",
+    # Çok kişili / sahne gerektiren kelimeler
+    "wedding": "a bride and groom at wedding ceremony",
+    "engagement": "a couple with engagement ring, proposal scene",
+    "marriage": "a married couple holding hands with rings",
+    "family": "a happy family group with parents and children",
+    "party": "a group of people celebrating at a party",
+    "meeting": "people sitting around a conference table",
+    "interview": "two people at a job interview, one asking questions",
+    "conversation": "two people talking to each other",
+    "argument": "two people arguing with angry expressions",
+    "handshake": "two people shaking hands",
+    "date": "a romantic couple at dinner date",
+    "friendship": "two friends together smiling",
+    "teamwork": "a group of people working together",
+    "crowd": "a large group of people together",
+    "audience": "people sitting watching a performance",
+    "class": "students sitting in a classroom",
+    "queue": "people standing in a line waiting",
+    "traffic": "cars on a busy road",
+    "war": "soldiers in battle scene",
+    "peace": "people holding hands in harmony",
+    "love": "a heart shape or couple in love",
+    "fight": "two people fighting or boxing",
+    "race": "runners racing on a track",
+    "game": "people playing a game together",
+    "concert": "a singer performing for audience",
+    "theater": "actors on a theater stage",
+    "restaurant": "people dining at restaurant tables",
+    "cafe": "people sitting at cafe with coffee",
+    "hospital": "hospital building with ambulance",
+    "school": "school building with students",
+    "office": "office interior with desks and computers",
+    "airport": "airport terminal with planes",
+    "station": "train or bus station building",
+    "beach": "beach scene with sand, water, and umbrellas",
+    "park": "park with trees, benches, and paths",
+    "gym": "gym interior with exercise equipment",
+    "library": "library with bookshelves and reading area",
+    "museum": "museum interior with art and exhibits",
+    "zoo": "zoo with various animals in enclosures",
+    "circus": "circus tent with performers",
+    "birthday": "birthday cake with candles and celebration",
+    "christmas": "christmas tree with presents and decorations",
+    "halloween": "halloween pumpkin and spooky decorations",
+    "graduation": "graduate in cap and gown with diploma",
+    "funeral": "sad funeral scene with flowers",
+    "ceremony": "formal ceremony with people gathered",
+    # Etkileşim kelimeleri - 2+ kişi gerekli
+    "share": "two people sharing food, one giving half to other",
+    "help": "one person helping another person stand up",
+    "give": "one person giving a gift box to another person",
+    "receive": "one person receiving a package from another",
+    "teach": "teacher at board explaining to students",
+    "learn": "student at desk studying with books",
+    "talk": "two people talking face to face",
+    "listen": "person listening carefully to another speaking",
+    "visit": "person knocking on door, being welcomed by another person",
+    "meet": "two people meeting and greeting each other",
+    "introduce": "one person introducing two others to each other",
+    "invite": "person handing invitation card to another",
+    "thank": "person bowing or expressing gratitude to another",
+    "apologize": "person apologizing with sorry expression to another",
+    "agree": "two people nodding and shaking hands",
+    "disagree": "two people with crossed arms facing each other",
+    "compete": "two people racing or competing against each other",
+    "cooperate": "two people working together on something",
+    "communicate": "two people exchanging speech bubbles",
+    # Mekan kelimeleri - binalar/manzara gerekli
+    "city": "city skyline with tall buildings and skyscrapers",
+    "town": "small town with houses and church steeple",
+    "village": "small village with cottages and countryside",
+    "street": "street view with buildings, sidewalk, and road",
+    "road": "long road stretching into distance with lanes",
+    "building": "tall modern building with many windows",
+    "house": "cozy house with roof, windows, and door",
+    "apartment": "apartment building with multiple floors and balconies",
+    "store": "store front with shop window and sign",
+    "shop": "small shop with products in window display",
+    "market": "outdoor market with stalls and vendors",
+    "mall": "large shopping mall interior with escalators",
+    "hotel": "hotel building with entrance and lobby",
+    "factory": "factory building with smokestacks",
+    "farm": "farm with barn, fields, and animals",
+    "garden": "beautiful garden with flowers and plants",
+    "forest": "dense forest with tall trees",
+    "mountain": "tall mountain with snow-capped peak",
+    "river": "flowing river with banks and water",
+    "lake": "calm lake surrounded by nature",
+    "ocean": "vast ocean with waves and horizon",
+    "island": "tropical island with palm trees in ocean",
+    # Yön kelimeleri - OK TABELASI şeklinde
+    "left": "a green arrow shape pointing to the left, arrow tip on left side, tail on right side",
+    "right": "a blue arrow shape pointing to the right, arrow tip on right side, tail on left side",
+    "straight": "a blue road sign with white arrow pointing STRAIGHT ahead UP",
+    "back": "a blue road sign with white U-turn arrow pointing backward",
+    "near": "a small house and a tree right next to each other, very close together",
+    "far": "a tiny house on left and tiny tree on right with huge empty space between them",
+    "stop": "a red octagonal STOP traffic sign on a pole",
+    "go": "a green traffic light glowing green for GO",
+    # Soyut/kavram kelimeleri
+    "single": "number 1 with one single apple next to it",
+    "double": "number 2 with two identical red apples side by side",
+    "world": "3D planet Earth globe showing blue oceans and green continents",
+    "stamp": "a single colorful postage stamp, small square with perforated edges, showing a flower design",
+    "postcard": "a rectangular postcard with beach photo on front, address lines visible on back side",
+    "square": "a European city square plaza with fountain and buildings around",
+    "center": "a red target bullseye with arrow hitting the center",
+    "sign": "a wooden signpost with directional arrows at crossroads",
+    # Para/ödeme kelimeleri
+    "price": "a white price tag label showing $99",
+    "cash": "stack of green dollar bills and golden coins",
+    "card": "a blue credit card with chip and numbers",
+    "money": "fan of colorful paper currency bills spread out",
+    "currency": "different country money notes - dollar euro yen pound together",
+    # Seyahat işlem kelimeleri
+    "booking": "a computer screen showing hotel reservation confirmation with checkmark",
+    "reservation": "a restaurant table with RESERVED sign on it",
+    "cancel": "a ticket with big red X crossed over it",
+    "delay": "a person sitting and waiting at airport gate, looking at watch impatiently, clock showing late time",
+    "arrival": "airplane landing on runway with wheels touching ground",
+    "departure": "airplane taking off from runway into sky",
+    "connection": "a chain with two links connected together, metal chain links interlocked",
+    "transfer": "person walking between two train platforms with arrows",
+    "direct": "airplane with straight arrow from A to B, no stops",
+    "terminal": "inside airport terminal building with gates and passengers",
+    "border": "border checkpoint gate with barrier and guard booth",
+    "customs": "customs officer at desk checking luggage with X-ray machine",
+    "visa": "passport page with colorful visa stamp on it",
+    "insurance": "a shield icon with checkmark protecting a person silhouette",
+    "safety": "a yellow triangle warning sign with exclamation mark",
+    "rent": "a car with FOR RENT sign on windshield",
+    "hire": "a taxi with HIRE light on top",
+    "help": "a blue help desk counter with question mark sign",
+    "sightseeing": "tourist taking photo of Eiffel Tower landmark",
+    "souvenir": "a gift shop display with magnets, keychains, and small Eiffel tower figurines",
+    # Kişi kelimeleri
+    "tourist": "tourist wearing hat with camera around neck looking at map",
+    "guide": "tour guide holding umbrella up leading a group",
+    "passenger": "person sitting in airplane seat looking out window",
+    "driver": "taxi driver behind steering wheel in yellow cab",
+    "pilot": "airplane pilot in uniform sitting in cockpit with controls",
+    "travel": "airplane flying over world globe",
+    "trip": "family in car on road trip with mountains in background",
+    "tour": "open top tour bus with tourists taking photos",
+    # ===== YENİ 100 KELİME - TRAVEL =====
+    "exit": "person walking through open doorway to outside, arrow symbol pointing outward through door",
+    "entrance": "a building entrance door with ENTER arrow sign",
+    "local": "a local market street with traditional shops and vendors",
+    "foreign": "multiple country flags from different nations together",
+    "abroad": "airplane flying over a world globe map",
+    "overseas": "a large ship crossing the blue ocean",
+    "journey": "a long winding road through mountains into horizon",
+    "route": "a map with red dotted line showing travel route path",
+    "schedule": "a calendar planner with dates and times marked",
+    "timetable": "train station departure board showing grid of colored rows with clock symbols and train icons",
+    "delay": "a large clock showing late time with waiting person",
+    "return": "a curved arrow making U-turn going back",
+    "one-way": "a single straight arrow pointing one direction only",
+    "round-trip": "two arrows forming a circle, going and returning",
+    "class": "airplane seats showing different seat sections",
+    "economy": "cramped airplane economy class seats in rows",
+    "business": "comfortable wide business class airplane seat",
+    "first class": "luxurious first class airplane suite with bed",
+    "stay": "a cozy hotel room with bed and lamp",
+    "guest": "a hotel guest checking in at reception desk",
+    "host": "a friendly host welcoming guest at door",
+    "hostel": "hostel dormitory room with bunk beds",
+    "camping": "camping scene with tent in forest near fire",
+    "tent": "a colorful camping tent pitched in nature",
+    "caravan": "a caravan RV motorhome parked in nature",
+    "cruise": "a large white cruise ship on ocean",
+    "deck": "ship deck with wooden floor and railing ocean view",
+    "port": "a busy port with large ships and cranes",
+    "harbor": "a peaceful harbor with boats and yachts",
+    "cabin": "a ship cabin room with small bed and porthole window",
+    "crew": "ship crew members in uniform standing together",
+    "captain": "a ship captain in white uniform with hat",
+    "flight attendant": "a friendly flight attendant serving passengers",
+    "take-off": "airplane lifting off from runway into sky",
+    "landing": "airplane wheels touching down on runway landing",
+    "runway": "long airport runway with painted lines",
+    "trolley": "airport luggage trolley cart with suitcases",
+    "security": "airport security checkpoint with officers",
+    "metal detector": "airport metal detector security gate frame",
+    "liquid": "small travel liquid bottles in clear plastic bag",
+    "weight": "a luggage scale showing weight measurement",
+    "limit": "a speed limit sign showing maximum number",
+    "extra": "large suitcase with additional small bag placed on top of it, plus symbol floating nearby",
+    "fee": "hand giving money bills through service counter window, payment transaction",
+    "tax": "a tax document paper with percentage symbol",
+    "bill": "a restaurant bill receipt with itemized charges",
+    "receipt": "long paper strip coming out of cash register machine, small shopping bag beside it on counter",
+    "brochure": "a colorful travel brochure pamphlet with photos",
+    "itinerary": "a travel itinerary document with day by day plan",
+    "accommodation": "a hotel building exterior with rooms",
+    "destination": "a map pin marker on destination location",
+    "delayed": "frustrated person sitting at airport gate with luggage, large wall clock showing late time, airplane visible through window",
+    "exchange rate": "two hands exchanging different colored money bills, dollars trading for euros, currency swap",
+    "travel insurance": "insurance policy document with airplane symbol",
+    "landmark": "famous Eiffel Tower landmark monument",
+    "exploration": "explorer with compass and map discovering",
+    "voyage": "old sailing ship on long ocean voyage",
+    "excursion": "tour group on day trip excursion bus",
+    "guided tour": "tour guide with umbrella leading tourist group",
+    "package deal": "vacation suitcase with airplane icon, hotel icon, and palm tree icon floating around it as bundle",
+    "all-inclusive": "colorful wristband on wrist with small icons showing food plate, drink glass, and swimming pool",
+    "self-catering": "apartment kitchen with cooking facilities",
+    "half-board": "breakfast and dinner plates together",
+    "full-board": "breakfast lunch dinner three meals together",
+    "suite": "luxurious hotel suite room with living area",
+    "twin room": "hotel room with two separate single beds",
+    "amenities": "hotel bathroom items arranged neatly: folded white towels, small soap bars, tiny shampoo bottles on marble counter",
+    "facilities": "hotel facilities pool gym spa icons",
+    "service": "room service waiter with tray at door",
+    "staff": "hotel staff team receptionist bellboy maid",
+    "tip": "hand giving money tip to waiter",
+    "gratitude": "person bowing showing thank you gratitude",
+    "budget": "piggy bank with coins budget savings",
+    "luxury": "diamond ring jewelry luxury expensive items",
+    "resort": "tropical beach resort with palm trees pool",
+    "spa": "relaxing spa treatment massage scene",
+    "view": "window with beautiful scenic mountain view",
+    "scenery": "beautiful natural scenery mountains lake trees",
+    "landscape": "wide landscape panorama of countryside",
+    "nature": "nature scene with trees flowers river",
+    "adventure": "adventure sports climbing rafting exciting activities",
+    "hiking": "person hiking on mountain trail with backpack",
+    "trekking": "trekkers climbing steep mountain path",
+    "gear": "hiking gear boots backpack poles equipment",
+    "equipment": "travel equipment suitcase camera gear laid out",
+    "expedition": "expedition team with equipment in wilderness",
+    "discovery": "excited explorer with magnifying glass finding ancient golden artifact in cave, moment of discovery",
+    "culture": "cultural symbols music art dance traditions",
+    "heritage": "ancient heritage building historical architecture",
+    "tradition": "traditional cultural ceremony with costumes",
+    "customs": "border customs checkpoint with officer at desk examining passport and open suitcase with X-ray scanner",
+    "authentic": "authentic handmade traditional crafts",
+    "original": "artist hands crafting unique handmade pottery on wheel, one-of-a-kind authentic piece",
+    "modern": "modern glass skyscraper building city",
+    "ancient": "ancient ruins old temple crumbling stones",
+    "historical": "historical castle fortress medieval building",
+    "monument": "famous monument statue landmark",
+    "statue": "large bronze or stone statue sculpture",
+    # ===== YENİ TRAVEL KELİMELERİ =====
+    "environment": "beautiful natural environment with trees, river, mountains, and blue sky",
+    "climate": "four seasons shown together: sunny summer, orange fall, snowy winter, blooming spring",
+    "weather": "weather icons together: bright sun, white clouds, rain drops, lightning bolt",
+    "forecast": "TV weather forecast screen showing sun and cloud icons on a map",
+    "navigation": "GPS navigation screen on phone showing route with blue arrow on map",
+    "compass": "classic compass with red needle pointing north, cardinal directions marked",
+    "isolated": "tiny cabin alone on small island surrounded by vast ocean, very remote",
+    "wanderlust": "person with backpack dreaming of travel, thought bubble showing landmarks Eiffel Tower pyramids",
+    "vagabond": "free-spirited traveler with worn backpack walking on endless road",
+    "layover": "tired traveler sleeping on airport bench between flights, luggage beside",
+    "off the beaten track": "hidden jungle path through dense forest, adventure trail",
+    "jet lag": "exhausted traveler with dark circles, clock showing day and night times confused",
+    "pilgrimage": "pilgrim walking toward distant holy temple on mountain",
+    "embark": "passenger stepping onto ship gangway, beginning journey",
+    "disembark": "passengers walking down airplane stairs onto tarmac",
+    "traverse": "hiker crossing long suspension bridge over deep canyon",
+    "globetrotter": "traveler with passport full of stamps standing next to globe",
+    "nomad": "nomad with camel and tent in desert landscape",
+    "expeditionary": "expedition team with gear and equipment in wilderness base camp",
+    "uncharted": "old map with blank unexplored area marked with question marks",
+    "picturesque": "charming European village with colorful houses by lake, very scenic",
+    "panoramic": "wide panoramic mountain view stretching across horizon",
+    "breathtaking": "person standing amazed at edge of grand canyon, stunning view",
+    "majestic": "majestic snow-capped mountain peak towering above clouds",
+    "pristine": "pristine untouched white sand beach with crystal clear water",
+    "rugged": "rugged rocky mountain terrain with steep cliffs",
+    "verdant": "lush verdant green valley with dense forest and meadows",
+    "arid": "dry arid desert landscape with sand dunes and cracked earth",
+    "bustling": "bustling busy city street crowded with people and vendors",
+    "cosmopolitan": "diverse cosmopolitan city with people of different cultures, world flags",
+    "provincial": "quiet provincial countryside town with small shops and farms",
+    "rustic": "rustic old wooden barn and farmhouse in countryside",
+    "serene": "serene peaceful lake at dawn with perfect reflection, calm water",
+    "hospitality": "hotel staff warmly welcoming guest at entrance with open arms",
+    "concierge": "hotel concierge at desk helping guest with recommendations",
+    "valet": "valet parking attendant receiving car keys from guest",
+    "transport": "various transport modes together: bus, train, airplane, ship",
+    "ecotourism": "eco-friendly nature tour with guide showing wildlife to tourists",
+    "conservation": "park ranger protecting wildlife, animals in natural habitat",
+    "icon": "collection of famous world icons: Eiffel Tower, Statue of Liberty, Big Ben",
+    "relic": "ancient relic artifact in museum display case with spotlight",
+    "artifact": "archaeological artifact: old pottery and tools from excavation",
+    "exhibit": "museum exhibit display with paintings and sculptures",
+    "gallery": "art gallery interior with paintings on white walls, visitors viewing",
+    "masterpiece": "famous masterpiece painting in golden frame on museum wall",
+    "architecture": "stunning architecture: gothic cathedral with detailed facade",
+    "urban": "urban city scene with tall buildings, busy streets, traffic",
+    "rural": "peaceful rural countryside with farms, fields, and barns",
+    "suburban": "suburban neighborhood with houses, lawns, and quiet streets",
+    "commute": "person commuting to work on crowded subway train",
+    "hub": "major transport hub: large central station with many platforms",
+    "junction": "road junction where multiple roads meet and cross",
+    "interchange": "highway interchange with multiple levels of roads crossing",
+    "toll": "toll booth on highway with cars passing through barrier",
+    "fare": "bus fare ticket with price printed on it",
+    "voucher": "discount voucher coupon with dotted cut line",
+    "refund": "hand receiving money back, refund transaction at counter",
+    "regulation": "official regulation document with stamps and seals",
+    "visa waiver": "passport with visa-free entry stamp, no visa required",
+    "residency": "residency permit card next to house keys",
+    # ===== FOOD KELİMELERİ =====
+    "menu": "restaurant menu booklet open showing food items with pictures",
+    "salt": "white salt shaker with salt crystals pouring out",
+    "sugar": "sugar bowl with white sugar cubes and spoon",
+    "pepper": "black pepper shaker with ground pepper",
+    "oil": "olive oil bottle with golden oil and olives",
+    "bread": "fresh baked loaf of bread with golden crust",
+    "rice": "bowl of white steamed rice with chopsticks",
+    "pasta": "plate of spaghetti pasta with red tomato sauce",
+    "soup": "bowl of hot soup with steam rising, spoon beside",
+    "salad": "fresh green salad bowl with lettuce tomatoes cucumbers",
+    "meat": "raw red meat steak on cutting board",
+    "fish": "whole fresh fish on plate with lemon slices",
+    "chicken": "roasted golden chicken leg drumstick on plate",
+    "egg": "three brown eggs in nest, one cracked showing yolk",
+    "cheese": "yellow cheese wedge with holes, swiss cheese style",
+    "butter": "stick of yellow butter on butter dish with knife",
+    "milk": "glass bottle of white milk with full glass beside",
+    "fruit": "colorful fresh fruits: apple, orange, banana, grapes together",
+    "vegetable": "fresh vegetables: carrot, broccoli, tomato, pepper together",
+}
 
-def get_fallback_description(word: str, category: str) -> str:
-    """Gemini kullanılamadığında kategori bazlı açıklama"""
+# Özel NESNE kelimeleri - belirsizlik olmaması için detaylı açıklamalar
+SPECIAL_WORDS = {
+    # Bilgisayar/Elektronik - MUTLAKA belirtilmeli
+    "mouse": "a black wireless computer mouse, PC mouse with scroll wheel and buttons, ergonomic design",
+    "charger": "a white phone charger with USB cable and wall adapter plug, smartphone charging cable",
+    "keyboard": "a black computer keyboard with keys, PC keyboard, QWERTY layout",
+    "monitor": "a flat screen computer monitor display, LCD screen on stand",
+    "laptop": "an open laptop computer showing screen and keyboard",
+    "printer": "an office inkjet printer machine, document printer",
+    "remote": "a distant mountain landscape viewed from far away, showing the concept of distance and remoteness, faraway scenery",
+    "remote control": "a classic TV remote control with number pad buttons, black plastic remote controller for television",
+
+    # Kırtasiye
+    "notebook": "a spiral notebook with colorful cover, school notebook with lines, NOT a laptop",
+    "pencil case": "a colorful fabric zipper pencil case open showing pencils and pens inside, school pencil pouch",
+    "pencil sharpener": "a classic small handheld pencil sharpener, simple single-hole plastic sharpener in bright color, traditional school supply NOT electric",
+    "can opener": "a manual can opener actively opening a metal food can, hands using the can opener tool on a tin can, kitchen action shot",
+    "kitchen sink": "a kitchen sink with faucet installed in a kitchen countertop, dirty dishes and sponge visible, window above sink, clearly in a kitchen",
+    "bathroom sink": "a bathroom sink with faucet under a mirror, toothbrush holder and soap dispenser visible, towel hanging nearby, clearly in a bathroom",
+    "book": "a closed hardcover book with colorful cover and spine",
+    "pen": "a blue ballpoint writing pen",
+    "pencil": "a yellow wooden pencil with eraser tip",
+    "eraser": "a pink rubber eraser for pencil",
+    "folder": "a colored paper folder for documents",
+    "binder": "a colorful blue 3-ring binder open showing metal rings inside, office ring binder with papers",
+
+    # Dikiş/Kişisel bakım
+    "cotton swab": "multiple Q-tip cotton swabs in a pile, white ear cleaning sticks with cotton on ends, bathroom cotton buds",
+    "seatbelt": "a car seatbelt buckled across a car seat, black fabric strap with red release button buckle, vehicle safety belt inside a car",
+    "clothespin": "a colorful plastic clothespin clipping a white towel on a clothesline rope, laundry peg in action hanging clothes",
+    "bus shelter": "a modern bus shelter with glass walls, bench inside, route map on wall, and people waiting, urban bus stop with advertisements",
+    "shampoo bottle": "a colorful PINK shampoo bottle with pump dispenser, hair care product with bubbles design on label",
+    "conditioner bottle": "a colorful PURPLE hair conditioner bottle with flip-top cap, smooth silky hair image on bottle",
+    "lotion bottle": "a WHITE body lotion bottle with pump, moisturizer cream with aloe vera leaf design, skincare product",
+    "bathroom trash can": "a small pedal bin trash can with foot pedal and lid, bathroom garbage bin next to toilet",
+    "name tag": "a plastic name badge with clip, Hello My Name Is written on it with blank space, ID badge with lanyard",
+    "shower mat": "a rectangular textured rubber bath mat lying flat on bathroom floor next to bathtub, colorful non-slip bathroom floor mat",
+    "coin": "a stack of silver and copper metal coins, real currency coins like quarters and pennies, NOT bitcoin NOT cryptocurrency",
+    "coffee table": "a wooden coffee table in front of a sofa in living room, with magazines and coffee cup on top, low rectangular table",
+    "dining table": "a large dining table with 4 chairs around it, plates and glasses set for dinner, family dining room",
+    "console table": "a narrow console table against a wall in entryway hallway, with vase and mirror above it, decorative entry table",
+    "side table": "a small round side table next to a sofa arm, with lamp and book on top, living room end table",
+
+    # TV furniture - ayırt edici
+    "tv stand": "a simple LOW wooden TV stand with flat screen TV on top, just a basic shelf unit for TV",
+    "tv console": "a WHITE modern TV console with drawers and cabinets, entertainment center with storage",
+    "media console": "a DARK BROWN wooden media console with open shelves showing DVD player and gaming console, living room",
+
+    # Mobilya - ayırt edici
+    "bookcase": "a tall wooden bookcase FILLED with colorful books on every shelf, library bookshelf",
+    "medicine cabinet": "an OPEN white medicine cabinet on bathroom wall showing medicine bottles and first aid supplies inside",
+    "kitchen cabinet": "wooden kitchen cabinets mounted on wall above kitchen counter with dishes visible through glass doors",
+    "wall hook": "a simple metal coat hook mounted on white wall with a jacket hanging from it, single wall mounted hook",
+    "key hook": "a small key holder rack on wall with multiple keys hanging from hooks, entryway key organizer",
+    "storage bin": "a large BLUE plastic storage bin with lid, household storage container",
+    "plastic bin": "a clear transparent plastic bin showing toys inside, see-through storage box",
+    "stackable bin": "three simple plastic storage containers stacked neatly, basic rectangular boxes with lids",
+    "sofa bed": "a sofa bed OPENED UP showing the mattress pulled out, convertible sleeper sofa in bed position",
+    "bed frame": "a metal bed frame WITHOUT mattress showing the slats and frame structure only",
+    "headboard": "an upholstered fabric headboard attached to wall behind a bed, just the headboard panel",
+    "utility cart": "a metal utility cart with multiple shelves holding tools and cleaning supplies, janitorial cart in hallway",
+    "rolling cart": "a 3-tier white kitchen rolling cart with wire baskets holding fruits and vegetables, home kitchen organizer",
+    "serving cart": "a gold metal bar cart with 4 wheels, two glass shelves holding wine bottles and cocktail glasses, front view showing all wheels",
+    "room divider": "a 3-panel wooden room divider with fabric panels, standing folded in living room separating space, decorative partition",
+    "folding screen": "a traditional Japanese style 4-panel folding screen with cherry blossom design, decorative privacy screen",
+    "shelf unit": "a tall wooden shelf unit with 5 shelves holding books, plants, and decorative items, freestanding bookshelf in living room",
+    "wall shelf": "a wooden wall shelf mounted on wall with L-shaped metal brackets, holding framed photos and small plants, clearly attached to wall with visible bracket supports",
+    "floating shelf": "a modern floating shelf with NO visible brackets or supports, white minimalist shelf appearing to float on wall, holding decorative vases and candles",
+    "floor lamp": "a tall standing floor lamp next to a sofa in living room, arc floor lamp with shade illuminating the room, full height lamp standing on floor",
+    "paper towel roll": "a large kitchen paper towel roll on a vertical metal holder stand, white absorbent paper towels in kitchen",
+    "tissue roll": "a white toilet paper roll on a bathroom wall holder, simple toilet tissue roll mounted on wall",
+    "sewing kit": "an open travel sewing kit box showing colorful thread spools, needles, scissors, buttons, and thimble inside",
+    "needle": "a close-up of a silver metal sewing needle with a small hole at one end and sharp point at other end, simple hand sewing needle",
+    "hair tie": "colorful elastic hair ties scrunchies, multiple hair bands in different colors, hair rubber bands",
+
+    # Mutfak
+    "container": "a large red metal shipping container, cargo container used for transport, industrial freight container box",
+    "glass": "a clear drinking glass, water glass tumbler",
+    "mug": "a ceramic coffee mug with handle",
+    "cup": "a ceramic tea cup with saucer",
+    "bowl": "a ceramic soup bowl, round deep bowl",
+    "plate": "a white ceramic dinner plate",
+    "pot": "a metal cooking pot with lid and handles",
+    "pan": "a black frying pan with long handle, skillet",
+    "kettle": "an electric kettle for boiling water",
+
+    # Ev eşyaları
+    "iron": "a clothes iron for ironing, steam iron appliance, NOT metal material",
+    "fan": "an electric standing fan with blades, room cooling fan",
+    "lamp": "a table lamp with lampshade, bedside lamp",
+    "mirror": "a rectangular wall mirror with frame",
+    "curtain": "elegant window curtains on both sides of a bright window, living room drapes with daylight coming through",
+    "drawer": "an open wooden drawer pulled out from a dresser, showing inside storage space with handle",
+    "pillow": "a white fluffy bed pillow",
+    "blanket": "a soft cozy blanket, bed blanket with pattern",
+    "towel": "a folded bath towel, soft cotton towel",
+    "rug": "a colorful floor rug, decorative carpet",
+    "room": "a cozy living room interior with sofa, coffee table, lamp, window with curtains, and rug on floor",
+
+    # Giyim
+    "belt": "brown leather waist strap with silver buckle for pants, fashion accessory worn with trousers, wardrobe item",
+    "watch": "a wristwatch on display, analog watch with band",
+    "glasses": "eyeglasses, reading glasses with frames",
+    "sandal": "bright red and blue summer flip flops sandals, colorful beach footwear with straps",
+    "sandals": "bright red and blue summer flip flops sandals pair, colorful beach footwear",
+
+    # Mekanlar/Binalar
+    "balcony": "a balcony attached to apartment building with flower pots, railing, and outdoor furniture, view from outside",
+    "garage": "a house garage with car inside, open garage door showing vehicle and tools on wall",
+    "cafe": "a cozy coffee shop interior with wooden tables, chairs, coffee cups, and warm lighting, inviting atmosphere",
+    "bus stop": "a bus stop shelter with bench, glass walls, and route sign, waiting area on sidewalk",
+    "park bench": "a classic GREEN painted wooden park bench on grass with trees in background, outdoor garden bench",
+    "street bench": "a modern metal and wood bench on concrete sidewalk next to a street lamp and buildings",
+    "crosswalk": "a pedestrian zebra crossing on asphalt road with white stripes, cars stopped at traffic light",
+    "elevator": "an open elevator with metal doors, inside view showing buttons panel and handrail",
+    "staircase": "wooden indoor staircase with handrail in a house, stairs going up",
+    "stairs": "concrete outdoor stairs with metal handrail, steps going up",
+    "airport": "an airport terminal building exterior with control tower, planes parked at gates",
+    "train station": "a train station platform with train arriving, roof shelter and passengers waiting",
+
+    # Aletler
+    "screwdriver": "a yellow and black Phillips head screwdriver tool, cross-head screwdriver",
+
+    # Araçlar
+    "car": "a sedan car automobile, passenger vehicle",
+    "bus": "a public transit bus, city bus",
+    "truck": "a pickup truck vehicle",
+    "bicycle": "a bicycle bike with two wheels",
+
+    # Mekanlar
+    "sidewalk": "a gray concrete sidewalk path with trees and buildings on the side, pedestrian walkway in a city",
+    "store": "a cute small retail shop building exterior with red awning, glass door, display window showing colorful products inside, brick facade",
+
+    # Mutfak eşyaları
+    "spoon": "ONE single silver metal tablespoon lying flat, just one spoon not two, eating utensil",
+
+    # Elektronik aksesuarlar
+    "earphones": "white wired earphones earbuds with cable and 3.5mm jack plug, in-ear headphones",
+
+    # Aletler
+    "flashlight": "a black handheld flashlight torch, cylindrical LED flashlight with on/off button",
+
+    # Diğer belirsiz kelimeler
+    "map": "a large unfolded paper map showing city streets and landmarks",
+    "ticket": "a paper ticket or boarding pass",
+    "passport": "a passport booklet document with cover",
+    "suitcase": "a travel suitcase luggage bag with wheels",
+    "camera": "a digital photo camera, DSLR camera",
+    "phone": "a smartphone mobile phone, iPhone style",
+    "key": "a metal door key, house key",
+    "keys": "a set of metal keys on keyring",
+    "coin": "gold and silver coins, money coins",
+    "stamp": "a colorful postage stamp",
+    "button": "clothing buttons, shirt buttons, sewing buttons",
+    "switch": "a light switch on wall, electrical switch",
+    "plug": "an electrical plug, power plug",
+    "battery": "AA batteries, cylindrical batteries",
+    "bulb": "a light bulb, LED bulb glowing",
+    "light bulb": "a light bulb, LED bulb glowing",
+}
 
-    # İNSAN/KARAKTERgerektiren kelimeler
-    person_words = {
-        # Problematic words (bypass Gemini)
-        "belt": "brown leather waist strap with rectangular silver metal buckle, fashion accessory worn with trousers around hips",
-        # Travel
-        "tourist": "a tourist person with camera and backpack, casual traveler",
-        "guide": "a tour guide person holding a small flag, friendly guide",
-        "passenger": "a passenger person sitting with luggage",
-        "pilot": "an airplane pilot in uniform with cap",
-        "driver": "a taxi or bus driver person",
-        # Health
-        "doctor": "a friendly doctor person in white coat with stethoscope",
-        "nurse": "a nurse person in medical scrubs",
-        "patient": "a patient person sitting or lying down",
-        "dentist": "a dentist person with dental tools",
-        "surgeon": "a surgeon in surgical gown and mask",
-        # Family
-        "mother": "a mother woman smiling warmly",
-        "father": "a father man smiling warmly",
-        "baby": "a cute baby infant",
-        "child": "a happy child kid",
-        "grandmother": "an elderly grandmother woman",
-        "grandfather": "an elderly grandfather man",
-        "sister": "a young girl sister",
-        "brother": "a young boy brother",
-        "uncle": "an adult uncle man",
-        "aunt": "an adult aunt woman",
-        # Business
-        "boss": "a boss manager person in business suit",
-        "employee": "an office employee worker at desk",
-        "secretary": "a secretary person at desk",
-        "manager": "a manager person in professional attire",
-        # Education
-        "teacher": "a teacher person at blackboard",
-        "student": "a student person with books",
-        "professor": "a professor with glasses and books",
-        # Sports
-        "athlete": "an athlete person in sports gear",
-        "coach": "a sports coach with whistle",
-        "referee": "a referee in black and white stripes",
-        "player": "a sports player in uniform",
-        # Music/Entertainment
-        "singer": "a singer person with microphone",
-        "musician": "a musician playing instrument",
-        "actor": "an actor person on stage",
-        "dancer": "a dancer person dancing",
-        "chef": "a chef in white hat and apron",
-        "waiter": "a waiter person with serving tray",
-        # Verbs with person
-        "run": "a person running, side view, athletic pose",
-        "walk": "a person walking, side view",
-        "jump": "a person jumping in the air",
-        "sit": "a person sitting on a chair",
-        "stand": "a person standing upright",
-        "sleep": "a person sleeping in bed",
-        "eat": "a person eating food",
-        "drink": "a person drinking from a glass",
-        "read": "a person reading a book",
-        "write": "a person writing with pen",
-        "swim": "a person swimming in water",
-        "dance": "a person dancing",
-        "sing": "a person singing with microphone",
-        "cook": "a person cooking in kitchen",
-        "work": "a person working at desk",
-        "study": "a person studying with books",
-        "play": "a person playing",
-        "laugh": "a person laughing happily",
-        "cry": "a person crying with tears",
-        "smile": "a person smiling warmly",
-        "wave": "a person waving hand",
-        "hug": "two people hugging each other warmly",
-        "kiss": "two people kissing romantically",
-        # Çok kişili / sahne gerektiren kelimeler
-        "wedding": "a bride and groom at wedding ceremony",
-        "engagement": "a couple with engagement ring, proposal scene",
-        "marriage": "a married couple holding hands with rings",
-        "family": "a happy family group with parents and children",
-        "party": "a group of people celebrating at a party",
-        "meeting": "people sitting around a conference table",
-        "interview": "two people at a job interview, one asking questions",
-        "conversation": "two people talking to each other",
-        "argument": "two people arguing with angry expressions",
-        "handshake": "two people shaking hands",
-        "date": "a romantic couple at dinner date",
-        "friendship": "two friends together smiling",
-        "teamwork": "a group of people working together",
-        "crowd": "a large group of people together",
-        "audience": "people sitting watching a performance",
-        "class": "students sitting in a classroom",
-        "queue": "people standing in a line waiting",
-        "traffic": "cars on a busy road",
-        "war": "soldiers in battle scene",
-        "peace": "people holding hands in harmony",
-        "love": "a heart shape or couple in love",
-        "fight": "two people fighting or boxing",
-        "race": "runners racing on a track",
-        "game": "people playing a game together",
-        "concert": "a singer performing for audience",
-        "theater": "actors on a theater stage",
-        "restaurant": "people dining at restaurant tables",
-        "cafe": "people sitting at cafe with coffee",
-        "hospital": "hospital building with ambulance",
-        "school": "school building with students",
-        "office": "office interior with desks and computers",
-        "airport": "airport terminal with planes",
-        "station": "train or bus station building",
-        "beach": "beach scene with sand, water, and umbrellas",
-        "park": "park with trees, benches, and paths",
-        "gym": "gym interior with exercise equipment",
-        "library": "library with bookshelves and reading area",
-        "museum": "museum interior with art and exhibits",
-        "zoo": "zoo with various animals in enclosures",
-        "circus": "circus tent with performers",
-        "birthday": "birthday cake with candles and celebration",
-        "christmas": "christmas tree with presents and decorations",
-        "halloween": "halloween pumpkin and spooky decorations",
-        "graduation": "graduate in cap and gown with diploma",
-        "funeral": "sad funeral scene with flowers",
-        "ceremony": "formal ceremony with people gathered",
-        # Etkileşim kelimeleri - 2+ kişi gerekli
-        "share": "two people sharing food, one giving half to other",
-        "help": "one person helping another person stand up",
-        "give": "one person giving a gift box to another person",
-        "receive": "one person receiving a package from another",
-        "teach": "teacher at board explaining to students",
-        "learn": "student at desk studying with books",
-        "talk": "two people talking face to face",
-        "listen": "person listening carefully to another speaking",
-        "visit": "person knocking on door, being welcomed by another person",
-        "meet": "two people meeting and greeting each other",
-        "introduce": "one person introducing two others to each other",
-        "invite": "person handing invitation card to another",
-        "thank": "person bowing or expressing gratitude to another",
-        "apologize": "person apologizing with sorry expression to another",
-        "agree": "two people nodding and shaking hands",
-        "disagree": "two people with crossed arms facing each other",
-        "compete": "two people racing or competing against each other",
-        "cooperate": "two people working together on something",
-        "communicate": "two people exchanging speech bubbles",
-        # Mekan kelimeleri - binalar/manzara gerekli
-        "city": "city skyline with tall buildings and skyscrapers",
-        "town": "small town with houses and church steeple",
-        "village": "small village with cottages and countryside",
-        "street": "street view with buildings, sidewalk, and road",
-        "road": "long road stretching into distance with lanes",
-        "building": "tall modern building with many windows",
-        "house": "cozy house with roof, windows, and door",
-        "apartment": "apartment building with multiple floors and balconies",
-        "store": "store front with shop window and sign",
-        "shop": "small shop with products in window display",
-        "market": "outdoor market with stalls and vendors",
-        "mall": "large shopping mall interior with escalators",
-        "hotel": "hotel building with entrance and lobby",
-        "factory": "factory building with smokestacks",
-        "farm": "farm with barn, fields, and animals",
-        "garden": "beautiful garden with flowers and plants",
-        "forest": "dense forest with tall trees",
-        "mountain": "tall mountain with snow-capped peak",
-        "river": "flowing river with banks and water",
-        "lake": "calm lake surrounded by nature",
-        "ocean": "vast ocean with waves and horizon",
-        "island": "tropical island with palm trees in ocean",
-        # Yön kelimeleri - OK TABELASI şeklinde
-        "left": "a green arrow shape pointing to the left, arrow tip on left side, tail on right side",
-        "right": "a blue arrow shape pointing to the right, arrow tip on right side, tail on left side",
-        "straight": "a blue road sign with white arrow pointing STRAIGHT ahead UP",
-        "back": "a blue road sign with white U-turn arrow pointing backward",
-        "near": "a small house and a tree right next to each other, very close together",
-        "far": "a tiny house on left and tiny tree on right with huge empty space between them",
-        "stop": "a red octagonal STOP traffic sign on a pole",
-        "go": "a green traffic light glowing green for GO",
-        # Soyut/kavram kelimeleri
-        "single": "number 1 with one single apple next to it",
-        "double": "number 2 with two identical red apples side by side",
-        "world": "3D planet Earth globe showing blue oceans and green continents",
-        "stamp": "a single colorful postage stamp, small square with perforated edges, showing a flower design",
-        "postcard": "a rectangular postcard with beach photo on front, address lines visible on back side",
-        "square": "a European city square plaza with fountain and buildings around",
-        "center": "a red target bullseye with arrow hitting the center",
-        "sign": "a wooden signpost with directional arrows at crossroads",
-        # Para/ödeme kelimeleri
-        "price": "a white price tag label showing $99",
-        "cash": "stack of green dollar bills and golden coins",
-        "card": "a blue credit card with chip and numbers",
-        "money": "fan of colorful paper currency bills spread out",
-        "currency": "different country money notes - dollar euro yen pound together",
-        # Seyahat işlem kelimeleri
-        "booking": "a computer screen showing hotel reservation confirmation with checkmark",
-        "reservation": "a restaurant table with RESERVED sign on it",
-        "cancel": "a ticket with big red X crossed over it",
-        "delay": "a person sitting and waiting at airport gate, looking at watch impatiently, clock showing late time",
-        "arrival": "airplane landing on runway with wheels touching ground",
-        "departure": "airplane taking off from runway into sky",
-        "connection": "a chain with two links connected together, metal chain links interlocked",
-        "transfer": "person walking between two train platforms with arrows",
-        "direct": "airplane with straight arrow from A to B, no stops",
-        "terminal": "inside airport terminal building with gates and passengers",
-        "border": "border checkpoint gate with barrier and guard booth",
-        "customs": "customs officer at desk checking luggage with X-ray machine",
-        "visa": "passport page with colorful visa stamp on it",
-        "insurance": "a shield icon with checkmark protecting a person silhouette",
-        "safety": "a yellow triangle warning sign with exclamation mark",
-        "rent": "a car with FOR RENT sign on windshield",
-        "hire": "a taxi with HIRE light on top",
-        "help": "a blue help desk counter with question mark sign",
-        "sightseeing": "tourist taking photo of Eiffel Tower landmark",
-        "souvenir": "a gift shop display with magnets, keychains, and small Eiffel tower figurines",
-        # Kişi kelimeleri
-        "tourist": "tourist wearing hat with camera around neck looking at map",
-        "guide": "tour guide holding umbrella up leading a group",
-        "passenger": "person sitting in airplane seat looking out window",
-        "driver": "taxi driver behind steering wheel in yellow cab",
-        "pilot": "airplane pilot in uniform sitting in cockpit with controls",
-        "travel": "airplane flying over world globe",
-        "trip": "family in car on road trip with mountains in background",
-        "tour": "open top tour bus with tourists taking photos",
-        # ===== YENİ 100 KELİME - TRAVEL =====
-        "exit": "person walking through open doorway to outside, arrow symbol pointing outward through door",
-        "entrance": "a building entrance door with ENTER arrow sign",
-        "local": "a local market street with traditional shops and vendors",
-        "foreign": "multiple country flags from different nations together",
-        "abroad": "airplane flying over a world globe map",
-        "overseas": "a large ship crossing the blue ocean",
-        "journey": "a long winding road through mountains into horizon",
-        "route": "a map with red dotted line showing travel route path",
-        "schedule": "a calendar planner with dates and times marked",
-        "timetable": "train station departure board showing grid of colored rows with clock symbols and train icons",
-        "delay": "a large clock showing late time with waiting person",
-        "return": "a curved arrow making U-turn going back",
-        "one-way": "a single straight arrow pointing one direction only",
-        "round-trip": "two arrows forming a circle, going and returning",
-        "class": "airplane seats showing different seat sections",
-        "economy": "cramped airplane economy class seats in rows",
-        "business": "comfortable wide business class airplane seat",
-        "first class": "luxurious first class airplane suite with bed",
-        "stay": "a cozy hotel room with bed and lamp",
-        "guest": "a hotel guest checking in at reception desk",
-        "host": "a friendly host welcoming guest at door",
-        "hostel": "hostel dormitory room with bunk beds",
-        "camping": "camping scene with tent in forest near fire",
-        "tent": "a colorful camping tent pitched in nature",
-        "caravan": "a caravan RV motorhome parked in nature",
-        "cruise": "a large white cruise ship on ocean",
-        "deck": "ship deck with wooden floor and railing ocean view",
-        "port": "a busy port with large ships and cranes",
-        "harbor": "a peaceful harbor with boats and yachts",
-        "cabin": "a ship cabin room with small bed and porthole window",
-        "crew": "ship crew members in uniform standing together",
-        "captain": "a ship captain in white uniform with hat",
-        "flight attendant": "a friendly flight attendant serving passengers",
-        "take-off": "airplane lifting off from runway into sky",
-        "landing": "airplane wheels touching down on runway landing",
-        "runway": "long airport runway with painted lines",
-        "trolley": "airport luggage trolley cart with suitcases",
-        "security": "airport security checkpoint with officers",
-        "metal detector": "airport metal detector security gate frame",
-        "liquid": "small travel liquid bottles in clear plastic bag",
-        "weight": "a luggage scale showing weight measurement",
-        "limit": "a speed limit sign showing maximum number",
-        "extra": "large suitcase with additional small bag placed on top of it, plus symbol floating nearby",
-        "fee": "hand giving money bills through service counter window, payment transaction",
-        "tax": "a tax document paper with percentage symbol",
-        "bill": "a restaurant bill receipt with itemized charges",
-        "receipt": "long paper strip coming out of cash register machine, small shopping bag beside it on counter",
-        "brochure": "a colorful travel brochure pamphlet with photos",
-        "itinerary": "a travel itinerary document with day by day plan",
-        "accommodation": "a hotel building exterior with rooms",
-        "destination": "a map pin marker on destination location",
-        "delayed": "frustrated person sitting at airport gate with luggage, large wall clock showing late time, airplane visible through window",
-        "exchange rate": "two hands exchanging different colored money bills, dollars trading for euros, currency swap",
-        "travel insurance": "insurance policy document with airplane symbol",
-        "landmark": "famous Eiffel Tower landmark monument",
-        "exploration": "explorer with compass and map discovering",
-        "voyage": "old sailing ship on long ocean voyage",
-        "excursion": "tour group on day trip excursion bus",
-        "guided tour": "tour guide with umbrella leading tourist group",
-        "package deal": "vacation suitcase with airplane icon, hotel icon, and palm tree icon floating around it as bundle",
-        "all-inclusive": "colorful wristband on wrist with small icons showing food plate, drink glass, and swimming pool",
-        "self-catering": "apartment kitchen with cooking facilities",
-        "half-board": "breakfast and dinner plates together",
-        "full-board": "breakfast lunch dinner three meals together",
-        "suite": "luxurious hotel suite room with living area",
-        "twin room": "hotel room with two separate single beds",
-        "amenities": "hotel bathroom items arranged neatly: folded white towels, small soap bars, tiny shampoo bottles on marble counter",
-        "facilities": "hotel facilities pool gym spa icons",
-        "service": "room service waiter with tray at door",
-        "staff": "hotel staff team receptionist bellboy maid",
-        "tip": "hand giving money tip to waiter",
-        "gratitude": "person bowing showing thank you gratitude",
-        "budget": "piggy bank with coins budget savings",
-        "luxury": "diamond ring jewelry luxury expensive items",
-        "resort": "tropical beach resort with palm trees pool",
-        "spa": "relaxing spa treatment massage scene",
-        "view": "window with beautiful scenic mountain view",
-        "scenery": "beautiful natural scenery mountains lake trees",
-        "landscape": "wide landscape panorama of countryside",
-        "nature": "nature scene with trees flowers river",
-        "adventure": "adventure sports climbing rafting exciting activities",
-        "hiking": "person hiking on mountain trail with backpack",
-        "trekking": "trekkers climbing steep mountain path",
-        "gear": "hiking gear boots backpack poles equipment",
-        "equipment": "travel equipment suitcase camera gear laid out",
-        "expedition": "expedition team with equipment in wilderness",
-        "discovery": "excited explorer with magnifying glass finding ancient golden artifact in cave, moment of discovery",
-        "culture": "cultural symbols music art dance traditions",
-        "heritage": "ancient heritage building historical architecture",
-        "tradition": "traditional cultural ceremony with costumes",
-        "customs": "border customs checkpoint with officer at desk examining passport and open suitcase with X-ray scanner",
-        "authentic": "authentic handmade traditional crafts",
-        "original": "artist hands crafting unique handmade pottery on wheel, one-of-a-kind authentic piece",
-        "modern": "modern glass skyscraper building city",
-        "ancient": "ancient ruins old temple crumbling stones",
-        "historical": "historical castle fortress medieval building",
-        "monument": "famous monument statue landmark",
-        "statue": "large bronze or stone statue sculpture",
-        # ===== YENİ TRAVEL KELİMELERİ =====
-        "environment": "beautiful natural environment with trees, river, mountains, and blue sky",
-        "climate": "four seasons shown together: sunny summer, orange fall, snowy winter, blooming spring",
-        "weather": "weather icons together: bright sun, white clouds, rain drops, lightning bolt",
-        "forecast": "TV weather forecast screen showing sun and cloud icons on a map",
-        "navigation": "GPS navigation screen on phone showing route with blue arrow on map",
-        "compass": "classic compass with red needle pointing north, cardinal directions marked",
-        "isolated": "tiny cabin alone on small island surrounded by vast ocean, very remote",
-        "wanderlust": "person with backpack dreaming of travel, thought bubble showing landmarks Eiffel Tower pyramids",
-        "vagabond": "free-spirited traveler with worn backpack walking on endless road",
-        "layover": "tired traveler sleeping on airport bench between flights, luggage beside",
-        "off the beaten track": "hidden jungle path through dense forest, adventure trail",
-        "jet lag": "exhausted traveler with dark circles, clock showing day and night times confused",
-        "pilgrimage": "pilgrim walking toward distant holy temple on mountain",
-        "embark": "passenger stepping onto ship gangway, beginning journey",
-        "disembark": "passengers walking down airplane stairs onto tarmac",
-        "traverse": "hiker crossing long suspension bridge over deep canyon",
-        "globetrotter": "traveler with passport full of stamps standing next to globe",
-        "nomad": "nomad with camel and tent in desert landscape",
-        "expeditionary": "expedition team with gear and equipment in wilderness base camp",
-        "uncharted": "old map with blank unexplored area marked with question marks",
-        "picturesque": "charming European village with colorful houses by lake, very scenic",
-        "panoramic": "wide panoramic mountain view stretching across horizon",
-        "breathtaking": "person standing amazed at edge of grand canyon, stunning view",
-        "majestic": "majestic snow-capped mountain peak towering above clouds",
-        "pristine": "pristine untouched white sand beach with crystal clear water",
-        "rugged": "rugged rocky mountain terrain with steep cliffs",
-        "verdant": "lush verdant green valley with dense forest and meadows",
-        "arid": "dry arid desert landscape with sand dunes and cracked earth",
-        "bustling": "bustling busy city street crowded with people and vendors",
-        "cosmopolitan": "diverse cosmopolitan city with people of different cultures, world flags",
-        "provincial": "quiet provincial countryside town with small shops and farms",
-        "rustic": "rustic old wooden barn and farmhouse in countryside",
-        "serene": "serene peaceful lake at dawn with perfect reflection, calm water",
-        "hospitality": "hotel staff warmly welcoming guest at entrance with open arms",
-        "concierge": "hotel concierge at desk helping guest with recommendations",
-        "valet": "valet parking attendant receiving car keys from guest",
-        "transport": "various transport modes together: bus, train, airplane, ship",
-        "ecotourism": "eco-friendly nature tour with guide showing wildlife to tourists",
-        "conservation": "park ranger protecting wildlife, animals in natural habitat",
-        "icon": "collection of famous world icons: Eiffel Tower, Statue of Liberty, Big Ben",
-        "relic": "ancient relic artifact in museum display case with spotlight",
-        "artifact": "archaeological artifact: old pottery and tools from excavation",
-        "exhibit": "museum exhibit display with paintings and sculptures",
-        "gallery": "art gallery interior with paintings on white walls, visitors viewing",
-        "masterpiece": "famous masterpiece painting in golden frame on museum wall",
-        "architecture": "stunning architecture: gothic cathedral with detailed facade",
-        "urban": "urban city scene with tall buildings, busy streets, traffic",
-        "rural": "peaceful rural countryside with farms, fields, and barns",
-        "suburban": "suburban neighborhood with houses, lawns, and quiet streets",
-        "commute": "person commuting to work on crowded subway train",
-        "hub": "major transport hub: large central station with many platforms",
-        "junction": "road junction where multiple roads meet and cross",
-        "interchange": "highway interchange with multiple levels of roads crossing",
-        "toll": "toll booth on highway with cars passing through barrier",
-        "fare": "bus fare ticket with price printed on it",
-        "voucher": "discount voucher coupon with dotted cut line",
-        "refund": "hand receiving money back, refund transaction at counter",
-        "regulation": "official regulation document with stamps and seals",
-        "visa waiver": "passport with visa-free entry stamp, no visa required",
-        "residency": "residency permit card next to house keys",
-        # ===== FOOD KELİMELERİ =====
-        "menu": "restaurant menu booklet open showing food items with pictures",
-        "salt": "white salt shaker with salt crystals pouring out",
-        "sugar": "sugar bowl with white sugar cubes and spoon",
-        "pepper": "black pepper shaker with ground pepper",
-        "oil": "olive oil bottle with golden oil and olives",
-        "bread": "fresh baked loaf of bread with golden crust",
-        "rice": "bowl of white steamed rice with chopsticks",
-        "pasta": "plate of spaghetti pasta with red tomato sauce",
-        "soup": "bowl of hot soup with steam rising, spoon beside",
-        "salad": "fresh green salad bowl with lettuce tomatoes cucumbers",
-        "meat": "raw red meat steak on cutting board",
-        "fish": "whole fresh fish on plate with lemon slices",
-        "chicken": "roasted golden chicken leg drumstick on plate",
-        "egg": "three brown eggs in nest, one cracked showing yolk",
-        "cheese": "yellow cheese wedge with holes, swiss cheese style",
-        "butter": "stick of yellow butter on butter dish with knife",
-        "milk": "glass bottle of white milk with full glass beside",
-        "fruit": "colorful fresh fruits: apple, orange, banana, grapes together",
-        "vegetable": "fresh vegetables: carrot, broccoli, tomato, pepper together",
-    }
+# Sözlükte olmayan kelimeler için kategori bazlı açıklama şablonları
+CATEGORY_DESCRIPTION_TEMPLATES = {
+    "everyday_objects": "{word}",  # Basit - kategori promptu detayları halleder
+    "food_drink": "{word}",
+    "travel": "a {word} travel item or object",
+    "nature_animals": "a {word}",
+    "sports_hobbies": "{word} sport or hobby",
+    "people_roles": "a {word} person",
+    "actions": "a person doing {word} action",
+    "adjectives": "something that looks {word}",
+    "emotions": "a large cartoon human face showing {word} emotion, expressive eyes and mouth",
+    # Eski kategoriler (geriye uyumluluk)
+    "food": "a {word} food dish on a plate",
+    "business": "a {word} office supply or item",
+    "technology": "a {word} electronic device",
+    "health": "a {word} medical item",
+    "sports": "a {word} sports equipment",
+    "music": "a {word} musical instrument",
+    "entertainment": "a {word} entertainment item",
+    "nature": "a {word} from nature",
+    "shopping": "a {word} product item",
+    "family": "a cartoon {word} person portrait",
+    "education": "a {word} school supply",
+    "verbs": "a person doing {word} action",
+}
 
-    if word.lower() in person_words:
-        return person_words[word.lower()]
-
-    # Özel NESNE kelimeleri - belirsizlik olmaması için detaylı açıklamalar
-    special_words = {
-        # Bilgisayar/Elektronik - MUTLAKA belirtilmeli
-        "mouse": "a black wireless computer mouse, PC mouse with scroll wheel and buttons, ergonomic design",
-        "charger": "a white phone charger with USB cable and wall adapter plug, smartphone charging cable",
-        "keyboard": "a black computer keyboard with keys, PC keyboard, QWERTY layout",
-        "monitor": "a flat screen computer monitor display, LCD screen on stand",
-        "laptop": "an open laptop computer showing screen and keyboard",
-        "printer": "an office inkjet printer machine, document printer",
-        "remote": "a distant mountain landscape viewed from far away, showing the concept of distance and remoteness, faraway scenery",
-        "remote control": "a classic TV remote control with number pad buttons, black plastic remote controller for television",
-
-        # Kırtasiye
-        "notebook": "a spiral notebook with colorful cover, school notebook with lines, NOT a laptop",
-        "pencil case": "a colorful fabric zipper pencil case open showing pencils and pens inside, school pencil pouch",
-        "pencil sharpener": "a classic small handheld pencil sharpener, simple single-hole plastic sharpener in bright color, traditional school supply NOT electric",
-        "can opener": "a manual can opener actively opening a metal food can, hands using the can opener tool on a tin can, kitchen action shot",
-        "kitchen sink": "a kitchen sink with faucet installed in a kitchen countertop, dirty dishes and sponge visible, window above sink, clearly in a kitchen",
-        "bathroom sink": "a bathroom sink with faucet under a mirror, toothbrush holder and soap dispenser visible, towel hanging nearby, clearly in a bathroom",
-        "book": "a closed hardcover book with colorful cover and spine",
-        "pen": "a blue ballpoint writing pen",
-        "pencil": "a yellow wooden pencil with eraser tip",
-        "eraser": "a pink rubber eraser for pencil",
-        "folder": "a colored paper folder for documents",
-        "binder": "a colorful blue 3-ring binder open showing metal rings inside, office ring binder with papers",
-
-        # Dikiş/Kişisel bakım
-        "cotton swab": "multiple Q-tip cotton swabs in a pile, white ear cleaning sticks with cotton on ends, bathroom cotton buds",
-        "seatbelt": "a car seatbelt buckled across a car seat, black fabric strap with red release button buckle, vehicle safety belt inside a car",
-        "clothespin": "a colorful plastic clothespin clipping a white towel on a clothesline rope, laundry peg in action hanging clothes",
-        "bus shelter": "a modern bus shelter with glass walls, bench inside, route map on wall, and people waiting, urban bus stop with advertisements",
-        "shampoo bottle": "a colorful PINK shampoo bottle with pump dispenser, hair care product with bubbles design on label",
-        "conditioner bottle": "a colorful PURPLE hair conditioner bottle with flip-top cap, smooth silky hair image on bottle",
-        "lotion bottle": "a WHITE body lotion bottle with pump, moisturizer cream with aloe vera leaf design, skincare product",
-        "bathroom trash can": "a small pedal bin trash can with foot pedal and lid, bathroom garbage bin next to toilet",
-        "name tag": "a plastic name badge with clip, Hello My Name Is written on it with blank space, ID badge with lanyard",
-        "shower mat": "a rectangular textured rubber bath mat lying flat on bathroom floor next to bathtub, colorful non-slip bathroom floor mat",
-        "coin": "a stack of silver and copper metal coins, real currency coins like quarters and pennies, NOT bitcoin NOT cryptocurrency",
-        "coffee table": "a wooden coffee table in front of a sofa in living room, with magazines and coffee cup on top, low rectangular table",
-        "dining table": "a large dining table with 4 chairs around it, plates and glasses set for dinner, family dining room",
-        "console table": "a narrow console table against a wall in entryway hallway, with vase and mirror above it, decorative entry table",
-        "side table": "a small round side table next to a sofa arm, with lamp and book on top, living room end table",
-
-        # TV furniture - ayırt edici
-        "tv stand": "a simple LOW wooden TV stand with flat screen TV on top, just a basic shelf unit for TV",
-        "tv console": "a WHITE modern TV console with drawers and cabinets, entertainment center with storage",
-        "media console": "a DARK BROWN wooden media console with open shelves showing DVD player and gaming console, living room",
-
-        # Mobilya - ayırt edici
-        "bookcase": "a tall wooden bookcase FILLED with colorful books on every shelf, library bookshelf",
-        "medicine cabinet": "an OPEN white medicine cabinet on bathroom wall showing medicine bottles and first aid supplies inside",
-        "kitchen cabinet": "wooden kitchen cabinets mounted on wall above kitchen counter with dishes visible through glass doors",
-        "wall hook": "a simple metal coat hook mounted on white wall with a jacket hanging from it, single wall mounted hook",
-        "key hook": "a small key holder rack on wall with multiple keys hanging from hooks, entryway key organizer",
-        "storage bin": "a large BLUE plastic storage bin with lid, household storage container",
-        "plastic bin": "a clear transparent plastic bin showing toys inside, see-through storage box",
-        "stackable bin": "three simple plastic storage containers stacked neatly, basic rectangular boxes with lids",
-        "sofa bed": "a sofa bed OPENED UP showing the mattress pulled out, convertible sleeper sofa in bed position",
-        "bed frame": "a metal bed frame WITHOUT mattress showing the slats and frame structure only",
-        "headboard": "an upholstered fabric headboard attached to wall behind a bed, just the headboard panel",
-        "utility cart": "a metal utility cart with multiple shelves holding tools and cleaning supplies, janitorial cart in hallway",
-        "rolling cart": "a 3-tier white kitchen rolling cart with wire baskets holding fruits and vegetables, home kitchen organizer",
-        "serving cart": "a gold metal bar cart with 4 wheels, two glass shelves holding wine bottles and cocktail glasses, front view showing all wheels",
-        "room divider": "a 3-panel wooden room divider with fabric panels, standing folded in living room separating space, decorative partition",
-        "folding screen": "a traditional Japanese style 4-panel folding screen with cherry blossom design, decorative privacy screen",
-        "shelf unit": "a tall wooden shelf unit with 5 shelves holding books, plants, and decorative items, freestanding bookshelf in living room",
-        "wall shelf": "a wooden wall shelf mounted on wall with L-shaped metal brackets, holding framed photos and small plants, clearly attached to wall with visible bracket supports",
-        "floating shelf": "a modern floating shelf with NO visible brackets or supports, white minimalist shelf appearing to float on wall, holding decorative vases and candles",
-        "floor lamp": "a tall standing floor lamp next to a sofa in living room, arc floor lamp with shade illuminating the room, full height lamp standing on floor",
-        "paper towel roll": "a large kitchen paper towel roll on a vertical metal holder stand, white absorbent paper towels in kitchen",
-        "tissue roll": "a white toilet paper roll on a bathroom wall holder, simple toilet tissue roll mounted on wall",
-        "sewing kit": "an open travel sewing kit box showing colorful thread spools, needles, scissors, buttons, and thimble inside",
-        "needle": "a close-up of a silver metal sewing needle with a small hole at one end and sharp point at other end, simple hand sewing needle",
-        "hair tie": "colorful elastic hair ties scrunchies, multiple hair bands in different colors, hair rubber bands",
-
-        # Mutfak
-        "container": "a large red metal shipping container, cargo container used for transport, industrial freight container box",
-        "glass": "a clear drinking glass, water glass tumbler",
-        "mug": "a ceramic coffee mug with handle",
-        "cup": "a ceramic tea cup with saucer",
-        "bowl": "a ceramic soup bowl, round deep bowl",
-        "plate": "a white ceramic dinner plate",
-        "pot": "a metal cooking pot with lid and handles",
-        "pan": "a black frying pan with long handle, skillet",
-        "kettle": "an electric kettle for boiling water",
-
-        # Ev eşyaları
-        "iron": "a clothes iron for ironing, steam iron appliance, NOT metal material",
-        "fan": "an electric standing fan with blades, room cooling fan",
-        "lamp": "a table lamp with lampshade, bedside lamp",
-        "mirror": "a rectangular wall mirror with frame",
-        "curtain": "elegant window curtains on both sides of a bright window, living room drapes with daylight coming through",
-        "drawer": "an open wooden drawer pulled out from a dresser, showing inside storage space with handle",
-        "pillow": "a white fluffy bed pillow",
-        "blanket": "a soft cozy blanket, bed blanket with pattern",
-        "towel": "a folded bath towel, soft cotton towel",
-        "rug": "a colorful floor rug, decorative carpet",
-        "room": "a cozy living room interior with sofa, coffee table, lamp, window with curtains, and rug on floor",
-
-        # Giyim
-        "belt": "brown leather waist strap with silver buckle for pants, fashion accessory worn with trousers, wardrobe item",
-        "watch": "a wristwatch on display, analog watch with band",
-        "glasses": "eyeglasses, reading glasses with frames",
-        "sandal": "bright red and blue summer flip flops sandals, colorful beach footwear with straps",
-        "sandals": "bright red and blue summer flip flops sandals pair, colorful beach footwear",
-
-        # Mekanlar/Binalar
-        "balcony": "a balcony attached to apartment building with flower pots, railing, and outdoor furniture, view from outside",
-        "garage": "a house garage with car inside, open garage door showing vehicle and tools on wall",
-        "cafe": "a cozy coffee shop interior with wooden tables, chairs, coffee cups, and warm lighting, inviting atmosphere",
-        "bus stop": "a bus stop shelter with bench, glass walls, and route sign, waiting area on sidewalk",
-        "park bench": "a classic GREEN painted wooden park bench on grass with trees in background, outdoor garden bench",
-        "street bench": "a modern metal and wood bench on concrete sidewalk next to a street lamp and buildings",
-        "crosswalk": "a pedestrian zebra crossing on asphalt road with white stripes, cars stopped at traffic light",
-        "elevator": "an open elevator with metal doors, inside view showing buttons panel and handrail",
-        "staircase": "wooden indoor staircase with handrail in a house, stairs going up",
-        "stairs": "concrete outdoor stairs with metal handrail, steps going up",
-        "airport": "an airport terminal building exterior with control tower, planes parked at gates",
-        "train station": "a train station platform with train arriving, roof shelter and passengers waiting",
-
-        # Aletler
-        "screwdriver": "a yellow and black Phillips head screwdriver tool, cross-head screwdriver",
-
-        # Araçlar
-        "car": "a sedan car automobile, passenger vehicle",
-        "bus": "a public transit bus, city bus",
-        "truck": "a pickup truck vehicle",
-        "bicycle": "a bicycle bike with two wheels",
-
-        # Mekanlar
-        "sidewalk": "a gray concrete sidewalk path with trees and buildings on the side, pedestrian walkway in a city",
-        "store": "a cute small retail shop building exterior with red awning, glass door, display window showing colorful products inside, brick facade",
-
-        # Mutfak eşyaları
-        "spoon": "ONE single silver metal tablespoon lying flat, just one spoon not two, eating utensil",
-
-        # Elektronik aksesuarlar
-        "earphones": "white wired earphones earbuds with cable and 3.5mm jack plug, in-ear headphones",
-
-        # Aletler
-        "flashlight": "a black handheld flashlight torch, cylindrical LED flashlight with on/off button",
-
-        # Diğer belirsiz kelimeler
-        "map": "a large unfolded paper map showing city streets and landmarks",
-        "ticket": "a paper ticket or boarding pass",
-        "passport": "a passport booklet document with cover",
-        "suitcase": "a travel suitcase luggage bag with wheels",
-        "camera": "a digital photo camera, DSLR camera",
-        "phone": "a smartphone mobile phone, iPhone style",
-        "key": "a metal door key, house key",
-        "keys": "a set of metal keys on keyring",
-        "coin": "gold and silver coins, money coins",
-        "stamp": "a colorful postage stamp",
-        "button": "clothing buttons, shirt buttons, sewing buttons",
-        "switch": "a light switch on wall, electrical switch",
-        "plug": "an electrical plug, power plug",
-        "battery": "AA batteries, cylindrical batteries",
-        "bulb": "a light bulb, LED bulb glowing",
-        "light bulb": "a light bulb, LED bulb glowing",
-    }
+# Kaynak öncelik sırası (ilk bulunan kazanır)
+DESCRIPTION_SOURCES = [
+    ("distinctive", DISTINCTIVE_DESCRIPTIONS),
+    ("person_words", PERSON_WORDS),
+    ("special_words", SPECIAL_WORDS),
+]
+
+def build_description_index() -> dict:
+    """Tüm manuel açıklamaları tek sözlükte birleştir: kelime -> (açıklama, kaynak)"""
+    index = {}
+    for source, descriptions in DESCRIPTION_SOURCES:
+        for word, description in descriptions.items():
+            index.setdefault(word.lower(), (description, source))
+    return index
+
+# Başlangıçta bir kez kurulur
+MANUAL_DESCRIPTIONS = build_description_index()
+MANUAL_SOURCES = {source for source, _ in DESCRIPTION_SOURCES}
+
+def resolve_description(word: str, category: str) -> tuple:
+    """Gemini'siz açıklama ve kaynağını döndür: (açıklama, kaynak)"""
+    entry = MANUAL_DESCRIPTIONS.get(word.lower())
+    if entry:
+        return entry
+
+    template = CATEGORY_DESCRIPTION_TEMPLATES.get(category)
+    if template:
+        return template.format(word=word), "category_template"
+    return f"a {word}", "default"
 
-    if word.lower() in special_words:
-        return special_words[word.lower()]
-
-    templates = {
-        "everyday_objects": f"{word}",  # Basit - kategori promptu detayları halleder
-        "food_drink": f"{word}",
-        "travel": f"a {word} travel item or object",
-        "nature_animals": f"a {word}",
-        "sports_hobbies": f"{word} sport or hobby",
-        "people_roles": f"a {word} person",
-        "actions": f"a person doing {word} action",
-        "adjectives": f"something that looks {word}",
-        "emotions": f"a large cartoon human face showing {word} emotion, expressive eyes and mouth",
-        # Eski kategoriler (geriye uyumluluk)
-        "food": f"a {word} food dish on a plate",
-        "business": f"a {word} office supply or item",
-        "technology": f"a {word} electronic device",
-        "health": f"a {word} medical item",
-        "sports": f"a {word} sports equipment",
-        "music": f"a {word} musical instrument",
-        "entertainment": f"a {word} entertainment item",
-        "nature": f"a {word} from nature",
-        "shopping": f"a {word} product item",
-        "family": f"a cartoon {word} person portrait",
-        "education": f"a {word} school supply",
-        "verbs": f"a person doing {word} action",
-    }
-    return templates.get(category, f"a {word}")
+def get_fallback_description(word: str, category: str) -> str:
+    """Gemini kullanılamadığında kategori bazlı açıklama"""
+    return resolve_description(word, category)[0]
 
 def has_manual_prompt(word: str) -> bool:
     """Kelimenin manuel promptu var mı kontrol et"""
-    # 1. DISTINCTIVE_DESCRIPTIONS kontrol (en yüksek öncelik)
-    if word.lower() in DISTINCTIVE_DESCRIPTIONS:
-        return True
-    word_lower = word.lower()
-    # get_fallback_description içindeki sözlükleri kontrol et
-    # Bu fonksiyon person_words ve special_words'de kelime varsa True döner
-    test_desc = get_fallback_description(word, "test")
-    # Eğer generic template döndüyse (kelimeyi içeriyorsa) manuel prompt yok demektir
-    if f"a {word_lower}" in test_desc.lower() and ("item" in test_desc or "object" in test_desc):
-        return False
-    return True
-
-def get_word_description(word: str, category: str) -> str:
-    """Kelime açıklaması al - önce DISTINCTIVE_DESCRIPTIONS, sonra manuel, sonra Gemini"""
-
-    # 1. ÖNCE: DISTINCTIVE_DESCRIPTIONS kontrol (en yüksek öncelik)
-    if word.lower() in DISTINCTIVE_DESCRIPTIONS:
-        return DISTINCTIVE_DESCRIPTIONS[word.lower()]
-
-    # 2. Sonra manuel prompt var mı kontrol et (person_words, special_words)
-    if has_manual_prompt(word):
-        return get_fallback_description(word, category)
+    return word.lower() in MANUAL_DESCRIPTIONS
 
-    prompt = f"""You create educational illustrations for a vocabulary app. Users must understand the word INSTANTLY from the image.
+# Gemini açıklama promptu - tekli ve toplu istekler aynı kuralları kullanır
+GEMINI_INTRO = "You create educational illustrations for a vocabulary app. Users must understand the word INSTANTLY from the image."
 
-Word: "{word}"
-Category: "{category}"
-
-VISUALIZATION TYPES - Choose the right one:
+GEMINI_RULES = """VISUALIZATION TYPES - Choose the right one:
 
 1. PLACE/LOCATION (city, beach, airport, office, park):
    - MUST show buildings, landscape, or environment
@@ -810,55 +972,239 @@ Rules:
 - Make meaning OBVIOUS - a child should understand instantly
 - Be SPECIFIC about visual elements
 - Places MUST show environment/buildings
-- Interactions MUST show multiple people
+- Interactions MUST show multiple people"""
 
-Reply with ONLY visual description (max 25 words).
-
-Examples:
+GEMINI_EXAMPLES = """Examples:
 - "city": Skyline view with tall buildings, skyscrapers, and urban landscape
 - "share": Two children sharing a cookie, one handing half to the other
 - "help": One person reaching out hand to help another person stand up
 - "beach": Sandy beach with blue ocean waves, palm trees, and sunny sky
 - "wedding": Bride in white dress and groom in suit at altar with flowers
-- "doctor": Friendly doctor in white coat with stethoscope around neck
+- "doctor": Friendly doctor in white coat with stethoscope around neck"""
+
+GEMINI_SINGLE_PROMPT = GEMINI_INTRO + """
+
+Word: "{word}"
+Category: "{category}"
+
+""" + GEMINI_RULES + """
+
+Reply with ONLY visual description (max 25 words).
+
+""" + GEMINI_EXAMPLES + """
 
 Describe "{word}" ({category}):"""
 
+GEMINI_BATCH_PROMPT = GEMINI_INTRO + """
+
+Category: "{category}"
+Words:
+{word_lines}
+
+""" + GEMINI_RULES + """
+
+Return a JSON object that maps EVERY word above, spelled exactly as given, to its visual description (max 25 words each). No other keys, no commentary.
+
+""" + GEMINI_EXAMPLES + """
+
+Describe each word ({category}) as JSON:"""
+
+GEMINI_BATCH_SIZE = 20              # Tek istekte gönderilen kelime (--describe-batch, 1 = kapalı)
+GEMINI_BATCH_TOKENS_PER_WORD = 80   # Toplu yanıt için kelime başına token bütçesi
+GEMINI_MAX_DESCRIPTION_WORDS = 40   # Bundan uzun açıklama bozuk sayılır
+
+# Açıklama önbelleği - prompt metni değişince hash değişir, eski kayıtlar kullanılmaz
+DESCRIPTION_PROMPT_HASH = prompt_hash(GEMINI_SINGLE_PROMPT, GEMINI_BATCH_PROMPT)
+DESCRIPTION_CACHE_TTL_DAYS = 90
+DESCRIPTION_CACHE_MAX_ENTRIES = 50000
+
+_description_cache = None
+_description_cache_lock = threading.Lock()
+
+def get_description_cache() -> DescriptionCache:
+    """Açıklama önbelleğini (ilk çağrıda) aç"""
+    global _description_cache
+    with _description_cache_lock:
+        if _description_cache is None:
+            _description_cache = DescriptionCache(
+                DESCRIPTION_CACHE_FILE,
+                ttl=DESCRIPTION_CACHE_TTL_DAYS * 24 * 3600,
+                max_entries=DESCRIPTION_CACHE_MAX_ENTRIES,
+            )
+        return _description_cache
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Boyutlandırma süreç havuzunu (ilk çağrıda) aç"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=RENDITION_PROCESSES)
+        return _process_pool
+
+def shutdown_process_pool():
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown()
+            _process_pool = None
+
+def get_manual_description(word: str, category: str) -> str:
+    """Manuel açıklama varsa döndür (DISTINCTIVE_DESCRIPTIONS, sonra person/special words)"""
+    entry = MANUAL_DESCRIPTIONS.get(word.lower())
+    return entry[0] if entry else None
+
+def call_gemini(prompt: str, generation_config: dict, deadline: float = None) -> str:
+    """Gemini'ye prompt gönder, yanıt metnini döndür (hata durumunda None)"""
     headers = {"Content-Type": "application/json"}
 
     payload = {
         "contents": [{"parts": [{"text": prompt}]}],
-        "generationConfig": {"temperature": 0.3, "maxOutputTokens": 200}
+        "generationConfig": generation_config
     }
 
     url = f"{GEMINI_API_URL}?key={GEMINI_API_KEY}"
 
-    for attempt in range(GEMINI_MAX_RETRIES):
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+    try:
+        response = limited_request("gemini", "POST", url, max_retries=GEMINI_MAX_RETRIES,
+                                   deadline=deadline, headers=headers, json=payload)
 
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("candidates"):
-                    text = data["candidates"][0]["content"]["parts"][0]["text"]
-                    return text.strip()
-            elif response.status_code == 429:
-                # Rate limit - wait and retry
-                if attempt < GEMINI_MAX_RETRIES - 1:
-                    time.sleep(GEMINI_RETRY_DELAY * (attempt + 1))
-                    continue
-                else:
-                    print(f"  Gemini rate limit", end="")
-            else:
-                print(f"  Gemini {response.status_code}", end="")
-                break
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("candidates"):
+                return data["candidates"][0]["content"]["parts"][0]["text"]
+        elif response.status_code in RATE_LIMITED_STATUSES:
+            print("  Gemini rate limit", end="")
+        else:
+            print(f"  Gemini {response.status_code}", end="")
 
-        except Exception as e:
-            print(f"  Gemini err", end="")
-            break
+    except DeadlineExceeded:
+        print("  Gemini zaman asimi", end="")
+    except Exception as e:
+        print(f"  Gemini hata: {type(e).__name__}: {e}", end="")
+
+    return None
+
+def request_gemini_description(word: str, category: str, deadline: float = None) -> str:
+    """Tek kelime için Gemini'den açıklama iste, sonucu önbelleğe yaz"""
+    prompt = GEMINI_SINGLE_PROMPT.format(word=word, category=category)
+    text = call_gemini(prompt, {"temperature": 0.3, "maxOutputTokens": 200}, deadline)
+    if not text:
+        return None
+
+    description = text.strip()
+    get_description_cache().put(word, category, DESCRIPTION_PROMPT_HASH, description)
+    return description
+
+def request_gemini_descriptions_batch(words: list, category: str, deadline: float = None) -> dict:
+    """Aynı kategorideki kelimeler için tek istekte JSON açıklama iste.
+
+    Sadece geçerli açıklamalar döner; eksik veya bozuk kelimeler sonuçta yer almaz.
+    """
+    prompt = GEMINI_BATCH_PROMPT.format(
+        category=category,
+        word_lines="\n".join(f"- {word}" for word in words),
+    )
+    text = call_gemini(prompt, {
+        "temperature": 0.3,
+        "maxOutputTokens": 200 + GEMINI_BATCH_TOKENS_PER_WORD * len(words),
+        "responseMimeType": "application/json",
+        "thinkingConfig": {"thinkingBudget": 0},
+    }, deadline)
+    if not text:
+        return {}
+
+    try:
+        data = json.loads(text)
+    except ValueError:
+        print(f"  Gemini toplu yanit JSON degil ({len(words)} kelime)", end="")
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    # Büyük/küçük harf farkını tolere et, bozuk değerleri at
+    answers = {str(key).strip().lower(): value for key, value in data.items()}
+    descriptions = {}
+    for word in words:
+        value = answers.get(word.lower())
+        if not isinstance(value, str):
+            continue
+        value = value.strip()
+        if value and len(value.split()) <= GEMINI_MAX_DESCRIPTION_WORDS:
+            descriptions[word] = value
+    return descriptions
+
+def describe_word(word: str, category: str, deadline: float = None) -> tuple:
+    """Kelime açıklaması ve kaynağı: (açıklama, kaynak)
+
+    Sıra: manuel sözlükler (distinctive, person_words, special_words),
+    önbellek, Gemini, en son kategori şablonu. Gemini işin süre bütçesi
+    (`deadline`) dolduğu için yanıt vermediyse şablon kullanılmaz, (None, None)
+    döner: describe aşaması zaman aşımı sayılır ve kelime yeniden deneme
+    kuyruğuna girer (şablonla üretilen görsel --stale ile yakalanamaz).
+    """
+    entry = MANUAL_DESCRIPTIONS.get(word.lower())
+    if entry:
+        return entry
+
+    cached = get_description_cache().get(word, category, DESCRIPTION_PROMPT_HASH)
+    if cached:
+        return cached, "cache"
+
+    description = request_gemini_description(word, category, deadline)
+    if description:
+        return description, "gemini"
+    if time_left(deadline) <= 0:
+        return None, None
 
     # Fallback: use category-specific default descriptions
-    return get_fallback_description(word, category)
+    return resolve_description(word, category)
+
+def get_word_description(word: str, category: str) -> str:
+    """Kelime açıklaması al - önce DISTINCTIVE_DESCRIPTIONS, sonra manuel, sonra Gemini"""
+    return describe_word(word, category)[0]
+
+def get_word_descriptions_batch(items: list, batch_size: int = GEMINI_BATCH_SIZE,
+                                deadline: float = None) -> list:
+    """(kelime, kategori) listesi için [(açıklama, kaynak), ...] döndür.
+
+    Manuel açıklaması veya önbellekte kaydı olanlar Gemini'ye gitmez; kalanlar
+    kategoriye göre gruplanıp `batch_size`'lık isteklerle sorulur. Toplu
+    yanıtta eksik veya bozuk gelen kelimeler tek tek sorulur.
+    """
+    cache = get_description_cache()
+    results = []
+    for word, category in items:
+        entry = MANUAL_DESCRIPTIONS.get(word.lower())
+        if not entry:
+            cached = cache.get(word, category, DESCRIPTION_PROMPT_HASH)
+            entry = (cached, "cache") if cached else None
+        results.append(entry)
+
+    by_category = {}
+    for i, (word, category) in enumerate(items):
+        if not results[i]:
+            by_category.setdefault(category, []).append(i)
+
+    for category, indexes in by_category.items():
+        for start in range(0, len(indexes), max(1, batch_size)):
+            chunk = indexes[start:start + max(1, batch_size)]
+            words = list(dict.fromkeys(items[i][0] for i in chunk))
+            answers = (request_gemini_descriptions_batch(words, category, deadline)
+                       if len(words) > 1 else {})
+            for word, description in answers.items():
+                cache.put(word, category, DESCRIPTION_PROMPT_HASH, description)
+            for i in chunk:
+                description = answers.get(items[i][0])
+                results[i] = (description, "gemini_batch") if description else None
+
+    for i, (word, category) in enumerate(items):
+        if not results[i]:
+            results[i] = describe_word(word, category, deadline)
+
+    return results
 
 def get_fal_headers():
     return {
@@ -866,20 +1212,20 @@ def get_fal_headers():
         "Content-Type": "application/json"
     }
 
-def submit_image_request(word: str, description: str, category: str = "default") -> tuple:
-    """fal.ai'ye görsel isteği gönder"""
+def submit_image_request(word: str, description: str, category: str = "default",
+                         webhook_url: str = None, deadline: float = None) -> tuple:
+    """fal.ai'ye görsel isteği gönder (webhook_url verilirse sonuç oraya bildirilir)"""
 
     # Kategori bazlı prompt kullan
     prompt = get_image_prompt(word, category, description)
 
-    payload = {
-        "prompt": prompt,
-        "image_size": "square",
-        "num_images": 1
-    }
+    payload = {"prompt": prompt, **FAL_IMAGE_PARAMS}
 
     try:
-        response = requests.post(FAL_API_URL, headers=get_fal_headers(), json=payload)
+        params = {"fal_webhook": webhook_url} if webhook_url else None
+        response = limited_request("fal", "POST", FAL_API_URL, max_retries=FAL_MAX_RETRIES,
+                                   deadline=deadline, headers=get_fal_headers(),
+                                   json=payload, params=params)
 
         if response.status_code == 200:
             data = response.json()
@@ -887,17 +1233,44 @@ def submit_image_request(word: str, description: str, category: str = "default")
         else:
             print(f"  fal.ai Hatasi: {response.status_code}", end="")
 
+    except DeadlineExceeded:
+        print("  fal.ai zaman asimi", end="")
     except Exception as e:
         print(f"  fal.ai Hata: {e}", end="")
 
     return None, None
 
-def wait_for_image(response_url: str, max_wait: int = 120) -> str:
-    """Görsel tamamlanana kadar bekle"""
-
-    for _ in range(max_wait):
+def wait_for_image(response_url: str, max_wait: float = 120, timings: dict = None,
+                   deadline: float = None) -> str:
+    """Görsel tamamlanana kadar en fazla `max_wait` saniye (ve `deadline`'a kadar) bekle.
+
+    `timings` verilirse işin IN_QUEUE ve IN_PROGRESS durumlarında geçirdiği
+    süreler (sn) içine yazılır; durum henüz bilinmiyorsa süre kuyruğa sayılır.
+    """
+    if timings is None:
+        timings = {}
+    timings.setdefault("in_queue", 0.0)
+    timings.setdefault("in_progress", 0.0)
+    status = "IN_QUEUE"
+    last_check = time.monotonic()
+
+    def account():
+        nonlocal last_check
+        now = time.monotonic()
+        key = "in_progress" if status == "IN_PROGRESS" else "in_queue"
+        timings[key] += now - last_check
+        last_check = now
+
+    end = time.monotonic() + min(max_wait, time_left(deadline))
+
+    def pause():
+        time.sleep(max(0.0, min(1.0, end - time.monotonic())))
+
+    while time.monotonic() < end:
         try:
-            response = requests.get(response_url, headers=get_fal_headers())
+            response = limited_request("fal", "GET", response_url, deadline=end,
+                                       headers=get_fal_headers())
+            account()
 
             if response.status_code == 200:
                 data = response.json()
@@ -906,144 +1279,1622 @@ def wait_for_image(response_url: str, max_wait: int = 120) -> str:
                 if images and len(images) > 0:
                     return images[0].get("url")
 
-                status = data.get("status")
+                status = data.get("status") or status
                 if status in ["IN_QUEUE", "IN_PROGRESS"]:
-                    time.sleep(1)
+                    pause()
                     continue
                 elif status == "FAILED":
                     return None
+            elif response.status_code in (404, 410):
+                # İş fal.ai'de yok (süresi dolmuş) - beklemenin anlamı yok
+                return None
             else:
-                time.sleep(1)
+                pause()
 
-        except Exception as e:
-            time.sleep(1)
+        except Exception:   # Geçici ağ hatası - sonraki sorguda tekrar denenir
+            account()
+            pause()
 
     return None
 
-def download_image(url: str) -> bytes:
-    """Görseli URL'den indir"""
+def get_status_url(response_url: str) -> str:
+    """fal.ai kuyruk durumu adresi: <response_url>/status"""
+    return response_url.rstrip("/") + "/status"
+
+def check_fal_job(job: dict) -> tuple:
+    """fal.ai işinin durumuna tek sefer bak: (durum, görsel_url)
+
+    Durum IN_QUEUE / IN_PROGRESS / COMPLETED / FAILED; geçici hatada None.
+    """
+    response = limited_request("fal", "GET", get_status_url(job["response_url"]),
+                               deadline=job.get("deadline"), headers=get_fal_headers())
+    if response.status_code in (404, 410):
+        return "FAILED", None
+    if response.status_code not in (200, 202):
+        return None, None
+
+    status = response.json().get("status")
+    if status != "COMPLETED":
+        return status, None
+
+    response = limited_request("fal", "GET", job["response_url"],
+                               deadline=job.get("deadline"), headers=get_fal_headers())
+    if response.status_code != 200:
+        return "FAILED", None
+    images = response.json().get("images")
+    if images:
+        return "COMPLETED", images[0].get("url")
+    return "FAILED", None
+
+def download_image(url: str, filename: str, deadline: float = None) -> dict:
+    """Görseli parça parça geçici dosyaya indir, indirirken SHA-256 hesapla.
+
+    Dönen sözlük: {"tmp_path", "size", "sha256"}. Dosya save_to_store ile
+    depoya taşınana kadar OUTPUT_FOLDER'da ".part" uzantılı durur;
+    böylece yarım inen dosya hiçbir zaman bitmiş görsel gibi görünmez.
+    `deadline` geçerse indirme yarıda bırakılır.
+    """
+    OUTPUT_FOLDER.mkdir(parents=True, exist_ok=True)
+    tmp_path = None
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        return response.content
+        with HTTP.get(url, timeout=request_timeout(deadline), stream=True) as response:
+            response.raise_for_status()
+            digest = hashlib.sha256()
+            size = 0
+            with tempfile.NamedTemporaryFile('wb', dir=OUTPUT_FOLDER, prefix=f".{filename}.",
+                                             suffix=PART_SUFFIX, delete=False) as f:
+                tmp_path = f.name
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    if time_left(deadline) <= 0:
+                        raise DeadlineExceeded("indirme suresi doldu")
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+        if size == 0:
+            raise ValueError("bos yanit")
+        return {"tmp_path": tmp_path, "size": size, "sha256": digest.hexdigest()}
     except Exception as e:
         print(f"  Indirme hatasi: {e}", end="")
+        if tmp_path:
+            Path(tmp_path).unlink(missing_ok=True)
         return None
 
-def save_to_local(image_data: bytes, filename: str) -> str:
-    """Görseli yerel klasöre kaydet"""
-
-    # Klasör yoksa oluştur
-    OUTPUT_FOLDER.mkdir(parents=True, exist_ok=True)
-
-    filepath = OUTPUT_FOLDER / filename
-
+def file_sha256(path) -> str:
+    """Dosyanın SHA-256 özeti (parça parça okunur)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+_image_store = None
+_image_store_lock = threading.Lock()
+
+def get_image_store() -> ImageStore:
+    """İçerik adresli görsel deposunu (ilk çağrıda) aç"""
+    global _image_store
+    with _image_store_lock:
+        if _image_store is None:
+            _image_store = ImageStore(IMAGE_STORE_FOLDER)
+        return _image_store
+
+def save_to_store(tmp_path: str, sha256: str) -> str:
+    """İndirilen geçici dosyayı içerik adresli depoya atomik olarak taşı"""
     try:
-        with open(filepath, 'wb') as f:
-            f.write(image_data)
-        return str(filepath)
+        return get_image_store().put(tmp_path, sha256)
     except Exception as e:
         print(f"  Kaydetme hatasi: {e}", end="")
+        Path(tmp_path).unlink(missing_ok=True)
         return None
 
-def generate_single_image(word: str, category: str, word_id: str) -> str:
-    """Tek bir kelime için görsel üret ve Bunny'ye yükle"""
-
-    # 1. Gemini'den açıklama al
-    description = get_word_description(word, category)
+def prepare_image_store(manifest: GenerationManifest) -> SlugIndex:
+    """Uygulama adı dizinini kur, eski düz klasörü depoya taşı, çakışan adları düzelt"""
+    slugs = SlugIndex(manifest.entries)
+    migrated = migrate_flat_images(manifest, slugs)
+    if migrated:
+        print(f"{migrated} eski gorsel icerik adresli depoya tasindi ({IMAGE_STORE_FOLDER})")
+    for word_id, slug in slugs.slugs.items():
+        entry = manifest.entries.get(word_id)
+        if entry is not None and entry.get("slug") != slug:
+            manifest.set(word_id, dict(entry, slug=slug))
+    for name, owner, word_id in slugs.collisions:
+        print(f"  Ad cakismasi: {name} {owner} id'sine ait, {word_id} id'sine "
+              f"{slugs.slugs[word_id]} verildi")
+    return slugs
+
+def migrate_flat_images(manifest: GenerationManifest, slugs: SlugIndex) -> int:
+    """Düz OUTPUT_FOLDER'daki eski görselleri depoya taşı; eski dosya adı uygulama adı olur"""
+    store = get_image_store()
+    moved = set()
+    for word_id, entry in list(manifest.entries.items()):
+        path = Path(entry["path"])
+        if store.contains(path) or not path.is_file():
+            continue
+        sha256 = entry.get("sha256") or file_sha256(path)
+        stored = store.add_file(path, sha256)
+        migrated = {key: value for key, value in entry.items()
+                    if key not in ("renditions", "renditions_sha256")}  # Depoda yeniden üretilir
+        migrated.update(path=stored, size=os.stat(stored).st_size, sha256=sha256,
+                        slug=slugs.assign(word_id, entry.get("slug") or path.name))
+        manifest.set(word_id, migrated)
+        moved.add(path)
+    for path in moved:
+        path.unlink(missing_ok=True)
+    return len(moved)
+
+def bunny_request(method: str, url: str, **kwargs):
+    """Bunny Storage isteği; 429/503'te hız düşer, tekrar denemeyi yükleyici yapar"""
+    return limited_request("bunny", method, url, **kwargs)
+
+def get_bunny_publisher(endpoint: str = BUNNY_STORAGE_ENDPOINT) -> BunnyPublisher:
+    storage = BunnyStorage(bunny_request, endpoint, BUNNY_STORAGE_ZONE, BUNNY_STORAGE_PATH,
+                           BUNNY_API_KEY)
+    return BunnyPublisher(storage, BUNNY_CDN_URL)
+
+def upload_to_bunny(path: str, filename: str, endpoint: str = BUNNY_STORAGE_ENDPOINT) -> str:
+    """Tek dosyayı `filename` adıyla yükle, CDN adresini döndür (başarısızsa None)"""
+    publisher = get_bunny_publisher(endpoint)
+    return publisher.publish([{"name": filename, "path": path}], check_remote=False)[filename]
+
+def fill_file_hashes(manifest: GenerationManifest, word_ids: list) -> int:
+    """Eski kayıtlarda eksik görsel/boyut SHA-256'larını dosyadan hesapla (sürüm etiketi için)"""
+    filled = 0
+    for word_id in word_ids:
+        entry = manifest.entries[word_id]
+        renditions = entry.get("renditions") or {}
+        missing = [key for key, record in renditions.items() if not record.get("sha256")]
+        if entry.get("sha256") and not missing:
+            continue
+        update = {"sha256": entry.get("sha256") or file_sha256(entry["path"])}
+        if missing:
+            update["renditions"] = {key: dict(record, sha256=record.get("sha256")
+                                              or file_sha256(record["path"]))
+                                    for key, record in renditions.items()}
+        manifest.set(word_id, dict(entry, **update))
+        filled += 1
+    return filled
+
+def get_publish_files(entry: dict) -> list:
+    """Girişin CDN'e yüklenecek dosyaları, içerik sürümlü adlarla.
+
+    Sürüm etiketi görselin ve tüm boyutlarının özetinden çıkar:
+    "chair.<sürüm>.jpg", "chair.<sürüm>.card.webp". `key` "image" veya boyut adıdır.
+    """
+    renditions = sorted((entry.get("renditions") or {}).items())
+    version = content_version([entry["sha256"]] + [record["sha256"] for _, record in renditions])
+    files = [{"key": "image", "name": versioned_name(entry["slug"], version),
+              "path": entry["path"], "sha256": entry["sha256"]}]
+    for key, record in renditions:
+        files.append({"key": key, "name": versioned_name(entry["slug"], version, key),
+                      "path": record["path"], "sha256": record["sha256"]})
+    return files
+
+def get_cdn_names(entry: dict) -> set:
+    """Girişin manifestte kayıtlı CDN adreslerindeki dosya adları"""
+    urls = [entry.get("url")] + list((entry.get("rendition_urls") or {}).values())
+    return {unquote(url.rsplit("/", 1)[1]) for url in urls if url}
+
+def load_cdn_orphans() -> dict:
+    """Sahipsiz CDN dosyaları: {ad: ilk görüldüğü zaman}"""
+    try:
+        with open(CDN_ORPHANS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cdn_orphans(orphans: dict):
+    tmp_path = CDN_ORPHANS_FILE.with_name(CDN_ORPHANS_FILE.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(orphans, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, CDN_ORPHANS_FILE)
+
+def prune_cdn_orphans(publisher: BunnyPublisher, referenced: set,
+                      grace: float = CDN_ORPHAN_GRACE_DAYS * 24 * 3600) -> int:
+    """Hiçbir girişin kullanmadığı sürümlü dosyaları `grace` kadar sahipsiz kaldıktan sonra sil.
+
+    Eski sürümü paketlemiş uygulama sürümleri ve önbellekler bu süre
+    boyunca çalışmaya devam eder. Sahipsizlik zamanı CDN_ORPHANS_FILE'da tutulur.
+    """
+    now = time.time()
+    known = load_cdn_orphans()
+    orphans = {name: known.get(name, now) for name in publisher.orphans(referenced)}
+    expired = [name for name, since in orphans.items() if now - since >= grace]
+    deleted = publisher.prune(expired)
+    for name in deleted:
+        del orphans[name]
+    save_cdn_orphans(orphans)
+    if orphans:
+        print(f"{len(orphans)} eski surum silinmeyi bekliyor "
+              f"(sahipsiz kaldiktan {CDN_ORPHAN_GRACE_DAYS} gun sonra)")
+    return len(deleted)
+
+def publish_images(manifest: GenerationManifest, endpoint: str = BUNNY_STORAGE_ENDPOINT) -> int:
+    """Tüm görselleri ve boyutlarını Bunny.net'e içerik sürümlü adlarla yükle.
+
+    Adlar içerikle değiştiği için dosyalar CDN'de ve cihazlarda süresiz
+    önbelleklenebilir. Uzak checksum'ı yerel SHA-256 ile aynı olan
+    dosyalar atlanır. Girişin "url"/"rendition_urls" alanları tüm dosyaları
+    yüklenince yazılır ve uygulamanın {id: ad} haritası
+    (IMAGE_URLS_EXPORT_FILE) güncellenir; artık kullanılmayan eski sürümler
+    bekleme süresinden sonra silinir.
+
+    --queue modunda diğer süreçlerin girişleri de yayınlansın ve eski sürüm
+    sayılmasın diye manifest diskten yeniden okunur; tam okunamadıysa
+    (bozuk journal satırı) hiçbir dosya silinmez.
+    """
+    manifest.refresh()
+    word_ids = [word_id for word_id, entry in manifest.entries.items()
+                if entry.get("slug") and Path(entry["path"]).is_file()]
+    filled = fill_file_hashes(manifest, word_ids)
+    if filled:
+        print(f"{filled} eski kaydin dosya ozetleri hesaplandi")
+    files = [item for word_id in word_ids for item in get_publish_files(manifest.entries[word_id])]
+    publisher = get_bunny_publisher(endpoint)
+    print(f"\nBunny.net'e yayinlaniyor: {len(word_ids)} gorsel, {len(files)} dosya "
+          f"-> {publisher.storage.base_url}")
+    try:
+        urls = publisher.publish(files)
+    except Exception as e:
+        print(f"Bunny.net klasoru listelenemedi: {e}")
+        return 0
+
+    published = 0
+    for word_id in word_ids:
+        entry = manifest.entries[word_id]
+        items = get_publish_files(entry)
+        if any(urls.get(item["name"]) is None for item in items):
+            continue
+        update = {
+            "url": urls[items[0]["name"]],
+            "rendition_urls": {item["key"]: urls[item["name"]] for item in items[1:]},
+        }
+        if any(entry.get(field) != value for field, value in update.items()):
+            manifest.set(word_id, dict(entry, **update))
+        published += 1
+    print(f"CDN'de: {published}/{len(word_ids)} gorsel ({BUNNY_CDN_URL})")
+
+    # Bu arada yayınlayan diğer süreçlerin adresleri de dahil olsun
+    manifest.refresh()
+    if IMAGE_URLS_EXPORT_FILE.parent.is_dir():
+        count = write_url_export(IMAGE_URLS_EXPORT_FILE, BUNNY_CDN_URL, manifest.entries)
+        print(f"CDN adresleri: {count} gorsel -> {IMAGE_URLS_EXPORT_FILE}")
+
+    if manifest.skipped_lines:
+        print(f"Manifestte {manifest.skipped_lines} okunamayan satir var, "
+              f"eski surumler silinmedi")
+        print(publisher.status())
+        return published
+
+    # Yüklenemeyen girişlerin önceki sürümleri ve diğer süreçlerin henüz
+    # adresini yazmadığı yeni sürümler de kullanımda sayılır
+    referenced = {item["name"] for item in files}
+    for entry in manifest.entries.values():
+        referenced |= get_cdn_names(entry)
+        if entry.get("slug") and entry.get("sha256") and all(
+                record.get("sha256") for record in (entry.get("renditions") or {}).values()):
+            referenced |= {item["name"] for item in get_publish_files(entry)}
+    try:
+        prune_cdn_orphans(publisher, referenced)
+    except Exception as e:
+        print(f"Eski surumler temizlenemedi: {e}")
+    print(publisher.status())
+    return published
+
+def cdn_head(url: str) -> tuple:
+    """CDN adresine HEAD: (status_code, Content-Length, ETag)"""
+    response = limited_request("cdn", "HEAD", url, max_retries=3)
+    return (response.status_code, response.headers.get("Content-Length"),
+            response.headers.get("ETag"))
+
+def get_audit_items(word_id: str, entry: dict, cdn_url: str) -> list:
+    """Girişin CDN'deki dosyaları ve beklenen boyutları (adresler `cdn_url` altında)"""
+    files = [(entry.get("url"), entry.get("size"))]
+    for key, url in sorted((entry.get("rendition_urls") or {}).items()):
+        record = (entry.get("renditions") or {}).get(key) or {}
+        files.append((url, record.get("size")))
+    etags = entry.get("cdn_etags") or {}
+    items = []
+    for url, size in files:
+        if not url:
+            continue
+        name = unquote(url.rsplit("/", 1)[1])
+        items.append({"id": word_id, "name": name, "url": f"{cdn_url.rstrip('/')}/{quote(name)}",
+                      "size": size, "etag": etags.get(name)})
+    return items
+
+def audit_cdn(cdn_url: str = BUNNY_CDN_URL, endpoint: str = BUNNY_STORAGE_ENDPOINT):
+    """Yayınlanan tüm görselleri CDN'de denetle, fark raporunu CDN_AUDIT_REPORT_FILE'a yaz (--audit)
+
+    - eksik: CDN 404 dönüyor
+    - bayat: boyut manifesttekinden veya ETag ilk denetimde kaydedilenden farklı
+    - yayınlanmamış: words-for-images.json'da olup CDN adresi olmayan id'ler
+    - sahipsiz: storage'da olup hiçbir girişin kullanmadığı dosyalar
+    """
+    words = load_words()
+    manifest = open_manifest()
+    try:
+        items = []
+        for word_id, entry in manifest.entries.items():
+            items.extend(get_audit_items(word_id, entry, cdn_url))
+        published = {word_id for word_id, entry in manifest.entries.items() if entry.get("url")}
+        unpublished = sorted(({str(w['id']) for w in words} | set(manifest.entries)) - published)
+        print(f"CDN denetimi: {len(items)} adres, {AUDIT_MAX_PARALLEL} paralel HEAD -> {cdn_url}")
 
-    # 2. fal.ai'ye gönder (kategori bazlı prompt ile)
-    request_id, response_url = submit_image_request(word, description, category)
+        auditor = CdnAuditor(cdn_head)
+        results = auditor.run(items)
 
-    if not response_url:
-        return None
+        try:
+            referenced = set()
+            for entry in manifest.entries.values():
+                referenced |= get_cdn_names(entry)
+            orphaned = sorted(set(get_bunny_publisher(endpoint).storage.list()) - referenced)
+        except Exception as e:
+            print(f"Bunny.net klasoru listelenemedi, sahipsiz dosyalar denetlenmedi: {e}")
+            orphaned = None
+
+        # İlk başarılı denetimin ETag'leri sonraki denetimlerin referansıdır
+        baselines = {}
+        for result in results:
+            if result["state"] == "ok" and result["remote_etag"] and not result["etag"]:
+                baselines.setdefault(result["id"], {})[result["name"]] = result["remote_etag"]
+        for word_id, etags in baselines.items():
+            entry = manifest.entries[word_id]
+            current = get_cdn_names(entry)
+            kept = {name: etag for name, etag in (entry.get("cdn_etags") or {}).items()
+                    if name in current}
+            manifest.set(word_id, dict(entry, cdn_etags=dict(kept, **etags)))
+
+        counts = write_audit_report(CDN_AUDIT_REPORT_FILE, results, unpublished, orphaned)
+    finally:
+        manifest.close()
+
+    print(f"Denetim {auditor.elapsed:.1f}sn ({len(items) / max(auditor.elapsed, 0.001):.0f} adres/sn)")
+    print(f"  Tamam: {counts.get('ok', 0)}")
+    print(f"  Eksik: {counts.get('missing', 0)}")
+    print(f"  Bayat: {counts.get('stale', 0)}")
+    print(f"  Hata: {counts.get('error', 0)}")
+    print(f"  Yayinlanmamis: {counts['unpublished']}")
+    print(f"  Sahipsiz: {counts['orphaned'] if orphaned is not None else '?'}")
+    if baselines:
+        print(f"{sum(len(etags) for etags in baselines.values())} dosyanin ETag'i kaydedildi")
+    print(f"Rapor: {CDN_AUDIT_REPORT_FILE}")
+
+def cleanup_partial_downloads(max_age: float = PART_FILE_MAX_AGE) -> int:
+    """Çöken çalışmalardan kalan eski .part dosyalarını sil"""
+    if not OUTPUT_FOLDER.exists():
+        return 0
+    removed = 0
+    now = time.time()
+    for path in OUTPUT_FOLDER.glob(f"*{PART_SUFFIX}"):
+        try:
+            if now - path.stat().st_mtime > max_age:
+                path.unlink()
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+def verify_generated(manifest: GenerationManifest) -> int:
+    """Boyutu kayıtlı girişlerin dosyalarını stat ile doğrula (dosya okunmaz).
+
+    Dosyası olmayan veya boyutu tutmayan girişler silinir, yeniden üretilir.
+    Boyutu kayıtlı olmayan eski girişlere dokunulmaz.
+    """
+    invalid = []
+    for word_id, entry in manifest.entries.items():
+        if "size" not in entry:
+            continue
+        try:
+            ok = os.stat(entry["path"]).st_size == entry["size"]
+        except OSError:
+            ok = False
+        if not ok:
+            invalid.append(word_id)
+
+    for word_id in invalid:
+        manifest.delete(word_id)
+    return len(invalid)
+
+def get_render_key(job: dict) -> str:
+    """İşin fal.ai'ye gidecek prompt + model parametrelerinin önbellek anahtarı"""
+    prompt = get_image_prompt(job["word"], job["category"], job["description"])
+    return render_key(prompt, model=FAL_API_URL, **FAL_IMAGE_PARAMS)
+
+def get_fingerprints(word: str, category: str, description: str) -> dict:
+    """Görselin üretildiği girdilerin parmak izi: açıklama ve kategori prompt şablonu"""
+    template = CATEGORY_PROMPTS.get(category, CATEGORY_PROMPTS["default"])
+    return {
+        "description_hash": prompt_hash(description) if description else None,
+        "template_hash": prompt_hash(template),
+    }
 
-    # 3. Sonucu bekle
-    image_url = wait_for_image(response_url)
+def find_stale(words: list, manifest: GenerationManifest) -> tuple:
+    """Girdisi değişmiş üretilmiş kelimeler (--stale): (id listesi, baz alınan eski giriş sayısı)
+
+    Şablon parmak izi güncel CATEGORY_PROMPTS şablonuyla karşılaştırılır.
+    Açıklama, kelimenin manuel açıklaması varsa (DISTINCTIVE_DESCRIPTIONS vb.)
+    onunla karşılaştırılır; manuel açıklaması kaldırılan kelime de değişmiş
+    sayılır. Gemini açıklamaları yeniden sorulmadan karşılaştırılamaz.
+    Parmak izi olmayan eski girişlere güncel parmak izi yazılır (baz alınır).
+    """
+    stale, backfilled = [], 0
+    for w in words:
+        entry = manifest.entries.get(w['id'])
+        if entry is None:
+            continue
+        category = w.get('category', 'general')
+        manual = MANUAL_DESCRIPTIONS.get(w['word_en'].lower())
+        current = get_fingerprints(w['word_en'], category, manual[0] if manual else None)
+
+        if "template_hash" not in entry:
+            baseline = dict(entry, **current)
+            if manual:
+                baseline["description_source"] = manual[1]
+            manifest.set(w['id'], baseline)
+            backfilled += 1
+        elif entry["template_hash"] != current["template_hash"]:
+            stale.append(w['id'])
+        elif manual:
+            if entry.get("description_hash") != current["description_hash"]:
+                stale.append(w['id'])
+        elif entry.get("description_source") in MANUAL_SOURCES:
+            stale.append(w['id'])
+    return stale, backfilled
+
+def get_done_ids(manifest: GenerationManifest, redo=()) -> set:
+    """Üretilmiş sayılan kelimeler; `redo`'dakilerin ve yeniden üretilmek üzere
+    işaretlenenlerin ("regenerate") girişi yeni görsel gelene kadar kalır"""
+    redo = set(redo)
+    return {word_id for word_id, entry in manifest.entries.items()
+            if word_id not in redo and not entry.get("regenerate")}
+
+def get_image_filename(word: str) -> str:
+    """Uygulama ile aynı isimlendirme: "Meeting Room" -> meeting-room.jpg"""
+    safe_word = word.lower().strip()
+    safe_word = re.sub(r'[^a-z0-9\s-]', '', safe_word)  # Özel karakterleri sil
+    safe_word = re.sub(r'\s+', '-', safe_word)           # Boşlukları tire yap
+    return f"{safe_word}.jpg"
+
+# ============== PIPELINE AŞAMALARI ==============
+# Her aşama bir iş sözlüğünü (job) alır, sonucunu içine yazar ve başarılıysa True döner.
+
+def stage_describe(job: dict) -> bool:
+    """1. Gemini'den açıklama al (yeniden gönderilen işlerde zaten vardır)"""
+    if not job.get("description"):
+        job["description"], job["description_source"] = describe_word(
+            job["word"], job["category"], job.get("deadline")
+        )
+    return bool(job["description"])
+
+def stage_submit(job: dict) -> bool:
+    """2. fal.ai'ye gönder (kategori bazlı prompt ile)"""
+    job["request_id"], job["response_url"] = submit_image_request(
+        job["word"], job["description"], job["category"], job.get("webhook_url"),
+        job.get("deadline")
+    )
+    job["submitted_at"] = time.time()
+    return bool(job["response_url"])
+
+def stage_poll(job: dict) -> bool:
+    """3. Sonucu bekle"""
+    job["timings"] = {}
+    job["image_url"] = wait_for_image(job["response_url"], timings=job["timings"],
+                                      deadline=job.get("deadline"))
+    return bool(job["image_url"])
+
+def stage_download(job: dict) -> bool:
+    """4. Görseli geçici dosyaya indir (boyut + SHA-256)"""
+    download = download_image(job["image_url"], get_image_filename(job["word"]),
+                              job.get("deadline"))
+    if not download:
+        return False
+    job.update(download)
+    return True
 
-    if not image_url:
-        return None
+def stage_save(job: dict) -> bool:
+    """5. Geçici dosyayı içerik adresli depoya taşı (aynı içerik bir kez saklanır)"""
+    job["path"] = save_to_store(job.pop("tmp_path"), job["sha256"])
+    return bool(job["path"])
+
+def stage_optimize(job: dict) -> bool:
+    """6. Uygulama boyutlarını (WebP/AVIF) ve yer tutucu bilgisini üret (süreç havuzunda).
+
+    Kaynak aynıysa mevcut sonuçlar kullanılır. Hata görseli geçersiz
+    kılmaz; eksikler sonra --renditions ile üretilebilir.
+    """
+    formats = available_formats()
+    renditions = placeholder = None
+    if formats and not renditions_current(job.get("renditions"), job.get("renditions_sha256"),
+                                          job["sha256"]):
+        path = Path(job["path"])
+        renditions = get_process_pool().submit(
+            render_renditions, job["path"], path.stem, path.parent, formats
+        )
+    if placeholders_available() and job.get("placeholder_sha256") != job["sha256"]:
+        placeholder = get_process_pool().submit(compute_placeholders, [job["path"]])
+
+    if renditions is not None:
+        try:
+            job["renditions"] = renditions.result()
+            job["renditions_sha256"] = job["sha256"]
+        except Exception as e:
+            print(f"  Boyutlandirma hatasi: {e}", end="")
+            job["renditions"] = job["renditions_sha256"] = None
+    if placeholder is not None:
+        try:
+            job["placeholder"] = placeholder.result()[0]
+        except Exception as e:
+            print(f"  Yer tutucu hatasi: {e}", end="")
+            job["placeholder"] = None
+        job["placeholder_sha256"] = job["sha256"] if job["placeholder"] else None
+    return True
 
-    # 4. Görseli indir
-    image_data = download_image(image_url)
+def stage_describe_batch(jobs: list, batch_size: int = GEMINI_BATCH_SIZE):
+    """1. Gemini'den açıklamaları toplu al (kategori başına tek istek)"""
+    jobs = [job for job in jobs if not job.get("description")]
+    items = [(job["word"], job["category"]) for job in jobs]
+    # Grup, içindeki en kısa bütçeli işin son tarihine uyar
+    deadlines = [job["deadline"] for job in jobs if job.get("deadline") is not None]
+    deadline = min(deadlines) if deadlines else None
+    results = get_word_descriptions_batch(items, batch_size, deadline)
+    for job, (description, source) in zip(jobs, results):
+        job["description"], job["description_source"] = description, source
+
+STAGE_FUNCTIONS = {
+    "describe": stage_describe,
+    "submit": stage_submit,
+    "poll": stage_poll,
+    "download": stage_download,
+    "save": stage_save,
+    "optimize": stage_optimize,
+}
 
-    if not image_data:
-        return None
+def make_job(word: dict) -> dict:
+    """words-for-images.json kaydından pipeline işi oluştur"""
+    return {
+        "id": word['id'],
+        "word": word['word_en'],
+        "category": word.get('category', 'general'),
+    }
 
-    # 5. Yerel klasöre kaydet
-    # Uygulama ile aynı isimlendirme: "Meeting Room" -> "meeting-room.jpg"
-    safe_word = word.lower().strip()
-    safe_word = re.sub(r'[^a-z0-9\s-]', '', safe_word)  # Özel karakterleri sil
-    safe_word = re.sub(r'\s+', '-', safe_word)           # Boşlukları tire yap
-    filename = f"{safe_word}.jpg"
+# Yeniden başlatmada toplanabilmesi için manifeste yazılan iş alanları
+PENDING_JOB_FIELDS = ["word", "category", "description", "description_source",
+                      "request_id", "response_url", "submitted_at", "render_key"]
+
+def make_pending_record(job: dict) -> dict:
+    """fal.ai'ye gönderilmiş işin manifest kaydı"""
+    return {field: job.get(field) for field in PENDING_JOB_FIELDS}
+
+def make_resumed_job(word_id: str, pending: dict) -> dict:
+    """Manifestteki yarım kalmış fal.ai işinden pipeline işi oluştur"""
+    job = {field: pending.get(field) for field in PENDING_JOB_FIELDS}
+    job["id"] = word_id
+    job["resumed"] = True
+    if not job["render_key"] and job["description"]:   # render_key'siz eski kayıt
+        job["render_key"] = get_render_key(job)
+    # Sonucu, aynı prompt'u bekleyen işlere bildirilir (RenderCache)
+    job["render_lead"] = bool(job["render_key"])
+    return job
+
+def make_resubmit_job(job: dict) -> dict:
+    """Süresi dolmuş/başarısız fal.ai işini açıklamasıyla birlikte yeniden gönderilecek işe çevir"""
+    return {field: job.get(field) for field in ["id", "word", "category", "description",
+                                                 "description_source", "attempts",
+                                                 "webhook_url", "priority"]}
+
+def retry_delay(attempts: int) -> float:
+    """`attempts` başarısız denemeden sonraki bekleme (sn)"""
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempts - 1))
+
+def retry_due(failure: dict, now: float) -> bool:
+    """Yeniden deneme zamanı geldi mi (deneme hakkı bitenler otomatik denenmez)"""
+    return failure.get("next_retry_at") is not None and failure["next_retry_at"] <= now
+
+def make_failure_record(job: dict, stage: str, error: str) -> dict:
+    """Yeniden deneme kuyruğu kaydı: hangi aşamada, hangi hatayla, kaçıncı denemede"""
+    attempts = (job.get("attempts") or 0) + 1
+    now = time.time()
+    return {
+        "word": job["word"],
+        "category": job["category"],
+        "description": job.get("description"),
+        "description_source": job.get("description_source"),
+        "stage": stage,
+        "error": error,
+        "attempts": attempts,
+        "failed_at": now,
+        "next_retry_at": now + retry_delay(attempts) if attempts < RETRY_MAX_ATTEMPTS else None,
+    }
 
-    local_path = save_to_local(image_data, filename)
+def make_retry_job(word_id: str, failure: dict) -> dict:
+    """Yeniden deneme kuyruğundaki kayıttan pipeline işi oluştur (açıklama korunur)"""
+    job = {field: failure.get(field) for field in ["word", "category", "description",
+                                                    "description_source", "attempts"]}
+    job["id"] = word_id
+    return job
+
+def prepare_job_queue(words: list, manifest: GenerationManifest, job_queue: LeaseQueue,
+                      retry_failed: bool, ranks: dict, webhook_url: str = None,
+                      only_ids: list = None) -> tuple:
+    """Paylaşılan kuyruğu manifestle eşitle: (hemen işlenecek kelimeler, kiralama fonksiyonu)
+
+    Yarım kalan fal.ai işlerinden kirası alınabilenler hemen döner (sonuçları
+    toplanır); diğer kelimeler pipeline'da yer açıldıkça kiralanır.
+    `only_ids` verilirse sadece o kelimeler kiralanır; girişleri olsa da
+    (--stale) üretilmemiş sayılırlar.
+    """
+    retry_at = {word_id: failure.get("next_retry_at")
+                for word_id, failure in manifest.failures.items()}
+    done_ids = get_done_ids(manifest, only_ids or ())
+    job_queue.sync(words, done_ids, retry_at, ranks)
+    if retry_failed:
+        job_queue.requeue_failed()
+        only_ids = list(manifest.failures)
+    print(job_queue.status().capitalize())
+
+    by_id = {w['id']: w for w in words}
+    pending_ids = [word_id for word_id in manifest.pending
+                   if word_id in by_id and word_id not in done_ids
+                   and (only_ids is None or word_id in only_ids)]
+    claimed = [by_id[row[0]] for row in job_queue.claim(len(pending_ids), ids=pending_ids)]
+
+    def claim_jobs(limit: int) -> list:
+        jobs = []
+        for word_id, word, category, priority in job_queue.claim(limit, ids=only_ids):
+            failure = manifest.failures.get(word_id)
+            if failure is not None:
+                job = make_retry_job(word_id, failure)
+            else:
+                job = make_job({"id": word_id, "word_en": word, "category": category})
+            job["priority"] = priority
+            if webhook_url:
+                job["webhook_url"] = webhook_url
+            jobs.append(job)
+        return jobs
 
-    return local_path
+    return claimed, claim_jobs
 
-def generate_all_images(words: list):
-    """Tüm kelimeler için görsel üret"""
+def generate_single_image(word: str, category: str, word_id: str) -> str:
+    """Tek bir kelime için tüm aşamaları sırayla çalıştır"""
+    job = {"id": word_id, "word": word, "category": category}
+
+    for stage in STAGES:
+        if not STAGE_FUNCTIONS[stage](job):
+            return None
+
+    return job["path"]
+
+def generate_all_images(words: list, concurrency: int = DEFAULT_CONCURRENCY,
+                        stage_workers: dict = None, min_concurrency: int = MIN_CONCURRENCY,
+                        max_concurrency: int = MAX_CONCURRENCY,
+                        describe_batch: int = GEMINI_BATCH_SIZE, webhook_url: str = None,
+                        webhook_port: int = WEBHOOK_PORT, webhook_host: str = WEBHOOK_HOST,
+                        deadline: float = JOB_DEADLINE, retry_failed: bool = False, use_queue: bool = False,
+                        scheduler: PriorityScheduler = None, category_limits: dict = None,
+                        stale: bool = False, publish_endpoint: str = None):
+    """Tüm kelimeler için görsel üret (`retry_failed` ise sadece yeniden deneme kuyruğu,
+    `stale` ise sadece açıklaması/şablonu değişmiş olanlar).
+    `publish_endpoint` verilirse sonunda görseller Bunny.net'e yüklenir.
+
+    `use_queue` ise kelimeler JOB_QUEUE_FILE'daki paylaşılan kuyruktan
+    kiralanır; aynı anda birden fazla süreç çalışabilir. Kelimeler
+    `scheduler` önceliğine göre işlenir (varsayılan PRIORITY_ORDER).
+    """
+    if scheduler is None:
+        scheduler = PriorityScheduler(PRIORITY_ORDER)
+    if category_limits is None:
+        category_limits = CATEGORY_LIMITS
+
+    manifest = open_manifest()
+    job_queue = LeaseQueue(JOB_QUEUE_FILE) if use_queue else None
+    try:
+        _generate_all_images(words, manifest, concurrency, stage_workers,
+                             min_concurrency, max_concurrency, describe_batch,
+                             webhook_url, webhook_port, webhook_host, deadline, retry_failed,
+                             job_queue, scheduler, category_limits, stale)
+        export_placeholders(manifest)
+        if publish_endpoint:
+            publish_images(manifest, publish_endpoint)
+    finally:
+        if job_queue is not None:
+            # Bitmeyen kelimeleri diğer süreçler hemen alabilsin
+            job_queue.release_all()
+            job_queue.close()
+        shutdown_process_pool()
+        # Journal'ı generated-images.json'a sıkıştır (diğer scriptler JSON okur)
+        manifest.close()
+
+def export_placeholders(manifest: GenerationManifest):
+    """Yer tutucu bilgisini uygulamanın paketlediği JSON'a yaz.
+
+    --queue modunda diğer süreçlerin girişleri de dahil olsun diye önce
+    diskteki birleşik manifest yeniden okunur.
+    """
+    if not PLACEHOLDERS_EXPORT_FILE.parent.is_dir():
+        return
+    manifest.refresh()
+    count = write_placeholder_export(PLACEHOLDERS_EXPORT_FILE, manifest.entries)
+    print(f"Yer tutucu bilgisi: {count} gorsel -> {PLACEHOLDERS_EXPORT_FILE}")
+
+def generate_renditions(publish_endpoint: str = None):
+    """Boyutları veya yer tutucu bilgisi eksik / kaynağı değişmiş tüm görseller için üret (--renditions)
+
+    Boyutlar görsel başına, yer tutucular PLACEHOLDER_BATCH'lik gruplar
+    halinde süreç havuzuna verilir. Kayıtlı kaynak SHA-256'sı tutan
+    sonuçlar tekrar üretilmez.
+    """
+    formats = available_formats()
+    if not formats:
+        print("Pillow kurulu degil, boyutlar uretilemez (pip install Pillow)")
+    if not placeholders_available():
+        print("NumPy/Pillow kurulu degil, yer tutucu bilgisi uretilemez (pip install numpy Pillow)")
+    if not formats and not placeholders_available():
+        return
 
-    generated = load_generated()
+    manifest = open_manifest()
+    try:
+        prepare_image_store(manifest)
+        sources, need_renditions, need_placeholders = {}, [], []
+        for word_id, entry in manifest.entries.items():
+            if not Path(entry["path"]).is_file():
+                continue
+            # Eski kayıtlarda kaynak özeti yok - dosyadan hesapla
+            source_sha256 = sources[word_id] = entry.get("sha256") or file_sha256(entry["path"])
+            if formats and not renditions_current(entry.get("renditions"),
+                                                  entry.get("renditions_sha256"), source_sha256):
+                need_renditions.append(word_id)
+            if placeholders_available() and entry.get("placeholder_sha256") != source_sha256:
+                need_placeholders.append(word_id)
+        print(f"{len(need_renditions)} gorselin boyutlari, {len(need_placeholders)} gorselin "
+              f"yer tutucu bilgisi uretilecek ({len(manifest.entries)} kayit)")
+
+        pool = get_process_pool()
+        futures = {}
+        for word_id in need_renditions:
+            path = Path(manifest.entries[word_id]["path"])
+            future = pool.submit(render_renditions, str(path), path.stem, path.parent, formats)
+            futures[future] = ("renditions", [word_id])
+        for start in range(0, len(need_placeholders), PLACEHOLDER_BATCH):
+            batch = need_placeholders[start:start + PLACEHOLDER_BATCH]
+            future = pool.submit(compute_placeholders,
+                                 [manifest.entries[word_id]["path"] for word_id in batch])
+            futures[future] = ("placeholders", batch)
+
+        done = failed = reported = 0
+        total = len(need_renditions) + len(need_placeholders)
+        for future in as_completed(futures):
+            kind, word_ids = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"  {manifest.entries[word_ids[0]]['word']}: {kind} hatasi: {e}")
+                failed += len(word_ids)
+                continue
+            if kind == "renditions":
+                results = [results]
+            for word_id, result in zip(word_ids, results):
+                if result is None:
+                    failed += 1
+                    continue
+                field = "renditions" if kind == "renditions" else "placeholder"
+                manifest.set(word_id, dict(manifest.entries[word_id], **{
+                    field: result, f"{field}_sha256": sources[word_id],
+                }))
+                done += 1
+            if done - reported >= PROGRESS_EVERY:
+                reported = done
+                print(f"    [{done}/{total}]")
+        print(f"Boyutlar ve yer tutucular: {done} tamam, {failed} hata")
+        export_placeholders(manifest)
+        if publish_endpoint:
+            publish_images(manifest, publish_endpoint)
+    finally:
+        shutdown_process_pool()
+        manifest.close()
+
+def publish_only(endpoint: str = BUNNY_STORAGE_ENDPOINT):
+    """Üretmeden sadece mevcut görselleri Bunny.net'e yükle (--publish-only)"""
+    manifest = open_manifest()
+    try:
+        prepare_image_store(manifest)
+        publish_images(manifest, endpoint)
+    finally:
+        manifest.close()
+
+def compute_image_hashes(manifest: GenerationManifest) -> int:
+    """Algısal hash'i eksik veya kaynağı değişmiş girişler için pHash/dHash hesapla (süreç havuzunda)"""
+    sources = {}
+    for word_id, entry in manifest.entries.items():
+        if not Path(entry["path"]).is_file():
+            continue
+        sources[word_id] = entry.get("sha256") or file_sha256(entry["path"])
+    need = [word_id for word_id, sha256 in sources.items()
+            if manifest.entries[word_id].get("hash_sha256") != sha256]
+    if not need:
+        return 0
+    print(f"{len(need)} gorselin algisal hash'i hesaplanacak")
+    pool = get_process_pool()
+    futures = {}
+    for start in range(0, len(need), PLACEHOLDER_BATCH):
+        batch = need[start:start + PLACEHOLDER_BATCH]
+        futures[pool.submit(compute_hashes, [manifest.entries[word_id]["path"]
+                                             for word_id in batch])] = batch
+    done = 0
+    for future in as_completed(futures):
+        try:
+            results = future.result()
+        except Exception as e:
+            print(f"  Hash hatasi: {e}")
+            continue
+        for word_id, result in zip(futures[future], results):
+            if result is not None:
+                manifest.set(word_id, dict(manifest.entries[word_id], **result,
+                                           sha256=sources[word_id], hash_sha256=sources[word_id]))
+                done += 1
+    return done
+
+def requeue_duplicate(manifest: GenerationManifest, word_id: str, other_id: str):
+    """Görseli yeniden üretilecek diye işaretle ve yeniden deneme kuyruğuna koy
+    (açıklama yeniden çözülür, deneme hakkı harcanmaz).
+
+    Giriş silinmez; yeni görsel gelene kadar eskisi kullanılmaya devam eder.
+    """
+    entry = manifest.entries[word_id]
+    now = time.time()
+    manifest.set(word_id, dict(entry, regenerate="duplicate"))
+    manifest.record_failure(word_id, {
+        "word": entry["word"],
+        "category": entry["category"],
+        "description": None,
+        "description_source": None,
+        "stage": "duplicate",
+        "error": f"{other_id} id'li gorsele cok benziyor",
+        "attempts": 0,
+        "failed_at": now,
+        "next_retry_at": now,
+    })
+
+def find_duplicates(words: list, scheduler: PriorityScheduler = None, cross_category: bool = False,
+                    requeue: bool = False):
+    """Birbirine çok benzeyen görsel çiftlerini bul, NEAR_DUPLICATES_REPORT_FILE'a yaz (--duplicates)
+
+    Çiftler varsayılan olarak kategori içinde aranır. `requeue` ise her
+    çiftin öncelik sırasında sonraki görseli yeniden üretilecek diye
+    işaretlenip yeniden deneme kuyruğuna konur; bir sonraki normal
+    çalıştırma onu yeniden üretir (o zamana kadar eski görsel kalır).
+    """
+    if not hashes_available():
+        print("NumPy/Pillow kurulu degil, algisal hash hesaplanamaz (pip install numpy Pillow)")
+        return
+    if scheduler is None:
+        scheduler = PriorityScheduler(PRIORITY_ORDER)
 
-    # Daha önce üretilmemiş kelimeleri bul
-    to_generate = [w for w in words if w['id'] not in generated]
+    manifest = open_manifest()
+    try:
+        computed = compute_image_hashes(manifest)
+        if computed:
+            print(f"{computed} gorselin hash'i kaydedildi")
+
+        ranks = scheduler.ranks(words)
+        records = [dict(entry, id=word_id) for word_id, entry in manifest.entries.items()
+                   if entry.get("phash") and entry.get("hash_sha256") == entry.get("sha256")]
+        records.sort(key=lambda record: (ranks.get(record["id"], float("inf")), record["id"]))
+        start = time.time()
+        pairs, checked = find_near_duplicates(records, by_category=not cross_category)
+        print(f"{len(records)} gorsel, {len(pairs)} benzer cift "
+              f"(pHash <= {PHASH_THRESHOLD}, dHash <= {DHASH_THRESHOLD} bit, "
+              f"{'tum kategoriler' if cross_category else 'kategori ici'}); "
+              f"{checked} aday karsilastirildi, {time.time() - start:.1f}sn")
+
+        report = []
+        for first, second, phash_distance, dhash_distance in sorted(
+                pairs, key=lambda pair: (pair[0]["category"], pair[2], pair[0]["id"])):
+            category = first["category"]
+            if second["category"] != category:     # --cross-category
+                category = f"{category}/{second['category']}"
+            report.append({
+                "category": category,
+                "ids": [first["id"], second["id"]],
+                "words": [first["word"], second["word"]],
+                "phash_distance": phash_distance,
+                "dhash_distance": dhash_distance,
+            })
+            print(f"  [{category}] {first['word']} ({first['id']}) ~ "
+                  f"{second['word']} ({second['id']}): pHash {phash_distance}, dHash {dhash_distance}")
+        with open(NEAR_DUPLICATES_REPORT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Rapor: {NEAR_DUPLICATES_REPORT_FILE}")
+
+        if requeue and pairs:
+            queued = set()
+            for first, second, _, _ in pairs:
+                if first["id"] in queued or second["id"] in queued:
+                    continue
+                requeue_duplicate(manifest, second["id"], first["id"])
+                queued.add(second["id"])
+            print(f"{len(queued)} kelime yeniden uretilmek uzere kuyruga alindi. Once "
+                  f"distinctive_descriptions.py'ye ayirt edici aciklama eklemek tekrarini onler.")
+        elif pairs:
+            print("Yeniden uretmek icin --duplicates --requeue")
+    finally:
+        shutdown_process_pool()
+        manifest.close()
+
+def _generate_all_images(words: list, manifest: GenerationManifest, concurrency: int,
+                         stage_workers: dict, min_concurrency: int, max_concurrency: int,
+                         describe_batch: int, webhook_url: str, webhook_port: int,
+                         webhook_host: str, deadline: float, retry_failed: bool, job_queue: LeaseQueue,
+                         scheduler: PriorityScheduler, category_limits: dict, stale: bool):
+    # Uygulama adları silinen/yeniden üretilen kayıtlarda da aynı kalsın diye önce kurulur
+    slugs = prepare_image_store(manifest)
+    # Aynı adı isteyen yeni kelimelerde dosya sırasında ilk gelen sade adı alır
+    for w in words:
+        slugs.assign(w['id'], get_image_filename(w['word_en']))
+
+    # Dosyası silinmiş/yarım kalmış kayıtları yeniden üret, eski .part dosyalarını temizle
+    invalid = verify_generated(manifest)
+    if invalid:
+        print(f"{invalid} kaydin dosyasi eksik veya bozuk, yeniden uretilecek")
+    removed = cleanup_partial_downloads()
+    if removed:
+        print(f"{removed} yarim kalmis indirme silindi")
+
+    stale_ids = None
+    if stale:
+        # Sadece açıklaması veya prompt şablonu değişmiş kelimeler yeniden üretilir.
+        # Eski giriş silinmez: yeni görsel gelince manifest.set ile değiştirilir,
+        # üretim başarısız olursa eski görsel kullanılmaya devam eder
+        stale_ids, backfilled = find_stale(words, manifest)
+        if backfilled:
+            print(f"{backfilled} eski kayda guncel aciklama/sablon parmak izi yazildi (baz alindi)")
+        print(f"{len(stale_ids)} gorselin aciklamasi veya sablonu degismis")
+        words = [w for w in words if w['id'] in set(stale_ids)]
+
+    # Daha önce üretilmemiş kelimeleri bul. Yeniden deneme kuyruğundakiler
+    # beklemeleri dolunca alınır; --retry-failed sadece kuyruğu (beklemeden) işler
+    now = time.time()
+    ranks = scheduler.ranks(words)
+    to_generate, deferred = [], 0
+    claim_jobs = None
+    if job_queue is not None:
+        # Paylaşılan kuyruk: bekleme/deneme hakkı takibi ve sıra kuyruktadır
+        to_generate, claim_jobs = prepare_job_queue(words, manifest, job_queue, retry_failed,
+                                                    ranks, webhook_url, stale_ids)
+    else:
+        done_ids = get_done_ids(manifest, stale_ids or ())
+        for w in words:
+            if w['id'] in done_ids:
+                continue
+            failure = manifest.failures.get(w['id'])
+            if retry_failed:
+                if failure is None:
+                    continue
+            elif (failure is not None and w['id'] not in manifest.pending
+                  and not retry_due(failure, now)):
+                deferred += 1
+                continue
+            to_generate.append(w)
+    to_generate.sort(key=lambda w: ranks[w['id']])
     total = len(to_generate)
+    if job_queue is not None:
+        queue_counts = job_queue.counts()
+        total += queue_counts.get("queued", 0) + queue_counts.get("leased", 0)
 
+    if deferred:
+        print(f"Yeniden deneme kuyrugunda {deferred} kelime henuz beklemede "
+              f"(hemen denemek icin --retry-failed)")
     if total == 0:
-        print("Tum gorseller zaten uretilmis!")
+        if retry_failed:
+            print("Yeniden deneme kuyrugu bos!")
+        elif stale:
+            print("Yeniden uretilecek degismis gorsel yok.")
+        elif deferred:
+            print("Simdilik uretilecek kelime yok.")
+        else:
+            print("Tum gorseller zaten uretilmis!")
         return
 
+    # Önceki çalışmadan kalan fal.ai işleri: geçerli olanların sonucunu topla,
+    # süresi dolanları açıklamasıyla birlikte yeniden gönder
+    jobs, resumed_jobs = [], []
+    for word in to_generate:
+        pending = manifest.pending.get(word['id'])
+        failure = manifest.failures.get(word['id'])
+        if pending is None and failure is not None:
+            jobs.append(make_retry_job(word['id'], failure))
+        elif pending is None:
+            jobs.append(make_job(word))
+        elif now - (pending.get("submitted_at") or 0) <= FAL_JOB_MAX_AGE:
+            resumed_jobs.append(make_resumed_job(word['id'], pending))
+        else:
+            jobs.append(make_resubmit_job(make_resumed_job(word['id'], pending)))
+            manifest.clear_pending(word['id'])
+
+    for job in jobs + resumed_jobs:
+        job["priority"] = ranks.get(job["id"])
+    if webhook_url:
+        for job in jobs:
+            job["webhook_url"] = webhook_url
+
+    workers = dict(STAGE_WORKERS)
+    workers["poll"] = max_concurrency
+    workers.update(stage_workers or {})
+    workers = {stage: max(1, n) for stage, n in workers.items()}
+
+    controller = AimdController(concurrency, min_concurrency, max_concurrency)
+
     print(f"\n{total} gorsel uretilecek...")
-    print(f"Tahmini maliyet: ${total * 0.003:.2f}")
-    print(f"Tahmini sure: {(total * 5) / 60:.0f} dakika\n")
+    if resumed_jobs:
+        print(f"Onceki calismadan {len(resumed_jobs)} fal.ai isi toplanacak (yeniden gonderilmeden)")
+    print("Workerlar: " + ", ".join(f"{stage}={workers[stage]}" for stage in STAGES))
+    if describe_batch > 1:
+        print(f"Gemini toplu aciklama: istek basina en fazla {describe_batch} kelime")
+    print(f"fal.ai penceresi: {controller.window} "
+          f"({controller.min_window}-{controller.max_window} arasi, AIMD)")
+    print(f"Kelime basina sure butcesi: {deadline:.0f}sn")
+    formats = available_formats()
+    print(f"Boyutlar: {', '.join(RENDITION_SIZES)} ({', '.join(formats)})" if formats else
+          "Boyutlar: Pillow kurulu degil, sadece ham .jpg kaydedilecek")
+    print(f"Oncelik: {scheduler.describe()}")
+    if category_limits:
+        print("Kategori siniri: " + ", ".join(f"{category}={limit}"
+                                               for category, limit in category_limits.items()))
+    if webhook_url:
+        print(f"fal.ai webhook: {webhook_url} (yerel {webhook_host}:{webhook_port})")
+    print(f"Tahmini maliyet: ${len(jobs) * 0.003:.2f}")
+    print(f"Tahmini sure: {(total * 5) / controller.window / 60:.0f} dakika\n")
 
-    success_count = 0
-    fail_count = 0
     start_time = time.time()
+    success_count, fail_count, timeout_count = asyncio.run(
+        _run_generation(jobs, resumed_jobs, manifest, workers, controller, describe_batch,
+                        webhook_url, webhook_port, webhook_host, deadline, job_queue,
+                        claim_jobs, category_limits, slugs)
+    )
 
-    for i, word in enumerate(to_generate, 1):
-        word_en = word['word_en']
-        word_id = word['id']
-        category = word.get('category', 'general')
-
-        print(f"[{i}/{total}] {word_en}...", end=" ", flush=True)
+    elapsed = time.time() - start_time
+    print(f"\n{'='*50}")
+    print("TAMAMLANDI!")
+    print(f"Sure: {elapsed/60:.1f} dakika")
+    print(f"Basarili: {success_count}")
+    print(f"Basarisiz: {fail_count}")
+    if timeout_count:
+        print(f"Zaman asimi: {timeout_count}")
+    if manifest.failures:
+        exhausted = sum(1 for f in manifest.failures.values() if f.get("next_retry_at") is None)
+        print(f"Yeniden deneme kuyrugu: {len(manifest.failures)} kelime "
+              f"({exhausted} tanesinin deneme hakki bitti, --retry-failed ile denenebilir)")
+    print(f"{get_description_cache().status().capitalize()}")
+    print(f"{HTTP.status().capitalize()}")
+    if job_queue is not None:
+        print(f"{job_queue.status().capitalize()}")
+    print(f"{get_image_store().status().capitalize()}")
+    print(f"{slugs.status().capitalize()}")
+    print(f"\nGorseller kaydedildi: {IMAGE_STORE_FOLDER}")
+    print(f"Uygulama adlari (slug) ve dosya yollari: {GENERATED_FILE}")
+
+# Kuyruk sonu işareti - her worker bir tane alınca durur
+_STOP = object()
+
+async def _run_generation(jobs: list, resumed_jobs: list, manifest: GenerationManifest,
+                          workers: dict, controller: AimdController, describe_batch: int,
+                          webhook_url: str = None, webhook_port: int = WEBHOOK_PORT,
+                          webhook_host: str = WEBHOOK_HOST,
+                          deadline: float = JOB_DEADLINE, job_queue: LeaseQueue = None,
+                          claim_jobs=None, category_limits: dict = None,
+                          slugs: SlugIndex = None) -> tuple:
+    """Önce yarım kalan fal.ai işlerini topla, sonra yeni işleri üret"""
+    success_count = fail_count = timeout_count = 0
+
+    async def keep_leases():
+        # Kiralar dolmadan yenilenir; süreç çökerse dolup kuyruğa geri döner.
+        # Kendi thread'inde çalışır: pipeline'ın varsayılan executor'ı iki
+        # pipeline arasında kapalıdır. Tek bir hata yenilemeyi durdurmaz.
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(job_queue.lease_ttl / 3)
+            try:
+                await loop.run_in_executor(lease_executor, job_queue.heartbeat)
+            except Exception as e:
+                print(f"  Kira yenilenemedi ({type(e).__name__}: {e}), tekrar denenecek")
+
+    heartbeat = lease_executor = None
+    if job_queue is not None:
+        lease_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lease")
+        heartbeat = asyncio.create_task(keep_leases())
+
+    # Tüm fal.ai işleri tek merkezi poller'dan takip edilir
+    poller = FalPoller(check_fal_job, max_wait=FAL_MAX_WAIT, webhook=bool(webhook_url))
+    poller_task = poller.start()
+    receiver = None
+    if webhook_url:
+        receiver = WebhookReceiver(webhook_host, webhook_port, poller)
+        receiver.start()
+    # Aynı prompt'la daha önce üretilmiş / şu an üretilen görseller tekrar kullanılır;
+    # yarım kalan fal.ai işlerinin prompt'ları toplanana kadar tekrar gönderilmez
+    renders = RenderCache(manifest.entries,
+                          [job["render_key"] for job in resumed_jobs if job.get("render_key")])
 
-        local_path = generate_single_image(word_en, category, word_id)
+    try:
+        resubmit = []
+        if resumed_jobs:
+            print("--- Yarim kalan fal.ai isleri toplaniyor ---")
+            success_count, fail_count, timeout_count = await _run_pipeline(
+                resumed_jobs, manifest, workers, controller, poller, describe_batch,
+                deadline, start_stage="poll", resubmit=resubmit, job_queue=job_queue,
+                category_limits=category_limits, renders=renders, slugs=slugs,
+            )
+            if resubmit:
+                print(f"{len(resubmit)} fal.ai isi gecersiz, yeniden gonderilecek")
+            print("--- Yeni isler ---")
+
+        jobs = [make_resubmit_job(job) for job in resubmit] + jobs
+        if jobs or claim_jobs:
+            success, fail, timeout = await _run_pipeline(jobs, manifest, workers, controller,
+                                                         poller, describe_batch, deadline,
+                                                         job_queue=job_queue,
+                                                         claim_jobs=claim_jobs,
+                                                         category_limits=category_limits,
+                                                         renders=renders, slugs=slugs)
+            success_count += success
+            fail_count += fail
+            timeout_count += timeout
+    finally:
+        poller.close()
+        await poller_task
+        if receiver:
+            receiver.stop()
+        if heartbeat:
+            heartbeat.cancel()
+            lease_executor.shutdown(wait=False)
+
+    print(poller.status())
+    print(renders.status())
+    return success_count, fail_count, timeout_count
+
+async def _run_pipeline(jobs: list, manifest: GenerationManifest, workers: dict,
+                        controller: AimdController, poller: FalPoller, describe_batch: int = 1,
+                        deadline: float = JOB_DEADLINE, start_stage: str = STAGES[0],
+                        resubmit: list = None, job_queue: LeaseQueue = None,
+                        claim_jobs=None, category_limits: dict = None,
+                        renders: RenderCache = None, slugs: SlugIndex = None) -> tuple:
+    """İşleri aşama aşama, sınırlı kuyruklarla birbirine bağlı worker havuzlarında çalıştır.
+
+    Her aşamanın kendi worker sayısı vardır; bir sonraki kuyruk dolunca aşama
+    bekler (backpressure), böylece yavaş bir aşama tüm çalışmayı durdurmaz ama
+    bellekte sınırsız iş de birikmez. fal.ai'ye gönderilip henüz sonucu
+    alınmamış iş sayısı (submit → poll) `controller` penceresiyle sınırlıdır;
+    poll aşaması thread kullanmaz, işleri merkezi `poller`'a bırakır.
+    `describe_batch` > 1 ise describe workerları kuyruktan o kadar kelime
+    toplayıp Gemini'ye toplu sorar.
+
+    fal.ai'ye gönderilen her iş sonucu alınana kadar manifestte "pending"
+    olarak durur. Yarım kalan işler `start_stage="poll"` ile doğrudan sonuç
+    beklemeye girer; sonucu alınamayanlar sayılmaz, `resubmit` listesine eklenir.
+
+    Her işin tüm aşamalar için `deadline` saniyelik bütçesi vardır (kuyrukta
+    bekleme sayılmaz). Bütçe biten iş iptal edilir, penceredeki yeri bırakılır
+    ve zaman aşımı olarak sayılır; poll'da zaman aşımına uğrayan işin pending
+    kaydı silinmez, sonraki çalıştırmada sonucu toplanır. Gönderim (submit)
+    iptal edilmez: bütçe bittikten sonra fal.ai işi kabul ederse request_id
+    yine pending'e yazılır ve iş aynı şekilde bırakılır (iki kez ödenmez).
+
+    Başarısız her kelime aşama ve hata türüyle yeniden deneme kuyruğuna
+    yazılır. Beklemesi RETRY_IN_RUN_MAX_DELAY'den kısaysa aynı çalıştırmada
+    bekleyip tekrar baştan beslenir; feed tüm işler (tekrarlar dahil) bitene
+    kadar aşamaları durdurmaz.
+
+    `claim_jobs` verilirse (--queue) `jobs` bittikten sonra paylaşılan
+    kuyruktan CLAIM_BATCH'lik gruplar kiralanır; kuyruk doluyken
+    kiralanmaz, böylece süreçler işleri kabaca hızlarına göre paylaşır.
+    Biten kelimeler `job_queue`'da tamamlanır veya beklemesiyle geri bırakılır.
+
+    Gönderim (submit) kuyruğu işlerin `priority` sırasını ve
+    `category_limits` kategori sınırlarını uygular (scheduler.py).
+    Gönderimden önce işin prompt anahtarı `renders`'ta aranır: görseli
+    varsa fal.ai'ye gitmeden kullanılır, aynı anahtar üretimdeyse sonucu
+    beklenir (render_cache.py). Biten her kelimeye `slugs`'tan çakışmasız
+    bir uygulama adı verilir (image_store.py).
+
+    Ağ çağrıları bloklayan `requests` kullandığı için thread'lerde çalışır;
+    manifest kaydı sadece event loop içinde yapılır, böylece journal'a aynı
+    anda iki yazma olmaz.
+    """
+    loop = asyncio.get_running_loop()
+    threads = sum(n for stage, n in workers.items() if stage != "poll") + POLL_MAX_PARALLEL
+    executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="gen")
+    loop.set_default_executor(executor)
+
+    queues = {stage: asyncio.Queue(maxsize=STAGE_QUEUE_SIZE) for stage in STAGES}
+    if describe_batch > 1:
+        # Her describe workerı dolu bir grup toplayabilsin
+        queues["describe"] = asyncio.Queue(
+            maxsize=max(STAGE_QUEUE_SIZE, describe_batch * workers["describe"])
+        )
+    # fal.ai'ye gönderim sırası: öncelik + kategori sınırı
+    queues["submit"] = ScheduledQueue(STAGE_QUEUE_SIZE, category_limits, stop=_STOP)
+    busy = {stage: 0 for stage in STAGES}
+    window = AdaptiveWindow(controller.window)
+    counts = {"done": 0, "success": 0, "fail": 0, "timeout": 0, "active": len(jobs),
+              "total": len(jobs)}
+    released = asyncio.Event()  # Bir iş bitti (tekrar bekleyenler bitmiş sayılmaz)
+    retry_tasks = set()
+    start_time = time.time()
 
-        if local_path:
-            print(f"OK")
-            generated[word_id] = {
-                "word": word_en,
-                "category": category,
-                "path": local_path
+    first = STAGES.index(start_stage)
+    if renders is None:
+        renders = RenderCache(manifest.entries)
+    if slugs is None:
+        slugs = SlugIndex(manifest.entries)
+
+    async def retry_later(job: dict, delay: float):
+        await asyncio.sleep(delay)
+        await queues[STAGES[0]].put(job)
+
+    def finish(job: dict, failed_stage: str = None, error: str = None):
+        keep_pending = error == "timeout" and (failed_stage == "poll" or job.get("late_submit"))
+        # Aynı prompt'un fal.ai işi sürüyor: sonucu sonraki çalıştırmada kullanılır
+        parked = error == "render_pending"
+        entry = None
+        if failed_stage is None:
+            entry = {
+                "word": job["word"],
+                "category": job["category"],
+                "slug": slugs.assign(job["id"], get_image_filename(job["word"])),
+                "path": job["path"],
+                "size": job["size"],
+                "sha256": job["sha256"]
             }
-            save_generated(generated)
-            success_count += 1
+            if job.get("render_key"):
+                entry["render_key"] = job["render_key"]
+            if job.get("renditions"):
+                entry["renditions"] = job["renditions"]
+                entry["renditions_sha256"] = job["renditions_sha256"]
+            if job.get("placeholder"):
+                entry["placeholder"] = job["placeholder"]
+                entry["placeholder_sha256"] = job["placeholder_sha256"]
+            entry["description_source"] = job.get("description_source")
+            entry.update(get_fingerprints(job["word"], job["category"], job.get("description")))
+        if job.pop("render_lead", False):
+            # Aynı prompt'u bekleyen işler bu sonucu kullanır (başarısızsa onlar da
+            # yeniden deneme kuyruğuna girer, fal.ai işi sürüyorsa ertelenir)
+            renders.resolve(job["render_key"], entry, pending=keep_pending)
+        if not keep_pending:
+            manifest.clear_pending(job["id"])
+
+        if resubmit is not None and job.get("resumed") and failed_stage == "poll" and not keep_pending:
+            print(f"  {job['word']}: fal.ai isi gecersiz/suresi dolmus, yeniden gonderilecek")
+            resubmit.append(job)
+            release()
+            return
+
+        if failed_stage is None:
+            counts["done"] += 1
+            print(f"[{counts['done']}/{counts['total']}] {job['word']} OK"
+                  + (" (onbellekten)" if job.get("reused") else ""))
+            manifest.set(job["id"], entry)
+            manifest.clear_failure(job["id"])
+            if job_queue is not None:
+                job_queue.complete(job["id"])
+            counts["success"] += 1
         else:
-            print("BASARISIZ")
-            fail_count += 1
+            failure = make_failure_record(job, failed_stage, error)
+            if parked:
+                # Deneme hakkı harcanmaz; bu çalıştırmada tekrar kiralanmasın diye kısa bekleme
+                failure.update(attempts=job.get("attempts") or 0,
+                               next_retry_at=failure["failed_at"] + RETRY_BASE_DELAY)
+            manifest.record_failure(job["id"], failure)
+            attempts = failure["attempts"]
+            delay = retry_delay(attempts)
+            # Aynı çalıştırmada tekrar dene (poll zaman aşımı hariç: fal.ai işi
+            # hâlâ sürüyor olabilir, sonraki çalıştırmada pending'den toplanır)
+            if (failure["next_retry_at"] is not None and not keep_pending and not parked
+                    and delay <= RETRY_IN_RUN_MAX_DELAY):
+                retry = make_resubmit_job(job)
+                retry["attempts"] = attempts
+                print(f"  {job['word']}: {failed_stage} basarisiz ({error}), "
+                      f"{delay:.0f}sn sonra tekrar denenecek ({attempts + 1}/{RETRY_MAX_ATTEMPTS})")
+                if resubmit is not None:
+                    resubmit.append(retry)
+                    release()
+                else:
+                    task = asyncio.create_task(retry_later(retry, delay))
+                    retry_tasks.add(task)
+                    task.add_done_callback(retry_tasks.discard)
+                return
+
+            if job_queue is not None:
+                if failure["next_retry_at"] is None:
+                    job_queue.fail(job["id"])
+                else:
+                    job_queue.release(job["id"], failure["next_retry_at"])
+
+            counts["done"] += 1
+            if parked:
+                print(f"[{counts['done']}/{counts['total']}] {job['word']} ERTELENDI "
+                      f"(ayni prompt'un fal.ai isi sonraki calistirmada toplanacak)")
+                counts["timeout"] += 1
+            elif error == "timeout":
+                print(f"[{counts['done']}/{counts['total']}] {job['word']} "
+                      f"ZAMAN ASIMI ({failed_stage})")
+                counts["timeout"] += 1
+            else:
+                print(f"[{counts['done']}/{counts['total']}] {job['word']} "
+                      f"BASARISIZ ({failed_stage}: {error})")
+                counts["fail"] += 1
 
         # İlerleme bilgisi
-        if i % 50 == 0:
+        done, total = counts["done"], counts["total"]
+        if done % PROGRESS_EVERY == 0:
             elapsed = time.time() - start_time
-            rate = i / elapsed * 60
-            remaining = (total - i) / rate if rate > 0 else 0
-            print(f"    [{i}/{total}] Hiz: {rate:.1f} resim/dk, Kalan: {remaining:.0f} dk")
+            rate = done / elapsed * 60
+            remaining = (total - done) / rate if rate > 0 else 0
+            print(f"    [{done}/{total}] Hiz: {rate:.1f} resim/dk, Kalan: {remaining:.0f} dk")
+        release()
+
+    def release():
+        counts["active"] -= 1
+        released.set()
+
+    async def wait_active(limit: int):
+        """Aktif iş sayısı `limit`'e inene kadar bekle"""
+        while counts["active"] > limit:
+            released.clear()
+            await released.wait()
+
+    async def run_with_budget(job: dict, stage_call, grace: float = DEADLINE_GRACE):
+        """Aşamayı işin kalan bütçesiyle çalıştır; bütçe (+grace) biterse iptal et"""
+        job.setdefault("budget", deadline)
+        started = time.monotonic()
+        job["deadline"] = started + job["budget"]
+        try:
+            return await asyncio.wait_for(stage_call(), max(0.0, job["budget"]) + grace)
+        finally:
+            job["budget"] -= time.monotonic() - started
+
+    async def use_render(job: dict, entry: dict):
+        # İçerik adresli depoda aynı dosya kullanılır, kopya gerekmez
+        job.update(path=entry["path"], size=entry["size"], sha256=entry["sha256"], reused=True,
+                   renditions=entry.get("renditions"),
+                   renditions_sha256=entry.get("renditions_sha256"),
+                   placeholder=entry.get("placeholder"),
+                   placeholder_sha256=entry.get("placeholder_sha256"))
+        await queues["optimize"].put(job)   # Boyutları yoksa üretilir
+
+    async def follow_render(job: dict, future: asyncio.Future):
+        entry = await future
+        if entry is not None:
+            await use_render(job, entry)
+        elif renders.is_pending(job["render_key"]):
+            # Öncünün fal.ai işi sürüyor, sonraki çalıştırmada toplanınca kullanılır
+            finish(job, "submit", "render_pending")
+        else:
+            # Öncü başarısız: her bekleyen ayrı fal.ai işi göndermesin, öncüyle
+            # birlikte yeniden denenir (tekrarda yine tek öncü seçilir)
+            finish(job, "submit", "render_lead_failed")
+
+    async def reuse_render(job: dict) -> bool:
+        """Aynı prompt'un görseli varsa veya üretiliyorsa fal.ai'ye gönderme"""
+        key = job["render_key"] = get_render_key(job)
+        current = manifest.entries.get(job["id"])
+        if current is not None and current.get("regenerate"):
+            # Mevcut görsel reddedildi (--duplicates --requeue); aynı prompt'un
+            # görseli veya sonucu kullanılmaz, fal.ai'de yeniden üretilir
+            return False
+        entry = renders.lookup(key)
+        future = renders.follow(key) if entry is None else None
+        if entry is None and future is None and renders.is_pending(key):
+            # Aynı prompt'un önceki fal.ai işi sürüyor - ikinci kez ödeme
+            await queues["submit"].release(job)
+            finish(job, "submit", "render_pending")
+            return True
+        if entry is None and future is None:
+            renders.lead(key)
+            job["render_lead"] = True
+            return False
+
+        await queues["submit"].release(job)
+        if entry is not None:
+            await use_render(job, entry)
+        else:
+            task = asyncio.create_task(follow_render(job, future))
+            retry_tasks.add(task)
+            task.add_done_callback(retry_tasks.discard)
+        return True
 
-        if i < total:
-            time.sleep(DELAY_BETWEEN_REQUESTS)
+    async def worker(stage: str, next_stage: str):
+        in_q = queues[stage]
+        while True:
+            job = await in_q.get()
+            if job is _STOP:
+                return
 
-    elapsed = time.time() - start_time
-    print(f"\n{'='*50}")
-    print(f"TAMAMLANDI!")
-    print(f"Sure: {elapsed/60:.1f} dakika")
-    print(f"Basarili: {success_count}")
-    print(f"Basarisiz: {fail_count}")
-    print(f"\nGorseller kaydedildi: {OUTPUT_FOLDER}")
-    print(f"Bu klasordeki dosyalari Bunny.net'e surukle-birak yapabilirsin.")
+            if stage == "submit":
+                if await reuse_render(job):
+                    continue
+                await window.acquire()  # fal.ai penceresinde yer aç
+
+            busy[stage] += 1
+            error = None
+            try:
+                if stage == "poll":
+                    job["image_url"] = await run_with_budget(job, lambda: poller.wait(job), 0.0)
+                    ok = bool(job["image_url"])
+                elif stage == "submit":
+                    # POST bütçe bittikten sonra dönebilir; fal.ai işi kabul ettiyse
+                    # request_id kaybolmasın diye gönderim iptal edilmez
+                    submit = asyncio.ensure_future(asyncio.to_thread(STAGE_FUNCTIONS[stage], job))
+                    try:
+                        ok = await run_with_budget(job, lambda: asyncio.shield(submit))
+                    except asyncio.TimeoutError:
+                        job["late_submit"] = await submit
+                        raise
+                else:
+                    ok = await run_with_budget(
+                        job, lambda: asyncio.to_thread(STAGE_FUNCTIONS[stage], job)
+                    )
+            except asyncio.TimeoutError:
+                ok = False
+            except Exception as e:
+                print(f"  {job['word']}: {stage} hatasi: {e}")
+                ok = False
+                error = type(e).__name__
+            finally:
+                busy[stage] -= 1
+
+            # fal.ai işi bitti (veya gönderilemedi) - pencereyi bırak ve AIMD'ye bildir
+            if stage == "poll" or (stage == "submit" and not ok):
+                timings = job.get("timings", {})
+                controller.observe(ok, timings.get("in_queue", 0.0), timings.get("in_progress", 0.0))
+                await queues["submit"].release(job)
+                await window.release()
+                if window.limit != controller.window:
+                    await window.set_limit(controller.window)
+
+            if stage == "submit" and ok:
+                manifest.add_pending(job["id"], make_pending_record(job))
+                poller.expect(job["request_id"])
+            elif stage == "submit" and job.get("late_submit"):
+                # Bütçe doldu ama fal.ai işi aldı: sonucu sonraki çalıştırmada toplanır
+                manifest.add_pending(job["id"], make_pending_record(job))
+                print(f"  {job['word']}: fal.ai isi butce dolduktan sonra kabul edildi, "
+                      f"sonucu sonraki calistirmada toplanacak")
+
+            if not ok:
+                # Hata türü: zaman aşımı, yakalanan istisnanın sınıfı veya
+                # aşamanın kendisinin reddettiği sonuç (boş yanıt, HTTP hatası, ...)
+                finish(job, stage, "timeout" if job["budget"] <= 0 else error or "rejected")
+            elif next_stage:
+                await queues[next_stage].put(job)  # Kuyruk doluysa burada bekler
+            else:
+                finish(job)
+
+    async def describe_batch_worker(next_stage: str):
+        in_q = queues["describe"]
+        stopped = False
+        while not stopped:
+            job = await in_q.get()
+            if job is _STOP:
+                return
+
+            # Kuyrukta bekleyen kelimelerden bir grup topla
+            batch = [job]
+            while len(batch) < describe_batch:
+                try:
+                    job = await asyncio.wait_for(in_q.get(), DESCRIBE_BATCH_WAIT)
+                except asyncio.TimeoutError:
+                    break
+                if job is _STOP:
+                    stopped = True
+                    break
+                batch.append(job)
+
+            busy["describe"] += 1
+            started = time.monotonic()
+            for job in batch:
+                job.setdefault("budget", deadline)
+                job["deadline"] = started + job["budget"]
+            budget = min(job["budget"] for job in batch)
+            try:
+                await asyncio.wait_for(
+                    asyncio.to_thread(stage_describe_batch, batch, describe_batch),
+                    max(0.0, budget) + DEADLINE_GRACE,
+                )
+            except asyncio.TimeoutError:
+                pass
+            except Exception as e:
+                print(f"  describe hatasi ({len(batch)} kelime): {e}")
+            finally:
+                busy["describe"] -= 1
+                for job in batch:
+                    job["budget"] -= time.monotonic() - started
+
+            for job in batch:
+                if job.get("description"):
+                    await queues[next_stage].put(job)
+                else:
+                    finish(job, "describe", "timeout" if job["budget"] <= 0 else "rejected")
 
-def test_single_word():
+    async def run_stage(stage: str, next_stage: str):
+        if stage == "describe" and describe_batch > 1:
+            stage_worker = describe_batch_worker
+        else:
+            stage_worker = functools.partial(worker, stage)
+        await asyncio.gather(*(stage_worker(next_stage) for _ in range(workers[stage])))
+        # Bu aşama bitti - sonraki aşamanın tüm workerlarını durdur
+        # (başlangıç aşamasını ve öncekileri feed durdurur)
+        if next_stage and STAGES.index(next_stage) > first:
+            for _ in range(workers[next_stage]):
+                await queues[next_stage].put(_STOP)
+
+    async def feed():
+        # Başlangıç aşamasından önceki aşamalara iş gelmeyecek
+        for stage in STAGES[:first]:
+            for _ in range(workers[stage]):
+                await queues[stage].put(_STOP)
+
+        for job in jobs:
+            if start_stage == "poll":
+                await window.acquire()  # Zaten gönderilmiş iş de pencerede yer tutar
+            await queues[start_stage].put(job)
+
+        # Paylaşılan kuyruk: elde MAX_LEASED'den az kelime varken yenilerini kirala.
+        # Kuyruk boşsa ve başka süreçlerin elinde bitmemiş kelime yoksa çık. Varsa
+        # (süreç çökmüş olabilir) kısa aralıklarla, en geç ilk kira dolunca
+        # tekrar bak: kelimeler biterse hemen çıkılır, kira dolarsa geri dönen
+        # kelime kiralanır.
+        while claim_jobs is not None:
+            await wait_active(MAX_LEASED - CLAIM_BATCH)
+            batch = await asyncio.to_thread(claim_jobs, CLAIM_BATCH)
+            if not batch:
+                lease_until = await asyncio.to_thread(job_queue.others_lease_until)
+                if lease_until is None:
+                    break
+                await asyncio.sleep(min(QUEUE_POLL_INTERVAL,
+                                        max(QUEUE_POLL_MIN, lease_until - time.time())))
+                continue
+            counts["active"] += len(batch)
+            counts["total"] += len(batch)
+            for job in batch:
+                await queues[start_stage].put(job)
+
+        # Aynı çalıştırmada tekrar denenecek işler de bitene kadar aşamaları durdurma
+        await wait_active(0)
+        for _ in range(workers[start_stage]):
+            await queues[start_stage].put(_STOP)
+
+    async def report_status():
+        while True:
+            await asyncio.sleep(STATUS_INTERVAL)
+            print("    Kuyruk: " + " | ".join(
+                f"{stage} {queues[stage].qsize()}/{STAGE_QUEUE_SIZE} "
+                f"(aktif {busy[stage]}/{workers[stage]})"
+                for stage in STAGES
+            ))
+            print(f"    fal.ai: {window.in_flight}/{window.limit} is, "
+                  f"hata %{controller.error_rate() * 100:.0f}, {poller.status()}")
+            if category_limits:
+                print(f"    Kategori: {queues['submit'].status()}")
+            print("    Hiz: " + " | ".join(limiter.status() for limiter in LIMITERS.values()))
+            print(f"    {HTTP.status()}")
+            if job_queue is not None:
+                print(f"    {job_queue.status()}")
+
+    reporter = asyncio.create_task(report_status())
+    next_stages = STAGES[1:] + [None]
+    try:
+        await asyncio.gather(
+            feed(),
+            *(run_stage(stage, nxt) for stage, nxt in zip(STAGES, next_stages))
+        )
+    finally:
+        reporter.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return counts["success"], counts["fail"], counts["timeout"]
+
+def test_single_word(endpoint: str = BUNNY_STORAGE_ENDPOINT):
     """Test modu"""
 
     print("Test modu: Ornek kelimeler uretiliyor...")
@@ -1061,7 +2912,7 @@ def test_single_word():
         # Açıklama al
         print("1. Aciklama alinıyor...", end=" ", flush=True)
         description = get_word_description(word, category)
-        print(f"OK")
+        print("OK")
         print(f"   > {description}")
 
         # Görsel üret
@@ -1080,19 +2931,17 @@ def test_single_word():
 
         # İndir
         print("3. Indiriliyor...", end=" ", flush=True)
-        image_data = download_image(image_url)
-        if not image_data:
+        filename = get_image_filename(word)
+        download = download_image(image_url, filename)
+        path = download and save_to_store(download["tmp_path"], download["sha256"])
+        if not path:
             print("BASARISIZ")
             continue
-        print(f"OK ({len(image_data)//1024}KB)")
+        print(f"OK ({download['size']//1024}KB)")
 
         # Bunny'ye yükle
         print("4. Bunny.net'e yukleniyor...", end=" ", flush=True)
-        safe_word = word.lower().strip()
-        safe_word = re.sub(r'[^a-z0-9\s-]', '', safe_word)
-        safe_word = re.sub(r'\s+', '-', safe_word)
-        filename = f"{safe_word}.jpg"
-        cdn_url = upload_to_bunny(image_data, filename)
+        cdn_url = upload_to_bunny(path, filename, endpoint)
 
         if cdn_url:
             print("OK")
@@ -1102,30 +2951,159 @@ def test_single_word():
 
 # ============== ANA PROGRAM ==============
 
+def parse_args():
+    """Komut satırı parametrelerini oku"""
+    parser = argparse.ArgumentParser(description="Synora kelime gorselleri uretici")
+    parser.add_argument("--test", action="store_true", help="ornek kelimelerle test modu")
+    parser.add_argument("--limit", type=int, default=None, help="sadece ilk N kelimeyi isle")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"fal.ai'de ayni anda bekleyen baslangic is sayisi (varsayilan {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--min-concurrency", type=int, default=MIN_CONCURRENCY,
+                        help=f"AIMD penceresinin alt siniri (varsayilan {MIN_CONCURRENCY})")
+    parser.add_argument("--max-concurrency", type=int, default=MAX_CONCURRENCY,
+                        help=f"AIMD penceresinin ust siniri (varsayilan {MAX_CONCURRENCY})")
+    parser.add_argument("--describe-batch", type=int, default=GEMINI_BATCH_SIZE,
+                        help=f"Gemini'ye tek istekte sorulan kelime sayisi, 1 = kapali (varsayilan {GEMINI_BATCH_SIZE})")
+    parser.add_argument("--refresh-descriptions", action="store_true",
+                        help="aciklama onbellegini okumadan Gemini'ye tekrar sor (sonuclar yine kaydedilir)")
+    parser.add_argument("--webhook-url", default=None,
+                        help="fal.ai sonuclarini bu genel adrese bildirsin (yerel sunucuya yonlenmeli); "
+                             "verilmezse durum sorgusu yapilir")
+    parser.add_argument("--webhook-port", type=int, default=WEBHOOK_PORT,
+                        help=f"webhook alicisinin dinledigi yerel port (varsayilan {WEBHOOK_PORT})")
+    parser.add_argument("--webhook-host", default=WEBHOOK_HOST,
+                        help=f"webhook alicisinin dinledigi adres (varsayilan {WEBHOOK_HOST}, "
+                             f"sadece yerel; tum aglara acmak icin 0.0.0.0)")
+    only = parser.add_mutually_exclusive_group()
+    only.add_argument("--retry-failed", action="store_true",
+                      help="sadece yeniden deneme kuyrugundaki kelimeleri, beklemeden isle")
+    only.add_argument("--renditions", action="store_true",
+                      help="sadece boyutlari/yer tutucu bilgisi eksik veya kaynagi degismis "
+                           "gorseller icin WebP/AVIF boyutlarini ve BlurHash/renk bilgisini uret")
+    only.add_argument("--stale", action="store_true",
+                      help="sadece aciklamasi (DISTINCTIVE_DESCRIPTIONS vb.) veya kategori "
+                           "sablonu degismis gorselleri yeniden uret")
+    only.add_argument("--publish-only", action="store_true",
+                      help="uretmeden sadece mevcut gorselleri Bunny.net'e yukle")
+    only.add_argument("--duplicates", action="store_true",
+                      help="birbirine cok benzeyen gorselleri algisal hash ile bul (kategori ici)")
+    only.add_argument("--audit", action="store_true",
+                      help="yayinlanan gorselleri CDN'de HEAD ile denetle: eksik, bayat ve "
+                           "sahipsiz dosyalarin raporunu yaz")
+    parser.add_argument("--publish", action="store_true",
+                        help="is bitince gorselleri ve boyutlarini Bunny.net'e yukle "
+                             "(uzakta ayni checksum'li dosyalar atlanir)")
+    parser.add_argument("--cross-category", action="store_true",
+                        help="--duplicates benzer gorselleri kategoriler arasinda da arasin")
+    parser.add_argument("--requeue", action="store_true",
+                        help="--duplicates her benzer ciftin sonraki gorselini yeniden uretim "
+                             "kuyruguna koysun")
+    parser.add_argument("--cdn-url", default=BUNNY_CDN_URL, metavar="URL",
+                        help=f"--audit'in kontrol ettigi CDN adresi (varsayilan {BUNNY_CDN_URL})")
+    parser.add_argument("--storage-endpoint", default=BUNNY_STORAGE_ENDPOINT, metavar="URL",
+                        help=f"Bunny Storage adresi, test icin yerel sunucu verilebilir "
+                             f"(varsayilan {BUNNY_STORAGE_ENDPOINT})")
+    parser.add_argument("--queue", action="store_true",
+                        help="kelimeleri paylasilan is kuyrugundan kirala (ayni anda birden fazla surec)")
+    parser.add_argument("--priority", default=",".join(PRIORITY_ORDER), metavar="OLCUTLER",
+                        help="uretim sirasi olcutleri, virgulle: ids, usage, level, category "
+                             f"(varsayilan {','.join(PRIORITY_ORDER)})")
+    parser.add_argument("--priority-ids", default=None, metavar="IDLER|DOSYA",
+                        help="once uretilecek kelime id'leri (virgulle veya dosya); 'ids' olcutunu ekler")
+    parser.add_argument("--usage-file", default=None, metavar="DOSYA",
+                        help="kullanim sayilari JSON {id veya kelime: sayi}; 'usage' olcutunu ekler")
+    parser.add_argument("--category-order", default=None, metavar="KATEGORILER",
+                        help="kategori sirasi, virgulle; 'category' olcutunu ekler")
+    parser.add_argument("--category-limit", action="append", default=[], metavar="KATEGORI=N",
+                        help="fal.ai'de kategori basina ayni anda en fazla N is (0 = sinirsiz); "
+                             "karakterli kategoriler varsayilan olarak "
+                             f"{max(CATEGORY_LIMITS.values(), default=0)} ile sinirli")
+    parser.add_argument("--deadline", type=float, default=JOB_DEADLINE,
+                        help=f"bir kelimenin tum asamalari icin sure butcesi, sn (varsayilan {JOB_DEADLINE})")
+    parser.add_argument("--workers", action="append", default=[], metavar="ASAMA=N",
+                        help="asama worker sayisi, orn. --workers describe=16 --workers download=4")
+    args = parser.parse_args()
+
+    args.stage_workers = {}
+    for item in args.workers:
+        stage, _, value = item.partition("=")
+        if stage not in STAGES or not value.isdigit():
+            parser.error(f"gecersiz --workers degeri: {item} (asamalar: {', '.join(STAGES)})")
+        args.stage_workers[stage] = int(value)
+
+    args.category_limits = dict(CATEGORY_LIMITS)
+    for item in args.category_limit:
+        category, _, value = item.partition("=")
+        if not category or not value.isdigit():
+            parser.error(f"gecersiz --category-limit degeri: {item}")
+        if int(value) > 0:
+            args.category_limits[category] = int(value)
+        else:
+            args.category_limits.pop(category, None)
+
+    order = [name.strip() for name in args.priority.split(",") if name.strip()]
+    if args.priority_ids and "ids" not in order:
+        order.insert(0, "ids")
+    if args.usage_file and "usage" not in order:
+        order.insert(1 if order[:1] == ["ids"] else 0, "usage")
+    if args.category_order and "category" not in order:
+        order.append("category")
+    try:
+        args.scheduler = PriorityScheduler(
+            order,
+            category_order=args.category_order.split(",") if args.category_order else (),
+            ids=load_id_list(args.priority_ids) if args.priority_ids else (),
+            usage=load_usage(args.usage_file) if args.usage_file else None,
+        )
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    return args
+
 if __name__ == "__main__":
-    import sys
+    args = parse_args()
 
     print("=" * 50)
     print("SYNORA - Kelime Gorselleri Uretici")
     print("Gemini + fal.ai + Bunny.net")
     print("=" * 50)
 
-    if len(sys.argv) > 1 and sys.argv[1] == "--test":
-        test_single_word()
+    if args.refresh_descriptions:
+        get_description_cache().refresh = True
+        print("Aciklama onbellegi yenileniyor (--refresh-descriptions)")
+
+    publish_endpoint = args.storage_endpoint if args.publish else None
+    if args.test:
+        test_single_word(args.storage_endpoint)
+    elif args.publish_only:
+        publish_only(args.storage_endpoint)
+    elif args.audit:
+        audit_cdn(args.cdn_url, args.storage_endpoint)
+    elif args.duplicates:
+        words = load_words()
+        find_duplicates(words, scheduler=args.scheduler, cross_category=args.cross_category,
+                        requeue=args.requeue)
+    elif args.renditions:
+        generate_renditions(publish_endpoint)
     else:
         words = load_words()
         if words:
             # --limit N parametresi ile ilk N kelimeyi işle
-            limit = None
-            for i, arg in enumerate(sys.argv):
-                if arg == "--limit" and i + 1 < len(sys.argv):
-                    try:
-                        limit = int(sys.argv[i + 1])
-                        print(f"Limit: ilk {limit} kelime")
-                    except:
-                        pass
-
-            if limit:
-                words = words[:limit]
-
-            generate_all_images(words)
+            if args.limit:
+                print(f"Limit: ilk {args.limit} kelime")
+                words = words[:args.limit]
+
+            generate_all_images(words, concurrency=args.concurrency,
+                                stage_workers=args.stage_workers,
+                                min_concurrency=args.min_concurrency,
+                                max_concurrency=args.max_concurrency,
+                                describe_batch=args.describe_batch,
+                                webhook_url=args.webhook_url,
+                                webhook_port=args.webhook_port,
+                                webhook_host=args.webhook_host,
+                                deadline=args.deadline,
+                                retry_failed=args.retry_failed,
+                                use_queue=args.queue,
+                                scheduler=args.scheduler,
+                                category_limits=args.category_limits,
+                                stale=args.stale,
+                                publish_endpoint=publish_endpoint)
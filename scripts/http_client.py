@@ -0,0 +1,125 @@
+"""
+Synora - Paylaşılan HTTP istemcisi (host başına keep-alive bağlantı havuzu)
+
+Her istek için yeni TCP+TLS bağlantısı açmak yerine tüm aşamalar aynı
+istemciyi kullanır:
+- Her host için ayrı requests.Session + HTTPAdapter (havuz boyutu host başına)
+- Bağlantılar istekler arasında açık tutulur (keep-alive) ve tekrar kullanılır
+- İsteğe bağlı HTTP/2: httpx + h2 kuruluysa seçilen hostlar (fal.ai durum
+  sorguları gibi çok sayıda küçük istek) tek bağlantı üzerinden çoklanır
+- Host başına istek / yeni bağlantı sayaçları tutulur
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:     # HTTP/2 isteğe bağlı (pip install httpx[http2])
+    httpx = None
+
+DEFAULT_POOL_SIZE = 16      # Listede olmayan hostlar için havuz boyutu
+
+
+def http2_available() -> bool:
+    if httpx is None:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClient:
+    """Thread-safe, host başına havuzlu HTTP istemcisi."""
+
+    def __init__(self, pool_sizes: dict = None, default_pool_size: int = DEFAULT_POOL_SIZE,
+                 http2_hosts=()):
+        self.pool_sizes = dict(pool_sizes or {})
+        self.default_pool_size = default_pool_size
+        self.http2_hosts = set(http2_hosts) if http2_available() else set()
+        self.sessions = {}          # host -> requests.Session veya httpx.Client
+        self.request_counts = {}    # host -> istek sayısı
+        self.connect_counts = {}    # host -> açılan bağlantı sayısı (HTTP/2; HTTP/1.1'de urllib3 sayar)
+        self._lock = threading.Lock()
+
+    def _session(self, host: str):
+        with self._lock:
+            session = self.sessions.get(host)
+            if session is None:
+                size = self.pool_sizes.get(host, self.default_pool_size)
+                if host in self.http2_hosts:
+                    session = httpx.Client(
+                        http2=True, follow_redirects=True,
+                        limits=httpx.Limits(max_connections=size, max_keepalive_connections=size),
+                    )
+                else:
+                    session = requests.Session()
+                    # pool_block: havuz doluysa yeni bağlantı açıp atmak yerine sırada bekle
+                    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=size, pool_block=True)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                self.sessions[host] = session
+                self.request_counts[host] = 0
+                self.connect_counts[host] = 0
+            self.request_counts[host] += 1
+            return session
+
+    def request(self, method: str, url: str, **kwargs):
+        """requests.request ile aynı kullanım; yanıtın status_code/headers/json()/content'i vardır"""
+        host = urlsplit(url).netloc
+        session = self._session(host)
+        if host in self.http2_hosts:
+            kwargs.setdefault("extensions", {})["trace"] = self._tracer(host)
+        return session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def _tracer(self, host: str):
+        def trace(event: str, info: dict):
+            if event == "connection.connect_tcp.complete":
+                with self._lock:
+                    self.connect_counts[host] += 1
+        return trace
+
+    def stats(self) -> dict:
+        """Host başına {"requests": n, "connections": m, "reused": n - m}"""
+        with self._lock:
+            sessions = dict(self.sessions)
+            result = {}
+            for host, session in sessions.items():
+                connections = self.connect_counts[host]
+                if isinstance(session, requests.Session):
+                    # urllib3 her havuzda açtığı bağlantıları sayar
+                    connections = 0
+                    for adapter in set(session.adapters.values()):
+                        pools = adapter.poolmanager.pools
+                        for key in pools.keys():
+                            connections += pools[key].num_connections
+                count = self.request_counts[host]
+                result[host] = {
+                    "requests": count,
+                    "connections": connections,
+                    "reused": max(0, count - connections),
+                }
+        return result
+
+    def status(self) -> str:
+        stats = self.stats()
+        if not stats:
+            return "http: istek yok"
+        total = sum(s["requests"] for s in stats.values())
+        connections = sum(s["connections"] for s in stats.values())
+        return (f"http: {total} istek, {connections} baglanti "
+                f"(%{(total - connections) / total * 100:.0f} tekrar kullanim)")
+
+    def close(self):
+        with self._lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions = {}
@@ -0,0 +1,113 @@
+"""
+Synora - İçerik adresli görsel deposu + uygulama adı (slug) dizini
+
+Görseller kelime adıyla tek klasöre yazılınca aynı İngilizce kelimeli iki id
+birbirinin dosyasının üzerine yazıyordu; on binlerce dosyalı düz klasör de
+yavaşlar. Bunun yerine:
+- Dosyalar SHA-256 adıyla, özetin ilk baytlarına göre alt klasörlere
+  (shard) yazılır: objects/ab/cd/abcd....jpg
+- Aynı baytlar bir kez saklanır; aynı özetli ikinci dosya atılır
+- Uygulamanın kullandığı ad (slug, "meeting-room.jpg") manifest girişinde
+  durur; SlugIndex her slug'ın tek bir id'ye ait olmasını sağlar. Çakışan
+  id'ye "meeting-room-<id>.jpg" verilir, bir kez verilen ad değişmez.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+SHARD_LEVELS = 2    # Alt klasör derinliği
+SHARD_WIDTH = 2     # Her seviyede özetten alınan karakter (256 klasör)
+
+
+class ImageStore:
+    """SHA-256 adlı, shard'lı dosya deposu."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.stored = 0
+        self.deduplicated = 0   # Aynı baytlar zaten depodaydı
+
+    def path_for(self, sha256: str, suffix: str = ".jpg") -> Path:
+        shards = [sha256[i * SHARD_WIDTH:(i + 1) * SHARD_WIDTH] for i in range(SHARD_LEVELS)]
+        return self.root.joinpath(*shards, sha256 + suffix)
+
+    def contains(self, path) -> bool:
+        return self.root in Path(path).parents
+
+    def _existing(self, path: Path, size: int) -> bool:
+        try:
+            return path.stat().st_size == size
+        except OSError:
+            return False
+
+    def put(self, tmp_path, sha256: str, suffix: str = ".jpg") -> str:
+        """Geçici dosyayı depoya taşı (aynısı varsa geçici dosya silinir)"""
+        path = self.path_for(sha256, suffix)
+        if self._existing(path, os.stat(tmp_path).st_size):
+            Path(tmp_path).unlink(missing_ok=True)
+            self.deduplicated += 1
+            return str(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, path)
+        self.stored += 1
+        return str(path)
+
+    def add_file(self, source, sha256: str, suffix: str = ".jpg") -> str:
+        """Depo dışındaki dosyayı depoya kopyala (hard link, olmazsa kopya; kaynak kalır)"""
+        path = self.path_for(sha256, suffix)
+        if self._existing(path, os.stat(source).st_size):
+            self.deduplicated += 1
+            return str(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.part")
+        try:
+            try:
+                os.link(source, tmp_path)
+            except OSError:
+                shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self.stored += 1
+        return str(path)
+
+    def status(self) -> str:
+        return f"gorsel deposu: {self.stored} yeni dosya, {self.deduplicated} ayni icerik"
+
+
+class SlugIndex:
+    """Uygulama adı (slug) -> kelime id'si; her slug tek id'ye aittir.
+
+    Manifest girişlerinden kurulur. Bir id'nin adı bir kez verildikten sonra
+    (girişi silinip yeniden üretilse de, dizin yaşadıkça) değişmez.
+    """
+
+    def __init__(self, entries: dict = None):
+        self.owners = {}    # slug -> id
+        self.slugs = {}     # id -> slug
+        self.collisions = []
+        for word_id, entry in (entries or {}).items():
+            if entry.get("slug"):
+                self.assign(word_id, entry["slug"], keep=True)
+
+    def assign(self, word_id: str, name: str, keep: bool = False) -> str:
+        """`word_id` için `name` ("meeting-room.jpg") veya çakışırsa id ekli ad.
+
+        `keep` ise `name` zaten bu id'ye verilmiş addır (manifestten), sadece
+        başka id'de de varsa çakışma olarak değiştirilir.
+        """
+        if word_id in self.slugs and not keep:
+            return self.slugs[word_id]
+        owner = self.owners.get(name)
+        if owner is not None and owner != word_id:
+            stem, dot, suffix = name.rpartition(".")
+            unique = f"{stem}-{word_id}{dot}{suffix}" if dot else f"{name}-{word_id}"
+            self.collisions.append((name, owner, word_id))
+            name = unique
+        self.owners[name] = word_id
+        self.slugs[word_id] = name
+        return name
+
+    def status(self) -> str:
+        return f"uygulama adlari: {len(self.owners)} ad, {len(self.collisions)} cakisma"
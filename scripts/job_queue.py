@@ -0,0 +1,228 @@
+"""
+Synora - Süreçler arası paylaşılan iş kuyruğu (SQLite + kiralama)
+
+Birden fazla generate-images.py süreci aynı kelime listesini paylaşır:
+- Kuyruk words-for-images.json'dan doldurulur (sync), üretilmiş kelimeler "done"
+- Her süreç kuyruktan birkaç kelime kiralar (claim); kira LEASE_TTL saniye sürer
+- Süreç çalıştıkça kiralarını yeniler (heartbeat); çöken sürecin kirası dolar
+  ve kelime kendiliğinden kuyruğa geri döner
+- Kiralama tek bir IMMEDIATE transaction içinde yapılır, aynı kelimeyi iki
+  süreç alamaz
+
+SQLite dosyası yerel diskte (veya kilitlemeyi doğru destekleyen paylaşımlı
+bir diskte) olmalıdır.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+LEASE_TTL = 120     # Kira süresi (sn); heartbeat bunun üçte birinde bir yapılır
+
+# İş durumları
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"   # Deneme hakkı bitti, sadece --retry-failed ile tekrar kuyruğa girer
+
+
+def default_owner() -> str:
+    """Bu sürecin kuyruktaki adı: makine:pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaseQueue:
+    """Thread-safe, kiralamalı SQLite iş kuyruğu."""
+
+    def __init__(self, path, owner: str = None, lease_ttl: float = LEASE_TTL):
+        self.path = path
+        self.owner = owner or default_owner()
+        self.lease_ttl = lease_ttl
+        self.claimed = 0
+        self.lost = 0           # Kirası başka sürece geçtiği için kaydedilemeyen iş
+        self._lock = threading.Lock()
+        # isolation_level=None: transaction'ları BEGIN IMMEDIATE ile kendimiz açıyoruz
+        self._db = sqlite3.connect(str(path), timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                word TEXT NOT NULL,
+                category TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'queued',
+                owner TEXT,
+                lease_until REAL,
+                available_at REAL NOT NULL DEFAULT 0,
+                claims INTEGER NOT NULL DEFAULT 0,
+                priority INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL
+            )
+        """)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        if "priority" not in columns:     # Öncelik sütunu olmadan oluşturulmuş kuyruk
+            self._db.execute("ALTER TABLE jobs ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state, priority)")
+
+    def _transaction(self, fn):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(time.time())
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+            return result
+
+    def sync(self, words: list, done_ids, retry_at: dict = None, priorities: dict = None):
+        """Kelime listesini kuyruğa ekle ve manifestle eşitle.
+
+        Üretilmişler "done" olur; dosyası silinen/bozuk çıkan "done" kelimeler
+        tekrar kuyruğa girer. `retry_at` (id -> zaman veya None) yeniden deneme
+        kuyruğundaki kelimelerin ne zaman kiralanabileceğini belirler; None
+        deneme hakkı bitmiş demektir. `priorities` (id -> sıra, küçük önce)
+        kiralama sırasını belirler.
+        """
+        done_ids, retry_at = set(done_ids), retry_at or {}
+
+        def run(now):
+            self._db.executemany(
+                "INSERT OR IGNORE INTO jobs (id, word, category, updated_at) VALUES (?, ?, ?, ?)",
+                [(w['id'], w['word_en'], w.get('category', 'general'), now) for w in words],
+            )
+            if priorities:
+                self._db.executemany("UPDATE jobs SET priority = ? WHERE id = ?",
+                                     [(rank, word_id) for word_id, rank in priorities.items()])
+            for w in words:
+                word_id = w['id']
+                if word_id in done_ids:
+                    self._db.execute("UPDATE jobs SET state = ?, owner = NULL, updated_at = ? "
+                                     "WHERE id = ? AND state != ?", (DONE, now, word_id, DONE))
+                    continue
+                self._db.execute("UPDATE jobs SET state = ?, updated_at = ? "
+                                 "WHERE id = ? AND state = ?", (QUEUED, now, word_id, DONE))
+                if word_id in retry_at:
+                    if retry_at[word_id] is None:
+                        self._db.execute("UPDATE jobs SET state = ?, updated_at = ? "
+                                         "WHERE id = ? AND state = ?",
+                                         (FAILED, now, word_id, QUEUED))
+                    else:
+                        self._db.execute("UPDATE jobs SET available_at = MAX(available_at, ?) "
+                                         "WHERE id = ? AND state = ?",
+                                         (retry_at[word_id], word_id, QUEUED))
+        self._transaction(run)
+
+    def claim(self, limit: int, ids=None) -> list:
+        """En fazla `limit` kelimeyi kirala: [(id, kelime, kategori, öncelik), ...]
+
+        Kuyruktaki (zamanı gelmiş) veya kirası dolmuş kelimeler öncelik sırasıyla alınır.
+        `ids` verilirse sadece o kelimeler denenir.
+        """
+        def run(now):
+            query = ("SELECT id, word, category, priority FROM jobs "
+                     "WHERE ((state = ? AND available_at <= ?) OR (state = ? AND lease_until < ?))")
+            params = [QUEUED, now, LEASED, now]
+            if ids is not None:
+                query += f" AND id IN ({','.join('?' * len(ids))})"
+                params += list(ids)
+            rows = self._db.execute(query + " ORDER BY priority, rowid LIMIT ?",
+                                    params + [limit]).fetchall()
+            self._db.executemany(
+                "UPDATE jobs SET state = ?, owner = ?, lease_until = ?, claims = claims + 1, "
+                "updated_at = ? WHERE id = ?",
+                [(LEASED, self.owner, now + self.lease_ttl, now, row[0]) for row in rows],
+            )
+            return rows
+
+        if ids is not None and not ids:
+            return []
+        rows = self._transaction(run)
+        self.claimed += len(rows)
+        return rows
+
+    def heartbeat(self) -> int:
+        """Bu sürecin tüm kiralarını uzat; uzatılan kira sayısını döndür"""
+        def run(now):
+            return self._db.execute(
+                "UPDATE jobs SET lease_until = ? WHERE owner = ? AND state = ?",
+                (now + self.lease_ttl, self.owner, LEASED),
+            ).rowcount
+        return self._transaction(run)
+
+    def _finish(self, word_id: str, state: str, available_at: float = 0) -> bool:
+        def run(now):
+            return self._db.execute(
+                "UPDATE jobs SET state = ?, owner = NULL, lease_until = NULL, available_at = ?, "
+                "updated_at = ? WHERE id = ? AND owner = ? AND state = ?",
+                (state, available_at, now, word_id, self.owner, LEASED),
+            ).rowcount
+        if self._transaction(run):
+            return True
+        self.lost += 1
+        return False
+
+    def complete(self, word_id: str) -> bool:
+        """Kelime üretildi (kira başka sürece geçtiyse False)"""
+        return self._finish(word_id, DONE)
+
+    def release(self, word_id: str, available_at: float = 0) -> bool:
+        """Kelimeyi kuyruğa geri bırak; `available_at` zamanından önce kiralanmaz"""
+        return self._finish(word_id, QUEUED, available_at)
+
+    def fail(self, word_id: str) -> bool:
+        """Deneme hakkı bitti - otomatik kiralanmasın"""
+        return self._finish(word_id, FAILED)
+
+    def requeue_failed(self) -> int:
+        """Deneme hakkı bitenleri ve beklemedekileri hemen kiralanabilir yap (--retry-failed)"""
+        def run(now):
+            return self._db.execute(
+                "UPDATE jobs SET state = ?, available_at = 0, updated_at = ? "
+                "WHERE state = ? OR (state = ? AND available_at > ?)",
+                (QUEUED, now, FAILED, QUEUED, now),
+            ).rowcount
+        return self._transaction(run)
+
+    def release_all(self) -> int:
+        """Çıkışta bu sürecin elinde kalan kiraları bırak"""
+        def run(now):
+            return self._db.execute(
+                "UPDATE jobs SET state = ?, owner = NULL, lease_until = NULL, updated_at = ? "
+                "WHERE owner = ? AND state = ?",
+                (QUEUED, now, self.owner, LEASED),
+            ).rowcount
+        return self._transaction(run)
+
+    def others_lease_until(self) -> float:
+        """Başka süreçlerin elindeki kiraların en erken bitişi (yoksa None).
+
+        Kuyruk boşken bile bu kiralar dolarsa kelimeler geri döner.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MIN(lease_until) FROM jobs WHERE state = ? AND owner != ?",
+                (LEASED, self.owner),
+            ).fetchone()
+        return row[0]
+
+    def counts(self) -> dict:
+        with self._lock:
+            now = time.time()
+            rows = self._db.execute(
+                "SELECT CASE WHEN state = ? AND lease_until < ? THEN ? ELSE state END, COUNT(*) "
+                "FROM jobs GROUP BY 1", (LEASED, now, QUEUED),
+            ).fetchall()
+        return dict(rows)
+
+    def status(self) -> str:
+        counts = self.counts()
+        return (f"is kuyrugu: {counts.get(QUEUED, 0)} bekliyor, {counts.get(LEASED, 0)} kirada, "
+                f"{counts.get(DONE, 0)} bitti, {counts.get(FAILED, 0)} basarisiz "
+                f"({self.owner} {self.claimed} kiraladi)")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,249 @@
+"""
+Synora - Üretim manifesti (generated-images.json + append-only journal)
+
+Her başarılı görsel journal dosyasına tek satır JSON olarak eklenir (O(1)
+yazma); generated-images.json ise sadece sıkıştırma (compaction) sırasında
+geçici dosyaya yazılıp atomik olarak değiştirilir. Süreç yazma ortasında
+ölürse en fazla journal'ın yarım kalan son satırı kaybolur, JSON asla
+kesik kalmaz.
+
+Journal satırları:
+    {"op": "set", "id": "46", "entry": {...}}
+    {"op": "del", "id": "46"}
+    {"op": "pending", "id": "46", "job": {...}}   # fal.ai'ye gönderildi, sonuç bekleniyor
+    {"op": "clear", "id": "46"}                   # bekleyen iş bitti (başarılı/başarısız)
+    {"op": "fail", "id": "46", "failure": {...}}  # yeniden deneme kuyruğuna eklendi
+    {"op": "unfail", "id": "46"}                  # yeniden deneme kuyruğundan çıktı
+
+Bekleyen işler ve yeniden deneme kuyruğu generated-images.json'a yazılmaz;
+sıkıştırmadan sonra yeni journal'a tekrar yazılır, böylece yeniden
+başlatmada kaybolmazlar.
+
+Aynı manifeste birden fazla süreç yazabilir (job_queue.py ile): journal'a
+ekleme paylaşılan, sıkıştırma özel dosya kilidiyle yapılır. Sıkıştıran süreç
+önce diskteki JSON + journal'ı yeniden okur, böylece diğer süreçlerin
+kayıtları kaybolmaz; journal değiştirildiyse diğer süreçler yeni dosyayı açar.
+Kilit fcntl ile alınır; fcntl olmayan sistemlerde (Windows) tek süreç varsayılır.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:     # Windows - dosya kilidi yok, tek süreç
+    fcntl = None
+
+COMPACT_EVERY = 500     # Kaç journal kaydında bir JSON'a sıkıştırılsın
+
+
+class GenerationManifest:
+    """generated-images.json şeklinde girişler + crash-safe journal."""
+
+    def __init__(self, json_path, journal_path, compact_every: int = COMPACT_EVERY):
+        self.json_path = Path(json_path)
+        self.journal_path = Path(journal_path)
+        self.compact_every = compact_every
+        self.entries = {}
+        self.pending = {}
+        self.failures = {}
+        self.journal_records = 0
+        self.skipped_lines = 0
+        self._journal = None
+        self._lock_path = self.journal_path.with_name(self.journal_path.name + ".lock")
+        self._lock_file = None
+        with self._locked(exclusive=False):
+            self.load()
+
+    # ---------- okuma ----------
+
+    def load(self) -> dict:
+        """JSON'u oku, üzerine journal'ı uygula"""
+        self.entries = {}
+        if self.json_path.exists():
+            with open(self.json_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+        self.pending = {}
+        self.failures = {}
+        self.journal_records = 0
+        self.skipped_lines = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        # Yarım kalmış son satır (yazma sırasında çökme)
+                        self.skipped_lines += 1
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        self.skipped_lines += 1
+                        continue
+                    self.apply(record)
+                    self.journal_records += 1
+        return self.entries
+
+    def refresh(self) -> dict:
+        """Diğer süreçlerin kayıtları dahil diskteki son durumu yeniden oku.
+
+        Her süreç bellekte sadece açılıştaki durumu ve kendi yazdıklarını
+        tutar; dışa aktarmalar bunun yerine birleşik durumu kullanmalı. Özel
+        kilit alınır, yazan süreç olmadığı için yarım satır görülmez
+        (`skipped_lines` sadece gerçekten bozuk satırları sayar).
+        """
+        with self._locked(exclusive=True):
+            return self.load()
+
+    def apply(self, record: dict):
+        """Tek journal kaydını bellekteki duruma uygula"""
+        op = record.get("op")
+        if op == "set":
+            self.entries[record["id"]] = record["entry"]
+        elif op == "del":
+            self.entries.pop(record["id"], None)
+        elif op == "pending":
+            self.pending[record["id"]] = record["job"]
+        elif op == "clear":
+            self.pending.pop(record["id"], None)
+        elif op == "fail":
+            self.failures[record["id"]] = record["failure"]
+        elif op == "unfail":
+            self.failures.pop(record["id"], None)
+
+    # ---------- kilit ----------
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Journal'a ekleme (paylaşılan) veya sıkıştırma (özel) kilidi"""
+        if fcntl is None:
+            yield
+            return
+        if self._lock_file is None:
+            self._lock_file = open(self._lock_path, 'a')
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _journal_replaced(self) -> bool:
+        """Başka bir süreç journal'ı sıkıştırıp değiştirdi mi"""
+        try:
+            return os.stat(self.journal_path).st_ino != os.fstat(self._journal.fileno()).st_ino
+        except FileNotFoundError:
+            return True
+
+    # ---------- yazma ----------
+
+    def _append(self, record: dict):
+        with self._locked(exclusive=False):
+            self._write_record(record)
+
+        self.apply(record)
+        self.journal_records += 1
+        if self.compact_every and self.journal_records - self._carried() >= self.compact_every:
+            self.compact()
+
+    def _write_record(self, record: dict):
+        if self._journal is not None and self._journal_replaced():
+            self._journal.close()
+            self._journal = None
+        if self._journal is None:
+            needs_newline = False
+            if self.journal_path.exists() and self.journal_path.stat().st_size > 0:
+                with open(self.journal_path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    needs_newline = f.read(1) != b"\n"
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+            if needs_newline:
+                self._journal.write("\n")
+
+        # Tek write çağrısı: O_APPEND ile satırlar birbirine karışmaz
+        self._journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def set(self, word_id: str, entry: dict):
+        """Üretilen görseli kaydet"""
+        self._append({"op": "set", "id": word_id, "entry": entry})
+
+    def delete(self, word_id: str):
+        """Kaydı sil (yeniden üretilecek)"""
+        if word_id in self.entries:
+            self._append({"op": "del", "id": word_id})
+
+    def add_pending(self, word_id: str, job: dict):
+        """fal.ai'ye gönderilen işi kaydet (request_id, response_url, ...)"""
+        self._append({"op": "pending", "id": word_id, "job": job})
+
+    def clear_pending(self, word_id: str):
+        """Bekleyen iş bitti"""
+        if word_id in self.pending:
+            self._append({"op": "clear", "id": word_id})
+
+    def record_failure(self, word_id: str, failure: dict):
+        """Başarısız kelimeyi yeniden deneme kuyruğuna yaz (varsa günceller)"""
+        self._append({"op": "fail", "id": word_id, "failure": failure})
+
+    def clear_failure(self, word_id: str):
+        """Kelime artık yeniden deneme kuyruğunda değil"""
+        if word_id in self.failures:
+            self._append({"op": "unfail", "id": word_id})
+
+    def _carried(self) -> int:
+        """Sıkıştırmada journal'a tekrar yazılan kayıt sayısı"""
+        return len(self.pending) + len(self.failures)
+
+    def compact(self):
+        """Tüm durumu generated-images.json'a atomik yaz, journal'da sadece bekleyen işleri
+        ve yeniden deneme kuyruğunu bırak"""
+        with self._locked(exclusive=True):
+            # Diğer süreçlerin journal'a eklediklerini de al
+            self.load()
+            self._compact()
+
+    def _compact(self):
+        tmp_path = self.json_path.with_name(self.json_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.json_path)
+
+        # JSON artık journal'daki her şeyi içeriyor; journal'ı sadece bekleyen
+        # işler ve yeniden deneme kuyruğuyla yeniden yaz. Bu arada çökülürse
+        # eski journal tekrar uygulanır, sonuç aynıdır.
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        tmp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for word_id, job in self.pending.items():
+                f.write(json.dumps({"op": "pending", "id": word_id, "job": job},
+                                   ensure_ascii=False) + "\n")
+            for word_id, failure in self.failures.items():
+                f.write(json.dumps({"op": "fail", "id": word_id, "failure": failure},
+                                   ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+        self.journal_records = self._carried()
+        self.skipped_lines = 0
+
+    def close(self):
+        """Journal'ı JSON'a sıkıştırıp kapat"""
+        with self._locked(exclusive=True):
+            self.load()
+            if self.journal_records > self._carried() or self.skipped_lines:
+                self._compact()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if self.journal_path.exists() and self.journal_path.stat().st_size == 0:
+                self.journal_path.unlink()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
@@ -0,0 +1,167 @@
+"""
+Synora - Birbirine çok benzeyen görselleri bulma (algısal hash + çoklu indeks)
+
+Benzer kelimeler (ayna, kilit, lamba, çanta grupları) neredeyse aynı
+görsellerle çıkabiliyor; distinctive_descriptions.py bu yüzden var. Bunları
+gözle aramak yerine:
+- Her görsel için 64 bitlik pHash (32x32 gri görselin DCT'sinin düşük
+  frekansları) ve dHash (9x8 gri görselde komşu piksel farkları) hesaplanır (NumPy)
+- pHash'ler kategori başına bir çoklu indekse (multi-index hashing) eklenir;
+  Hamming eşiği içindeki adaylar tüm çiftler karşılaştırılmadan (O(n²)
+  olmadan) bulunur
+- Adaylar dHash ile de doğrulanır; ikisi de eşik içindeyse çift raporlanır
+
+compute_hashes birden fazla dosyayı tek çağrıda işler ve süreç havuzunda
+çalışmak üzere modül seviyesindedir (alt süreçte sadece bu modül import edilir).
+"""
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:     # NumPy veya Pillow yoksa hash hesaplanamaz
+    np = Image = None
+
+# ============== AYARLAR ==============
+
+PHASH_SIZE = 32         # DCT'si alınan gri görselin kenarı (px)
+PHASH_LOW_FREQ = 8      # Kullanılan düşük frekans bloğu (8x8 = 64 bit)
+PHASH_THRESHOLD = 10    # Bu kadar bit farkına kadar pHash benzer sayılır (64 bitten)
+DHASH_THRESHOLD = 12    # Aday çiftin dHash'i de en fazla bu kadar farklı olmalı
+HASH_BITS = 64
+MIH_CHUNKS = 4          # Çoklu indeks parça sayısı (16 bitlik parçalar)
+
+
+def hashes_available() -> bool:
+    return np is not None
+
+
+def _dct_matrix(n: int):
+    """n noktalı DCT-II matrisi (ölçeksiz; medyan karşılaştırmasında sabit çarpan önemsiz)"""
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    return np.cos(np.pi * (2 * x + 1) * k / (2 * n))
+
+
+def _to_int(bits) -> int:
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
+
+
+def phash(gray) -> int:
+    """(PHASH_SIZE, PHASH_SIZE) gri dizinin pHash'i: düşük frekanslar medyandan büyük mü"""
+    dct = _dct_matrix(gray.shape[0])
+    coefficients = dct @ gray.astype(np.float64) @ dct.T
+    low = coefficients[:PHASH_LOW_FREQ, :PHASH_LOW_FREQ]
+    return _to_int(low > np.median(low))
+
+
+def dhash(gray) -> int:
+    """(8, 9) gri dizinin dHash'i: her piksel sağ komşusundan parlak mı"""
+    gray = gray.astype(np.int16)
+    return _to_int(gray[:, 1:] > gray[:, :-1])
+
+
+def compute_hash(path) -> dict:
+    """Tek görselin {"phash", "dhash"} değerleri (16 karakter hex)"""
+    with Image.open(path) as image:
+        gray = image.convert("L")
+    large = np.asarray(gray.resize((PHASH_SIZE, PHASH_SIZE), Image.LANCZOS))
+    small = np.asarray(gray.resize((PHASH_LOW_FREQ + 1, PHASH_LOW_FREQ), Image.LANCZOS))
+    return {"phash": f"{phash(large):016x}", "dhash": f"{dhash(small):016x}"}
+
+
+def compute_hashes(paths: list) -> list:
+    """Bir grup görsel için hash'ler (okunamayanlar için None)"""
+    results = []
+    for path in paths:
+        try:
+            results.append(compute_hash(path))
+        except Exception:
+            results.append(None)
+    return results
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class MultiIndexHash:
+    """64 bitlik hash'ler için çoklu indeks (multi-index hashing).
+
+    Hash MIH_CHUNKS parçaya bölünür, her parça kendi tablosunda tutulur.
+    İki hash en fazla r bit farklıysa güvercin yuvası ilkesine göre en az bir
+    parçaları en fazla r // MIH_CHUNKS bit farklıdır; arama sadece bu kadar
+    bit çevrilmiş parça değerlerinin kovalarına bakar, sonra adayların tam
+    uzaklığı hesaplanır. Rastgele dağılımda kovalar n / 2^16 büyüklüğündedir.
+    """
+
+    def __init__(self, chunks: int = MIH_CHUNKS, bits: int = HASH_BITS):
+        self.chunks = chunks
+        self.chunk_bits = bits // chunks
+        self.mask = (1 << self.chunk_bits) - 1
+        self.tables = [{} for _ in range(chunks)]
+        self.values = []    # Eklenen hash'ler (indeks sırasıyla)
+        self.items = []
+        self.visited = 0    # Aramalarda tam uzaklığı hesaplanan aday sayısı
+        self._flips = {}    # Parça yarıçapı -> çevrilecek bit maskeleri
+
+    def _parts(self, value: int) -> list:
+        return [(value >> (i * self.chunk_bits)) & self.mask for i in range(self.chunks)]
+
+    def _flip_masks(self, radius: int) -> list:
+        masks = self._flips.get(radius)
+        if masks is None:
+            masks = {0}
+            for _ in range(radius):
+                masks |= {mask | (1 << bit) for mask in masks for bit in range(self.chunk_bits)}
+            masks = self._flips[radius] = sorted(masks)
+        return masks
+
+    def add(self, value: int, item):
+        index = len(self.values)
+        self.values.append(value)
+        self.items.append(item)
+        for table, part in zip(self.tables, self._parts(value)):
+            table.setdefault(part, []).append(index)
+
+    def search(self, value: int, radius: int) -> list:
+        """`value`'ya en fazla `radius` bit uzaklıktaki öğeler: [(uzaklık, öğe), ...]"""
+        masks = self._flip_masks(radius // self.chunks)
+        candidates = set()
+        for table, part in zip(self.tables, self._parts(value)):
+            get = table.get
+            for mask in masks:
+                bucket = get(part ^ mask)
+                if bucket:
+                    candidates.update(bucket)
+        results = []
+        for index in sorted(candidates):
+            self.visited += 1
+            distance = hamming(value, self.values[index])
+            if distance <= radius:
+                results.append((distance, self.items[index]))
+        return results
+
+
+def find_near_duplicates(records: list, phash_threshold: int = PHASH_THRESHOLD,
+                         dhash_threshold: int = DHASH_THRESHOLD, by_category: bool = True) -> tuple:
+    """Birbirine çok benzeyen görsel çiftleri.
+
+    `records`: [{"id", "category", "phash", "dhash", "sha256"}] (hash'ler hex),
+    öncelik sırasında. Her kayıt kendinden önce eklenenlerle karşılaştırılır;
+    çiftler (önceki, sonraki, phash uzaklığı, dhash uzaklığı) olarak döner.
+    Aynı dosyayı paylaşanlar (aynı prompt'tan tekrar kullanılan görsel)
+    bilerek aynıdır, raporlanmaz. Dönen değer: (çiftler, hesaplanan uzaklık sayısı).
+    """
+    indexes = {}    # Kategori (veya hepsi için None) -> indeks
+    pairs = []
+    for record in records:
+        index = indexes.setdefault(record["category"] if by_category else None, MultiIndexHash())
+        phash_value, dhash_value = int(record["phash"], 16), int(record["dhash"], 16)
+        for distance, other in index.search(phash_value, phash_threshold):
+            if other["sha256"] and other["sha256"] == record["sha256"]:
+                continue
+            dhash_distance = hamming(dhash_value, int(other["dhash"], 16))
+            if dhash_distance <= dhash_threshold:
+                pairs.append((other, record, distance, dhash_distance))
+        index.add(phash_value, record)
+    return pairs, sum(index.visited for index in indexes.values())
@@ -0,0 +1,133 @@
+"""
+Synora - Görsel yer tutucu bilgisi: BlurHash, baskın renk, boyutlar (NumPy)
+
+Uygulama görsel inene kadar bir şey gösterebilsin diye her görsel için:
+- BlurHash (woltapp/blurhash algoritması, tüm pikseller tek matris çarpımıyla)
+- Baskın renk (renkler 16 seviyeye indirilip en kalabalık grubun ortalaması)
+- Piksel boyutları (genişlik, yükseklik)
+
+compute_placeholders birden fazla dosyayı tek çağrıda işler; binlerce
+görselde süreç havuzuna gruplar halinde verilir (alt süreçte sadece bu
+modül import edilir). Sonuçlar uygulamanın paketlediği JSON'a yazılır.
+"""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:     # NumPy veya Pillow yoksa yer tutucu üretilmez
+    np = Image = None
+
+BLURHASH_COMPONENTS = (4, 3)    # Yatay x dikey bileşen (1-9)
+BLURHASH_SAMPLE_SIZE = 64       # BlurHash ve renk küçültülmüş görselden hesaplanır (px)
+COLOR_LEVELS = 16               # Baskın renk için kanal başına seviye
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def placeholders_available() -> bool:
+    return np is not None
+
+
+def _base83(value: int, length: int) -> str:
+    return "".join(BASE83[(value // 83 ** (length - i - 1)) % 83] for i in range(length))
+
+
+def _srgb_to_linear(pixels):
+    v = pixels / 255.0
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+def _linear_to_srgb(value: float) -> int:
+    v = min(1.0, max(0.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash(pixels, components=BLURHASH_COMPONENTS) -> str:
+    """(yükseklik, genişlik, 3) uint8 RGB dizisinin BlurHash'i"""
+    cx, cy = components
+    height, width = pixels.shape[:2]
+    linear = _srgb_to_linear(pixels.astype(np.float64))
+
+    # Bileşen (j, i) = Σ cos(πjy/h) cos(πix/w) · piksel - tek einsum ile
+    basis_x = np.cos(np.pi * np.arange(cx)[:, None] * np.arange(width)[None, :] / width)
+    basis_y = np.cos(np.pi * np.arange(cy)[:, None] * np.arange(height)[None, :] / height)
+    factors = np.einsum("jy,ix,yxc->jic", basis_y, basis_x, linear) / (width * height)
+    factors[1:, :] *= 2
+    factors[0, 1:] *= 2
+    factors = factors.reshape(cx * cy, 3)     # Sıra: satır (j) dışta, sütun (i) içte
+    dc, ac = factors[0], factors[1:]
+
+    result = _base83((cx - 1) + (cy - 1) * 9, 1)
+    if len(ac):
+        quantised_max = int(max(0, min(82, np.floor(np.abs(ac).max() * 166 - 0.5))))
+        maximum = (quantised_max + 1) / 166
+        result += _base83(quantised_max, 1)
+    else:
+        maximum = 1.0
+        result += _base83(0, 1)
+
+    result += _base83((_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8)
+                      + _linear_to_srgb(dc[2]), 4)
+
+    scaled = ac / maximum
+    quantised = np.clip(np.floor(np.sign(scaled) * np.abs(scaled) ** 0.5 * 9 + 9.5), 0, 18)
+    quantised = quantised.astype(int)
+    for r, g, b in quantised:
+        result += _base83(r * 19 * 19 + g * 19 + b, 2)
+    return result
+
+
+def dominant_color(pixels) -> str:
+    """En kalabalık renk grubunun ortalaması: "#rrggbb" """
+    flat = pixels.reshape(-1, 3).astype(np.int64)
+    step = 256 // COLOR_LEVELS
+    bins = flat // step
+    keys = (bins[:, 0] * COLOR_LEVELS + bins[:, 1]) * COLOR_LEVELS + bins[:, 2]
+    top = np.bincount(keys, minlength=COLOR_LEVELS ** 3).argmax()
+    r, g, b = flat[keys == top].mean(axis=0).round().astype(int)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def compute_placeholder(path) -> dict:
+    """Tek görselin {"blurhash", "color", "width", "height"} bilgisi"""
+    with Image.open(path) as image:
+        width, height = image.size
+        sample = image.convert("RGB")
+    sample.thumbnail((BLURHASH_SAMPLE_SIZE, BLURHASH_SAMPLE_SIZE), Image.BILINEAR)
+    pixels = np.asarray(sample)
+    return {
+        "blurhash": blurhash(pixels),
+        "color": dominant_color(pixels),
+        "width": width,
+        "height": height,
+    }
+
+
+def compute_placeholders(paths: list) -> list:
+    """Bir grup görsel için yer tutucu bilgisi (okunamayanlar için None)"""
+    results = []
+    for path in paths:
+        try:
+            results.append(compute_placeholder(path))
+        except Exception:
+            results.append(None)
+    return results
+
+
+def write_placeholder_export(path, entries: dict) -> int:
+    """Manifest girişlerinden uygulamanın paketlediği JSON'u yaz: {kelime id: bilgi}"""
+    export = {word_id: entry["placeholder"] for word_id, entry in sorted(entries.items())
+              if entry.get("placeholder")}
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(export, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+    os.replace(tmp_path, path)
+    return len(export)
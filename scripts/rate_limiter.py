@@ -0,0 +1,108 @@
+"""
+Synora - Sağlayıcı bazlı hız sınırlayıcı (token bucket + uyarlanabilir backoff)
+
+Gemini, fal.ai ve Bunny.net çağrıları aynı sınırlayıcıyı paylaşır:
+- Token bucket: saniyede `rate` istek, en fazla `burst` ani istek
+- 429 gelince hız yarıya iner, Retry-After süresi boyunca kimse istek atmaz
+- Başarılı isteklerde hız yavaşça artar; 429'un geldiği hız "tavan" olarak
+  öğrenilir ve bir süre bu tavanın altında kalınır
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# ============== AYARLAR ==============
+
+BACKOFF_BASE = 1.0          # İlk yeniden deneme beklemesi (sn)
+BACKOFF_MAX = 60.0          # En uzun bekleme (sn)
+DECREASE_FACTOR = 0.5       # 429'da hız çarpanı
+INCREASE_RATIO = 0.05       # Her başarılı istekte başlangıç hızının bu oranı kadar artış
+CEILING_MARGIN = 0.9        # Öğrenilen tavanın bu oranına kadar çıkılır
+CEILING_TTL = 300           # Öğrenilen tavan bu kadar saniye sonra unutulur (tekrar denenir)
+
+
+def parse_retry_after(value) -> float:
+    """Retry-After başlığını saniyeye çevir (sayı veya HTTP tarihi)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Thread-safe token bucket; 429'lardan sürdürülebilir hızı öğrenir."""
+
+    def __init__(self, name: str, rate: float, burst: int = 1,
+                 min_rate: float = None, max_rate: float = None):
+        self.name = name
+        self.initial_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min_rate if min_rate is not None else rate / 20
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.ceiling = None
+        self.ceiling_time = 0.0
+        self.rate_limited_count = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Bir istek hakkı al; gerekirse bekle"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Token'ı şimdiden ayır (eksiye düşebilir), bekleme süresini dışarıda uyu
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            wait = max(wait, self.blocked_until - now)
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self):
+        """Başarılı istek - hızı yavaşça artır"""
+        with self._lock:
+            limit = self.max_rate
+            if self.ceiling is not None:
+                if time.monotonic() - self.ceiling_time > CEILING_TTL:
+                    self.ceiling = None
+                else:
+                    limit = min(limit, self.ceiling * CEILING_MARGIN)
+            if self.rate < limit:
+                self.rate = min(limit, self.rate + self.initial_rate * INCREASE_RATIO)
+
+    def on_rate_limited(self, retry_after: float = None):
+        """429 geldi - hızı düşür, tavanı öğren, Retry-After boyunca dur"""
+        with self._lock:
+            now = time.monotonic()
+            old_rate = self.rate
+            self.ceiling = old_rate
+            self.ceiling_time = now
+            self.rate = max(self.min_rate, old_rate * DECREASE_FACTOR)
+            self.tokens = min(self.tokens, 0.0)
+            self.rate_limited_count += 1
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+        print(f"  [{self.name}] 429: hiz {old_rate:.2f} -> {self.rate:.2f} istek/sn"
+              + (f", Retry-After {retry_after:.0f}sn" if retry_after else ""))
+
+    def backoff(self, attempt: int) -> float:
+        """Jitter'lı üstel bekleme süresi (Retry-After olmayan 429'lar için)"""
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+
+    def status(self) -> str:
+        return f"{self.name} {self.rate:.2f}/sn (429: {self.rate_limited_count})"
@@ -0,0 +1,95 @@
+"""
+Synora - İçerik adresli görsel önbelleği (prompt + model → görsel)
+
+Bazı kelimeler aynı son prompt'a çıkar (aynı kelimenin farklı id'leri,
+aynı şablonu kullanan kategoriler). Her biri için fal.ai'de ayrı görsel
+üretmek yerine:
+- Anahtar, tam oluşturulmuş prompt ve fal.ai model/boyut parametrelerinin
+  SHA-256 özetidir; manifest girişlerinde "render_key" olarak saklanır
+- Anahtarı daha önce üretilmiş bir görsel varsa dosyası tekrar kullanılır
+- Aynı anahtar şu anda fal.ai'de üretiliyorsa (single-flight) ikinci iş
+  gönderilmez, ilkinin sonucunu bekler; ilki başarısız olursa bekleyenler
+  de başarısız sayılır ve yeniden deneme kuyruğuna girer, tekrar
+  denendiklerinde yine tek öncü seçilir
+- Öncünün fal.ai işi zaman aşımına rağmen sürüyorsa (sonucu sonraki
+  çalıştırmada pending'den toplanır) anahtar "beklemede" kalır; aynı
+  anahtarlı işler gönderilmez, o iş toplanana kadar ertelenir
+
+Sadece event loop içinden kullanılır (thread-safe değildir).
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+
+
+def render_key(prompt: str, **params) -> str:
+    """Prompt ve model parametrelerinin SHA-256 özeti"""
+    payload = json.dumps({"prompt": prompt, **params}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """render_key -> manifest girişi (path/size/sha256) ve üretimdeki anahtarlar."""
+
+    def __init__(self, entries: dict = None, pending_keys=()):
+        self.index = {}
+        for entry in (entries or {}).values():
+            # Yeniden üretilmek üzere işaretlenen görsel (çok benzer çıkmış) tekrar kullanılmaz
+            if entry.get("render_key") and "size" in entry and not entry.get("regenerate"):
+                self.index[entry["render_key"]] = entry
+        self.inflight = {}      # render_key -> öncü işin sonucunu bekleyen future
+        self.pending = set(pending_keys)    # fal.ai'de süren, sonucu sonra toplanacak anahtarlar
+        self.hits = 0           # Diskteki görselden kullanılan
+        self.coalesced = 0      # Üretimdeki aynı istekle birleştirilen
+
+    def lookup(self, key: str) -> dict:
+        """Anahtarın diskte hâlâ geçerli olan görseli (yoksa None)"""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        try:
+            ok = os.stat(entry["path"]).st_size == entry["size"]
+        except OSError:
+            ok = False
+        if not ok:
+            del self.index[key]
+            return None
+        self.hits += 1
+        return entry
+
+    def is_pending(self, key: str) -> bool:
+        """Anahtarın fal.ai işi sürüyor ama bu çalıştırmada sonucu beklenmiyor mu"""
+        return key in self.pending
+
+    def follow(self, key: str) -> asyncio.Future:
+        """Anahtar şu anda üretiliyorsa sonucunu veren future (yoksa None)"""
+        future = self.inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        return future
+
+    def lead(self, key: str):
+        """Bu anahtarı üretme sırası bizde; aynı anahtarlı işler sonucu bekler"""
+        self.inflight[key] = asyncio.get_running_loop().create_future()
+
+    def resolve(self, key: str, entry: dict = None, pending: bool = False):
+        """Öncü iş bitti: `entry` başarılı görselin girişi, başarısızsa None.
+
+        `pending`: fal.ai işi sürüyor, sonucu sonraki çalıştırmada toplanacak.
+        """
+        if entry is not None:
+            self.index[key] = entry
+        if pending and entry is None:
+            self.pending.add(key)
+        else:
+            self.pending.discard(key)
+        future = self.inflight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(entry)
+
+    def status(self) -> str:
+        return (f"gorsel onbellegi: {self.hits} tekrar kullanim, "
+                f"{self.coalesced} birlestirilen istek"
+                + (f", {len(self.pending)} anahtar sonraki calistirmaya kaldi" if self.pending else ""))
@@ -0,0 +1,91 @@
+"""
+Synora - Görsel boyutları (rendition): küçük resim, kart ve tam boy; WebP/AVIF
+
+fal.ai'nin ham .jpg dosyası uygulamada gösterilen boyutlardan çok büyük.
+Her görsel için:
+- RENDITION_SIZES'taki her boyut (en uzun kenar, büyütme yapılmaz)
+- RENDITION_FORMATS'taki her format (Pillow'un desteklemediği atlanır)
+- Metadata (EXIF, ICC, XMP) silinir, sadece piksel verisi yazılır
+- Dosyalar kaynağın yanına (içerik adresli depoda aynı shard klasörüne)
+  önce geçici adla yazılır, bitince atomik olarak taşınır
+
+Her boyutun SHA-256'sı da kaydedilir (CDN'e yüklemede uzak checksum ile
+karşılaştırılır). render_renditions CPU işidir ve ProcessPoolExecutor'da çalışmak üzere
+modül seviyesindedir (alt süreçte sadece bu modül import edilir). Kaynak
+SHA-256'sı önceki sonuçla aynıysa ve dosyalar yerindeyse tekrar üretilmez.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:     # Pillow yoksa boyutlar üretilmez (pip install Pillow)
+    Image = features = None
+
+# Uygulamanın gösterdiği boyutlar (src/config/bunny.ts BUNNY_CONFIG.sizes ile aynı)
+RENDITION_SIZES = {
+    "thumb": 150,
+    "card": 300,
+    "full": 600,
+}
+RENDITION_FORMATS = ["webp", "avif"]
+RENDITION_QUALITY = {"webp": 80, "avif": 60}
+
+
+def available_formats(formats=RENDITION_FORMATS) -> list:
+    """Kurulu Pillow'un yazabildiği formatlar (AVIF için Pillow >= 11.3)"""
+    if Image is None:
+        return []
+    return [fmt for fmt in formats if features.check(fmt)]
+
+
+def rendition_path(out_dir, name: str, stem: str, fmt: str) -> Path:
+    """Kaynağın yanında: <klasör>/<kaynak adı>.<boyut>.<format>"""
+    return Path(out_dir) / f"{stem}.{name}.{fmt}"
+
+
+def renditions_current(renditions: dict, renditions_sha256: str, source_sha256: str) -> bool:
+    """Kayıtlı boyutlar bu kaynaktan mı üretilmiş ve dosyaları yerinde mi"""
+    if not renditions or renditions_sha256 != source_sha256:
+        return False
+    for record in renditions.values():
+        try:
+            if os.stat(record["path"]).st_size != record["size"]:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def render_renditions(source_path: str, stem: str, out_dir, formats: list,
+                      sizes: dict = RENDITION_SIZES) -> dict:
+    """Kaynaktan tüm boyutları üret: {"card.webp": {"path", "size", "sha256", "width", "height"}, ...}"""
+    with Image.open(source_path) as source:
+        source.load()
+        image = source.convert("RGB")
+    image.info = {}     # Metadata taşınmasın
+
+    results = {}
+    for name, max_edge in sizes.items():
+        resized = image.copy()
+        resized.thumbnail((max_edge, max_edge), Image.LANCZOS)
+        for fmt in formats:
+            path = rendition_path(out_dir, name, stem, fmt)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.part")
+            try:
+                resized.save(tmp_path, format=fmt.upper(), quality=RENDITION_QUALITY.get(fmt, 80))
+                data = tmp_path.read_bytes()
+                os.replace(tmp_path, path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            results[f"{name}.{fmt}"] = {
+                "path": str(path),
+                "size": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "width": resized.width,
+                "height": resized.height,
+            }
+    return results
@@ -0,0 +1,155 @@
+"""
+Synora - Üretim sırası (öncelik) ve kategori bazlı eşzamanlılık sınırı
+
+Kelimeler dosya sırası yerine ayarlanabilir önceliğe göre üretilir; hız
+sınırına veya bütçeye takılınca önce öğrencilerin ilk gördüğü kelimeler
+biter. Öncelik ölçütleri sırayla uygulanır:
+- ids: açıkça verilen id listesi (listedeki sırayla, en önce)
+- usage: kullanım sayısı dosyası (çok kullanılan önce)
+- level: seviye sırası (beginner → advanced)
+- category: kategori sırası (listede olmayanlar sona)
+Eşit öncelikte dosya sırası korunur.
+
+ScheduledQueue, fal.ai'ye gönderim kuyruğunda hem bu sırayı hem de kategori
+başına eşzamanlılık sınırını uygular (örn. karakterli kategoriler daha uzun
+sürdüğü için fal.ai'de aynı anda en fazla N tane).
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+LEVEL_ORDER = ["beginner", "elementary", "intermediate", "advanced"]
+PRIORITY_KEYS = ["ids", "usage", "level", "category"]
+
+
+def load_id_list(value: str) -> list:
+    """Virgülle ayrılmış id'ler veya dosya (JSON liste ya da satır başına bir id)"""
+    path = Path(value)
+    if not path.is_file():
+        return [item.strip() for item in value.split(",") if item.strip()]
+    text = path.read_text(encoding='utf-8')
+    if text.lstrip().startswith("["):
+        return [str(item) for item in json.loads(text)]
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def load_usage(path) -> dict:
+    """Kullanım sayıları: JSON {id veya kelime: sayı}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {str(key).lower(): count for key, count in data.items()}
+
+
+class PriorityScheduler:
+    """Kelime sözlüklerini (words-for-images.json kaydı) öncelik sırasına dizer."""
+
+    def __init__(self, order=("level",), level_order=LEVEL_ORDER, category_order=(),
+                 ids=(), usage: dict = None):
+        unknown = [name for name in order if name not in PRIORITY_KEYS]
+        if unknown:
+            raise ValueError(f"bilinmeyen oncelik olcutu: {', '.join(unknown)} "
+                             f"(gecerli: {', '.join(PRIORITY_KEYS)})")
+        self.order = list(order)
+        self.level_rank = {level: i for i, level in enumerate(level_order)}
+        self.category_rank = {category: i for i, category in enumerate(category_order)}
+        self.id_rank = {str(word_id): i for i, word_id in enumerate(ids)}
+        self.usage = usage or {}
+
+    def usage_count(self, word: dict) -> float:
+        return self.usage.get(str(word['id']).lower(),
+                              self.usage.get(word.get('word_en', '').lower(), 0))
+
+    def key(self, word: dict) -> tuple:
+        parts = []
+        for name in self.order:
+            if name == "ids":
+                parts.append(self.id_rank.get(str(word['id']), len(self.id_rank)))
+            elif name == "usage":
+                parts.append(-self.usage_count(word))
+            elif name == "level":
+                parts.append(self.level_rank.get(word.get('level'), len(self.level_rank)))
+            elif name == "category":
+                parts.append(self.category_rank.get(word.get('category'), len(self.category_rank)))
+        return tuple(parts)
+
+    def ranks(self, words: list) -> dict:
+        """id -> sıra numarası (0 en önce); sıralama kararlıdır, eşitlerde dosya sırası"""
+        return {word['id']: i for i, word in enumerate(sorted(words, key=self.key))}
+
+    def describe(self) -> str:
+        return " > ".join(self.order) if self.order else "dosya sirasi"
+
+
+class ScheduledQueue:
+    """asyncio.Queue yerine: önceliği en yüksek, kategori sınırı dolmamış işi verir.
+
+    İşlerin `priority` (küçük önce) ve `category` alanları kullanılır. Kuyruk
+    sonu işareti (`stop`) sadece kuyrukta iş kalmadığında verilir, böylece
+    sınır yüzünden bekleyen işler sahipsiz kalmaz. Sınırlı bir kategoriden
+    alınan iş fal.ai'den çıkınca `release(job)` çağrılmalıdır; bu kuyruktan
+    geçmemiş işler için release bir şey yapmaz.
+    """
+
+    def __init__(self, maxsize: int, limits: dict = None, stop=None):
+        self.maxsize = maxsize
+        self.limits = dict(limits or {})
+        self.active = {category: 0 for category in self.limits}
+        self.stop = stop
+        self._items = []        # (öncelik, sıra, iş) - küçük kuyruk, doğrusal tarama yeterli
+        self._stops = 0
+        self._seq = 0
+        self._condition = asyncio.Condition()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def _eligible(self, job: dict) -> bool:
+        category = job.get("category")
+        return category not in self.limits or self.active[category] < self.limits[category]
+
+    def _pick(self):
+        for i, (_, _, job) in enumerate(self._items):
+            if self._eligible(job):
+                return self._items.pop(i)[2]
+        return None
+
+    async def put(self, job):
+        async with self._condition:
+            if job is self.stop:
+                self._stops += 1
+            else:
+                await self._condition.wait_for(lambda: len(self._items) < self.maxsize)
+                priority = job.get("priority")
+                self._items.append((priority if priority is not None else float("inf"),
+                                    self._seq, job))
+                self._items.sort(key=lambda item: item[:2])
+                self._seq += 1
+            self._condition.notify_all()
+
+    async def get(self):
+        async with self._condition:
+            while True:
+                job = self._pick()
+                if job is not None:
+                    if job.get("category") in self.limits:
+                        self.active[job["category"]] += 1
+                        job["category_slot"] = True
+                    self._condition.notify_all()
+                    return job
+                if not self._items and self._stops:
+                    self._stops -= 1
+                    return self.stop
+                await self._condition.wait()
+
+    async def release(self, job: dict):
+        """Sınırlı kategoriden alınan iş fal.ai'den çıktı"""
+        if not job.pop("category_slot", False):
+            return
+        async with self._condition:
+            self.active[job["category"]] -= 1
+            self._condition.notify_all()
+
+    def status(self) -> str:
+        return ", ".join(f"{category} {self.active[category]}/{limit}"
+                         for category, limit in self.limits.items())